@@ -1,29 +1,62 @@
 import logging
 
-from flask import Flask
 
-from app.api.namespaces.about import ns as ns_about
-from app.api.namespaces.evaluation import ns as ns_evaluation
-
-# Import instances
-from app.instances import api, logger, cors
+def create_app():
+    # Imported here so that processes importing app submodules, such as the spawned
+    # PDF extraction workers, do not load the web framework and the models
+    from flask import Flask
 
-from app.models.embedding_models.glove_embedding_model import GloveEmbeddingModel
+    from app.api.namespaces.about import ns as ns_about
+    from app.api.namespaces.evaluation import ns as ns_evaluation
+    from app.controllers.evaluation_job_controller import EvaluationJobController
 
-# from app.models.embedding_models.sbert_embedding_model import SBERTEmbeddingModel
-from app.models.nli_models.distilbart_nli_model import DistilBartNLIModel
+    # Import instances
+    from app.instances import api, logger, cors
 
+    from app.models.classification_models.feature_selectors.chi_squared import (
+        Chi2Selector,
+    )
+    from app.models.classification_models.gender_classification import (
+        GenderClassificationModel,
+    )
+    from app.models.classification_models.text_vectorizers.count_vectorizer import (
+        CountVectorizer,
+    )
+    from app.factories.embedding_model_factory import EmbeddingModelFactory
+    from app.factories.nli_model_factory import NLIModelFactory
+    from app.models.embedding_models.glove_embedding_model import GloveEmbeddingModel
+    from app.services.evaluation_service.question_embedding_index import (
+        QuestionEmbeddingIndex,
+    )
+    from app.utils.cpu_governor import CpuGovernor
+    from app.utils.process_memory import ProcessMemory
+    from app.utils.spacy_pipeline_registry import SpacyPipelineRegistry
 
-def create_app():
     app = Flask(__name__)
     logger.init_app(app)
 
+    # Size the torch and BLAS thread pools before any model runs
+    CpuGovernor.apply()
+
     # Load Models
-    GloveEmbeddingModel().load()
-    # SBERTEmbeddingModel().load()
-    DistilBartNLIModel().load()
+    embedding_model = EmbeddingModelFactory.create_configured_model()
+    NLIModelFactory.create_configured_model()
+    GenderClassificationModel(vectorizer=CountVectorizer(), selector=Chi2Selector())
+    SpacyPipelineRegistry().load("tokenizer", "ner_senter")
     logging.info("Models loaded.")
 
+    # Precompute criterion question embeddings
+    QuestionEmbeddingIndex(embedding_model).build()
+
+    # Memory-mapped model files count as shared memory across worker processes
+    mapped_files = {}
+    if isinstance(embedding_model, GloveEmbeddingModel):
+        mapped_files["GloVe vectors"] = embedding_model.model_vectors_file
+    ProcessMemory.log_report(mapped_files)
+
+    # Evaluation job workers, supervised by one API worker process per host
+    EvaluationJobController.start_worker_pool()
+
     # Namespaces
     api.add_namespace(ns_about, path="/api/v1")
     api.add_namespace(ns_evaluation, path="/api/v1/evaluation")
@@ -1,8 +1,14 @@
 from flask_restx import Resource, Namespace, fields
+from app.controllers.cache_controller import CacheController
+from app.controllers.cpu_controller import CpuController
 from app.controllers.logs_controller import LogsController
+from app.controllers.models_controller import ModelsController
 from app.api.open_ai.models.about.status_openai_model import (
     status_model as status_openai_model,
 )
+from app.api.open_ai.models.about.model_status_openai_model import (
+    model_status_model as model_status_openai_model,
+)
 
 ns = Namespace("about")
 
@@ -26,3 +32,36 @@ class Logs(Resource):
     @ns.response(200, "Success", fields.List(fields.String()))
     def get(self):
         return self._controller.index()
+
+
+@ns.route("/models")
+class Models(Resource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._controller = ModelsController()
+
+    @ns.response(200, "Success", fields.List(fields.Nested(model_status_openai_model)))
+    def get(self):
+        return self._controller.index()
+
+
+@ns.route("/cache")
+class Cache(Resource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._controller = CacheController()
+
+    @ns.response(200, "Success", fields.Raw())
+    def get(self):
+        return self._controller.index()
+
+
+@ns.route("/cpu")
+class Cpu(Resource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._controller = CpuController()
+
+    @ns.response(200, "Success", fields.Raw())
+    def get(self):
+        return self._controller.index()
@@ -1,9 +1,13 @@
 import logging
 
+from app.api.open_ai.models.evaluation.evaluation_job_openai_model import (
+    evaluation_job_model as evaluation_job_openai_model,
+)
 from app.api.open_ai.models.evaluation.evaluation_response_openai_model import (
     evaluation_response_model as evaluation_response_openai_model,
 )
 from app.controllers.evaluation_controller import EvaluationController
+from app.controllers.evaluation_job_controller import EvaluationJobController
 from app.controllers.sectors_controller import SectorsController
 from flask_restx import Namespace, Resource, fields, reqparse
 from werkzeug.datastructures import FileStorage
@@ -49,6 +53,42 @@ class Evaluate(Resource):
         return evaluation_result, 200
 
 
+@ns.route("/jobs")
+class EvaluationJobs(Resource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._controller = EvaluationJobController()
+
+    @ns.response(200, "Success", fields.Raw())
+    def get(self):
+        return self._controller.index()
+
+    @ns.expect(evaluate_parser)
+    @ns.response(202, "Accepted", evaluation_job_openai_model)
+    @ns.response(503, "Evaluation job queue is full or job workers are not running")
+    def post(self):
+        data = evaluate_parser.parse_args()
+
+        logging.info(f"Evaluation job submitted. {data}")
+        evaluation_job = self._controller.post(
+            pdf_file=data["file"], sector=data["sector"]
+        )
+
+        return evaluation_job, 202
+
+
+@ns.route("/jobs/<string:job_id>")
+class EvaluationJob(Resource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._controller = EvaluationJobController()
+
+    @ns.response(200, "Success", evaluation_job_openai_model)
+    @ns.response(404, "Evaluation job not found")
+    def get(self, job_id: str):
+        return self._controller.get(job_id)
+
+
 @ns.route("/sectors")
 class Sectors(Resource):
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,18 @@
+from flask_restx import fields
+from app.instances import api
+
+model_status_model = api.model(
+    "ModelStatus",
+    {
+        "name": fields.String(required=True, description="Name of the model"),
+        "state": fields.String(
+            required=True,
+            description="Load state of the model (unloaded, loading, loaded, failed)",
+        ),
+        "version": fields.Integer(description="Version of the loaded model"),
+        "identifier": fields.String(description="Versioned identifier of the model"),
+        "loaded_at": fields.Float(description="Unix timestamp of the last load"),
+        "load_seconds": fields.Float(description="Duration of the last load"),
+        "error": fields.String(description="Error raised by the last failed load"),
+    },
+)
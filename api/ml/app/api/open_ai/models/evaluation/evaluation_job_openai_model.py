@@ -0,0 +1,37 @@
+from flask_restx import fields
+from app.instances import api
+from app.api.open_ai.models.evaluation.evaluation_response_openai_model import (
+    evaluation_response_model,
+)
+
+evaluation_job_model = api.model(
+    "EvaluationJob",
+    {
+        "job_id": fields.String(required=True, description="Identifier of the job"),
+        "status": fields.String(
+            required=True,
+            description="Status of the job (queued, running, succeeded, failed)",
+        ),
+        "stage": fields.String(
+            description=(
+                "Progress of the job (queued, started, processing_document, "
+                "evaluating, succeeded, failed)"
+            )
+        ),
+        "sector": fields.String(required=True, description="Sector of the document"),
+        "filename": fields.String(description="Filename of the submitted document"),
+        "queue_position": fields.Integer(
+            description="Position in the queue while the job is queued"
+        ),
+        "attempts": fields.Integer(description="Times a worker started the job"),
+        "created_at": fields.Float(description="Unix timestamp of the submission"),
+        "started_at": fields.Float(description="Unix timestamp of the last start"),
+        "finished_at": fields.Float(description="Unix timestamp of the completion"),
+        "error": fields.String(description="Error of a failed job"),
+        "result": fields.Nested(
+            evaluation_response_model,
+            allow_null=True,
+            description="Evaluation result of a succeeded job",
+        ),
+    },
+)
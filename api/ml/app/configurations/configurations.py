@@ -1,8 +1,15 @@
+from .cpu_budget_configurations import CpuBudgetConfigurations
 from .embedding_model_configurations import EmbeddingModelConfigurations
+from .evaluation_configurations import EvaluationConfigurations
+from .evaluation_job_configurations import EvaluationJobConfigurations
+from .evaluation_result_cache_configurations import EvaluationResultCacheConfigurations
 from .feature_selector_configurations import FeatureSelectorConfigurations
 from .interfaces import ConfigurationsABC
 from .log_configurations import LogConfigurations
 from .machine_learning_model_configurations import MachineLearningModelConfigurations
+from .nli_model_configurations import NLIModelConfigurations
+from .nli_result_cache_configurations import NLIResultCacheConfigurations
+from .pdf_text_extractor_configurations import PdfTextExtractorConfigurations
 from .sector_evaluation_criteria_configurations import (
     SectorEvaluationCriteriaConfigurations,
 )
@@ -12,10 +19,19 @@ from .text_vectorizer_configurations import TextVectorizerConfigurations
 class Configurations(ConfigurationsABC):
     # App Configurations
     uploads_directory_path = "uploads"
+    # Uploads larger than this are spooled to a uniquely named file in the uploads directory
+    uploads_spool_threshold_bytes = 32 * 1024 * 1024
 
     Logs = LogConfigurations
+    CpuBudget = CpuBudgetConfigurations
     SectorEvaluationCriterias = SectorEvaluationCriteriaConfigurations
     EmbeddingModels = EmbeddingModelConfigurations
     TextVectorizers = TextVectorizerConfigurations
     FeatureSelectors = FeatureSelectorConfigurations
     MachineLearningModels = MachineLearningModelConfigurations
+    NLIModels = NLIModelConfigurations
+    NLIResultCache = NLIResultCacheConfigurations
+    Evaluation = EvaluationConfigurations
+    EvaluationResultCache = EvaluationResultCacheConfigurations
+    EvaluationJobs = EvaluationJobConfigurations
+    PdfTextExtractors = PdfTextExtractorConfigurations
@@ -0,0 +1,22 @@
+import os
+
+from .interfaces import ConfigurationsABC
+
+
+class CpuBudgetConfigurations(ConfigurationsABC):
+    # Cores shared by the worker processes (None detects them from the CPU affinity
+    # and the cgroup CPU quota of the container)
+    available_cores = None
+    # gunicorn reads its worker process count from WEB_CONCURRENCY
+    worker_processes = int(os.environ.get("WEB_CONCURRENCY", 1))
+    # Concurrent requests per worker process (gunicorn --threads)
+    request_threads = 3
+
+    # Set to override the values derived from the budget
+    torch_intra_op_threads = None
+    torch_inter_op_threads = None
+    blas_threads = None
+    evaluation_workers = None
+    spacy_n_process = None
+    # Forking spaCy processes only pays off with this many cores per request
+    spacy_min_cores_per_request = 4
@@ -3,3 +3,23 @@ from .interfaces import ConfigurationsABC
 
 class EmbeddingModelConfigurations(ConfigurationsABC):
     models_bin_path = "./app/data/bin"
+    # Sentence embedding model used for evaluations: "glove" or "sbert"
+    embedding_model = "glove"
+    # GloVe vectors are saved to a separate .npy and memory-mapped with this mode, so
+    # every worker process on a host shares one page cache copy (None loads privately)
+    glove_mmap_mode = "r"
+
+    # "full" loads the whole glove-twitter-50 vocabulary, "compact" the pruned artifact
+    # built by initialize.py (falling back to the full model until it exists)
+    glove_artifact = "full"
+    # The compact vocabulary keeps the most frequent words, the words of the corpus
+    # files and every criterion question token
+    glove_compact_max_vocabulary = 100_000
+    glove_compact_corpus_paths = []
+    # "float32", "float16" or "int8" (symmetric, with one scale per row)
+    glove_compact_dtype = "float16"
+
+    # SBERT sentences are encoded in length-sorted batches, and their embeddings are
+    # kept in a process-wide LRU cache keyed by the hash of the processed sentence
+    sbert_batch_size = 64
+    sbert_cache_max_entries = 100_000
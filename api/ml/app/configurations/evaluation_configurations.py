@@ -0,0 +1,19 @@
+from .interfaces import ConfigurationsABC
+
+
+class EvaluationConfigurations(ConfigurationsABC):
+    # "batched" runs every leaf criterion of a sector through the NLI model in batches,
+    # "threaded" evaluates each leaf criterion separately on the criteria scheduler.
+    mode = "batched"
+    # Maximum pairs per NLI batch (batches are sized by NLIModels.batch_token_budget)
+    nli_batch_size = 64
+
+    # Batched sentence preprocessing (spaCy nlp.pipe, tokenizer only), its n_process
+    # comes from the CPU budget
+    sentence_preprocessing_batch_size = 256
+
+    # "streaming" overlaps PDF extraction, sentence segmentation and embedding,
+    # "sequential" runs each step on the whole document before the next one.
+    document_pipeline = "streaming"
+    # Chunks buffered between two streaming stages
+    pipeline_queue_size = 8
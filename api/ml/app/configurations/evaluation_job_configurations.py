@@ -0,0 +1,21 @@
+from .interfaces import ConfigurationsABC
+
+
+class EvaluationJobConfigurations(ConfigurationsABC):
+    # Job state and results, shared by the API and the evaluation worker processes
+    # (written at runtime, so kept out of the read-only app directory like uploads)
+    database_path = "jobs/evaluation-jobs.sqlite3"
+    # Uploaded documents waiting for (or being evaluated by) a worker
+    documents_directory_path = "jobs/documents"
+
+    # Submissions are rejected while this many jobs are queued
+    max_queued_jobs = 16
+    # Evaluation worker processes (each loads its own models), 0 disables them
+    worker_processes = 1
+    # A job interrupted by a worker restart is queued again up to this many attempts
+    max_attempts = 2
+    # Finished jobs (and their results) are deleted after this many seconds
+    result_ttl_seconds = 24 * 60 * 60
+
+    poll_interval_seconds = 0.5
+    supervisor_interval_seconds = 5
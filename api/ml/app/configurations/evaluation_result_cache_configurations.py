@@ -0,0 +1,10 @@
+from .interfaces import ConfigurationsABC
+
+
+class EvaluationResultCacheConfigurations(ConfigurationsABC):
+    memory_max_entries = 64
+
+    # Written at runtime, so kept out of the read-only app directory like uploads
+    disk_enabled = True
+    disk_directory_path = "cache/evaluation-results"
+    disk_max_bytes = 256 * 1024 * 1024
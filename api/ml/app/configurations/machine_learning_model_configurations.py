@@ -3,3 +3,5 @@ from .interfaces import ConfigurationsABC
 
 class MachineLearningModelConfigurations(ConfigurationsABC):
     bin_path = "./app/data/pkl"
+    # Process-wide LRU cache of name -> predicted gender
+    gender_prediction_cache_max_entries = 50_000
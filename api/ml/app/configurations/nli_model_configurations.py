@@ -0,0 +1,15 @@
+from .interfaces import ConfigurationsABC
+
+
+class NLIModelConfigurations(ConfigurationsABC):
+    # "fp32" runs DistilBART MNLI as released, "int8" applies PyTorch dynamic int8
+    # quantization to its linear layers at load time
+    backend = "fp32"
+    # Inputs are truncated (premise first) to this many tokens
+    max_length = 512
+    # NLI batches are formed from pairs of similar token length so that the batch size
+    # times its longest input (the padded tokens) stays within this budget
+    batch_token_budget = 4096
+
+    # The quantized model is cached here after the first quantization
+    quantized_models_path = "./app/data/bin/nli"
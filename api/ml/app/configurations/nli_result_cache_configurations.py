@@ -0,0 +1,11 @@
+from .interfaces import ConfigurationsABC
+
+
+class NLIResultCacheConfigurations(ConfigurationsABC):
+    memory_max_entries = 50_000
+
+    # SQLite store shared by the worker processes, evicted least recently used first
+    # (in the writable cache directory shared with the evaluation result cache)
+    disk_enabled = True
+    disk_database_path = "cache/nli-results.sqlite3"
+    disk_max_bytes = 64 * 1024 * 1024
@@ -0,0 +1,17 @@
+import os
+
+from .interfaces import ConfigurationsABC
+
+
+class PdfTextExtractorConfigurations(ConfigurationsABC):
+    # Page-parallel extraction in a process pool, for documents with at least parallel_min_pages pages
+    parallel_workers = min(4, os.cpu_count() or 1)
+    parallel_min_pages = 16
+
+    # "auto" extracts text with pypdfium2 and tables with pdfplumber on pages that look
+    # like they contain tables, "pdfium" extracts text only, "pdfplumber" does everything
+    # with pdfplumber.
+    backend = "auto"
+    # Minimum number of vector path objects (ruling lines, cell borders) for a page to be
+    # considered a table candidate
+    table_detection_min_path_objects = 8
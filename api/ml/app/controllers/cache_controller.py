@@ -0,0 +1,26 @@
+from app.models.classification_models.gender_classification import (
+    GenderClassificationModel,
+)
+from app.models.embedding_models.sbert_embedding_model import SBERTEmbeddingModel
+from app.models.nli_models.interfaces import NLIModelABC
+from app.repositories.evaluation_result_cache_repository.evaluation_result_cache_repository import (
+    EvaluationResultCacheRepository,
+)
+from app.services.evaluation_result_cache_service.evaluation_result_cache_service import (
+    EvaluationResultCacheService,
+)
+
+
+class CacheController:
+    def __init__(self):
+        self._evaluation_result_cache_service = EvaluationResultCacheService(
+            evaluation_result_cache_repository=EvaluationResultCacheRepository()
+        )
+
+    def index(self):
+        return {
+            "evaluation_results": self._evaluation_result_cache_service.get_stats(),
+            "gender_predictions": GenderClassificationModel.get_prediction_cache_stats(),
+            "sentence_embeddings": SBERTEmbeddingModel.get_embedding_cache_stats(),
+            "nli_results": NLIModelABC.get_result_cache_stats(),
+        }
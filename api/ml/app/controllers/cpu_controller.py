@@ -0,0 +1,6 @@
+from app.utils.cpu_governor import CpuGovernor
+
+
+class CpuController:
+    def index(self):
+        return CpuGovernor.get_report()
@@ -1,57 +1,142 @@
 import logging
-from typing import Any
+from typing import Any, Callable, Optional
 
-import spacy
+from app.configurations.configurations import Configurations
 from app.factories.embedding_model_factory import EmbeddingModelFactory
+from app.factories.nli_model_factory import NLIModelFactory
+from app.factories.pdf_text_extractor_factory import PdfTextExtractorFactory
+from app.models.classification_models.feature_selectors.chi_squared import Chi2Selector
+from app.models.classification_models.gender_classification import (
+    GenderClassificationModel,
+)
+from app.models.classification_models.text_vectorizers.count_vectorizer import (
+    CountVectorizer,
+)
 from app.repositories.evaluation_criteria_repository.evaluation_criteria_repository import (
     EvaluationCriteriaRepository,
 )
+from app.repositories.evaluation_result_cache_repository.evaluation_result_cache_repository import (
+    EvaluationResultCacheRepository,
+)
 from app.services.evaluation_criteria_service.evaluation_criteria_service import (
     EvaluationCriteriaService,
 )
+from app.services.evaluation_result_cache_service.evaluation_result_cache_service import (
+    EvaluationResultCacheService,
+)
 from app.services.evaluation_service.evaluation_service import EvaluationService
-from app.services.gender_mapper_service.gender_mapper import GenderMapper
-from app.services.pdf_text_extractor_service.pdf_plumber_text_extractor import (
-    PdfPlumberPdfTextExtractorService,
+from app.services.evaluation_service.streaming_document_pipeline import (
+    StreamingDocumentPipeline,
+    StreamingPipelineStageError,
 )
+from app.services.gender_mapper_service.gender_mapper import GenderMapper
 from app.utils.pdf_handler import PDFHandler
 from flask import abort
 
-spacy_nlp = spacy.load("en_core_web_sm")
-
 
 class EvaluationController:
+    _configurations = Configurations.Evaluation
+
     def __init__(self):
-        self._embedding_model = EmbeddingModelFactory.create_glove_model()
+        self._embedding_model = EmbeddingModelFactory.create_configured_model()
+        self._nli_model = NLIModelFactory.create_configured_model()
+        self._gender_classification_model = GenderClassificationModel(
+            vectorizer=CountVectorizer(), selector=Chi2Selector()
+        )
+        self._evaluation_criteria_service = EvaluationCriteriaService(
+            evaluation_criteria_repository=EvaluationCriteriaRepository()
+        )
+        self._evaluation_result_cache_service = EvaluationResultCacheService(
+            evaluation_result_cache_repository=EvaluationResultCacheRepository()
+        )
+
+    def _get_model_identifiers(self):
+        return [
+            f"pdf-text-extractor:{Configurations.PdfTextExtractors.backend}",
+            # The pipelines segment the text differently and NLI batching pads inputs
+            f"document-pipeline:{self._configurations.document_pipeline}",
+            f"evaluation-mode:{self._configurations.mode}",
+            self._embedding_model.model_fingerprint,
+            f"{self._nli_model.model_identifier}:{self._nli_model.input_truncation}",
+            self._gender_classification_model.model_identifier,
+        ]
 
-    def post(self, pdf_file: Any, sector: str):
+    def _create_evaluation_service(self, pdf_handler: PDFHandler):
+        """Extracts, gender maps and embeds the whole document one step at a time."""
         try:
-            document_content = PDFHandler(
-                pdf_file, PdfPlumberPdfTextExtractorService()
-            ).extract_text()
+            document_content = pdf_handler.extract_text()
         except Exception:
             abort(400, description="Failed to extract text from PDF")
 
-        doc = spacy_nlp(document_content)
-        gender_mapped_doc = GenderMapper(document=doc).map()
+        # GenderMapper parses the text once and returns the mapped sentences
+        gender_mapped_sentences = GenderMapper(text=document_content).map()
 
-        evaluation_criteria_repository = EvaluationCriteriaRepository()
-        evaluation_criteria_service = EvaluationCriteriaService(
-            evaluation_criteria_repository=evaluation_criteria_repository
+        return EvaluationService(
+            document=None,
+            embedding_model=self._embedding_model,
+            sentences=gender_mapped_sentences,
         )
 
-        self._evaluation_service_glove = EvaluationService(
-            document=gender_mapped_doc,
+    def _create_streamed_evaluation_service(self, pdf_handler: PDFHandler):
+        """Embeds the document sentences while the PDF text is still being extracted."""
+        try:
+            sentences, embedded_sentences = StreamingDocumentPipeline(
+                embedding_model=self._embedding_model
+            ).run(pdf_handler.iter_text())
+        except StreamingPipelineStageError as e:
+            if e.stage == "extraction":
+                abort(400, description="Failed to extract text from PDF")
+            raise
+
+        return EvaluationService(
+            document=None,
             embedding_model=self._embedding_model,
+            sentences=sentences,
+            embedded_sentences=embedded_sentences,
+        )
+
+    def post(
+        self,
+        pdf_file: Any,
+        sector: str,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ):
+        """Evaluates a PDF document, reporting each stage it enters to on_progress."""
+        on_progress = on_progress or (lambda stage: None)
+
+        cache_key = self._evaluation_result_cache_service.create_key(
+            document_stream=pdf_file.stream,
+            sector=sector,
+            criteria_checksum=self._evaluation_criteria_service.get_checksum(sector),
+            model_identifiers=self._get_model_identifiers(),
+        )
+        cached_evaluation_result = self._evaluation_result_cache_service.get(cache_key)
+        if cached_evaluation_result is not None:
+            logging.info(f"Document evaluation served from cache: {pdf_file.filename}")
+            return cached_evaluation_result
+
+        on_progress("processing_document")
+        pdf_handler = PDFHandler(
+            pdf_file, PdfTextExtractorFactory.create_configured_extractor()
         )
+        if self._configurations.document_pipeline == "streaming":
+            self._evaluation_service = self._create_streamed_evaluation_service(
+                pdf_handler
+            )
+        else:
+            self._evaluation_service = self._create_evaluation_service(
+                pdf_handler
+            )
 
-        evaluation_criteria = evaluation_criteria_service.get_json(sector)
+        evaluation_criteria = self._evaluation_criteria_service.get_json(sector)
 
+        on_progress("evaluating")
         logging.info(f"Document evaluating: {pdf_file.filename}")
-        evaluation_result = self._evaluation_service_glove.batch_evaluate(
-            evaluation_criteria=evaluation_criteria
+        evaluation_result = self._evaluation_service.batch_evaluate(
+            evaluation_criteria=evaluation_criteria, sector=sector
         )
 
         logging.info(f"Document evaluation completed: {pdf_file.filename}")
+        self._evaluation_result_cache_service.set(cache_key, evaluation_result)
 
         return evaluation_result
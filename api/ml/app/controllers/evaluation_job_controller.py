@@ -0,0 +1,120 @@
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from app.configurations.configurations import Configurations
+from app.controllers.evaluation_controller import EvaluationController
+from app.repositories.evaluation_job_repository.evaluation_job_repository import (
+    EvaluationJobRepository,
+)
+from app.services.evaluation_job_service.evaluation_job_service import (
+    EvaluationJobQueueFullError,
+    EvaluationJobService,
+)
+from app.services.evaluation_job_service.evaluation_job_worker_pool import (
+    EvaluationJobWorkerPool,
+)
+from app.utils.cpu_governor import CpuGovernor
+from flask import abort
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import HTTPException
+
+
+class EvaluationJobController:
+    _configurations = Configurations.EvaluationJobs
+
+    def __init__(self):
+        self._evaluation_job_service = EvaluationJobService(
+            evaluation_job_repository=EvaluationJobRepository()
+        )
+
+    def index(self):
+        return self._evaluation_job_service.get_stats()
+
+    def post(self, pdf_file: Any, sector: str):
+        # Jobs would stay queued forever without workers to claim them
+        if not EvaluationJobWorkerPool.is_available():
+            abort(503, description="Evaluation job workers are not running")
+
+        try:
+            return self._evaluation_job_service.submit(pdf_file, sector)
+        except EvaluationJobQueueFullError:
+            abort(503, description="Evaluation job queue is full, retry later")
+
+    def get(self, job_id: str):
+        job = self._evaluation_job_service.get(job_id)
+        if job is None:
+            abort(404, description=f"Evaluation job not found: {job_id}")
+        return job
+
+    def _process(self, job, evaluation_controller: EvaluationController):
+        job_id = job["job_id"]
+        logging.info(f"Evaluation job started: {job_id} ({job['filename']})")
+
+        try:
+            with open(job["document_path"], "rb") as document_file:
+                pdf_file = FileStorage(stream=document_file, filename=job["filename"])
+                evaluation_result = evaluation_controller.post(
+                    pdf_file=pdf_file,
+                    sector=job["sector"],
+                    on_progress=lambda stage: (
+                        self._evaluation_job_service.update_stage(job_id, stage)
+                    ),
+                )
+        except HTTPException as e:
+            self._evaluation_job_service.fail(job, e.description)
+        except Exception as e:
+            logging.exception(f"Evaluation job raised an error: {job_id}")
+            self._evaluation_job_service.fail(job, str(e))
+        else:
+            self._evaluation_job_service.complete(job, evaluation_result)
+
+    @classmethod
+    def _exit_with_supervisor(cls, supervisor_pid: int):
+        """Ends the worker, even in the middle of a job, once its supervisor exits.
+
+        A supervisor killed without running its exit handlers cannot stop its
+        workers, and the next supervisor queues their jobs again.
+        """
+        while os.getppid() == supervisor_pid:
+            time.sleep(cls._configurations.poll_interval_seconds)
+
+        logging.warning(f"Evaluation job supervisor exited, stopping: {os.getpid()}")
+        os._exit(1)
+
+    @classmethod
+    def run_worker(cls, supervisor_pid: int):
+        """Worker process loop: evaluates queued jobs until the supervisor exits."""
+        logging.basicConfig(
+            level=logging.INFO, format="[%(asctime)s] [%(levelname)s] - %(message)s"
+        )
+        threading.Thread(
+            target=cls._exit_with_supervisor,
+            args=(supervisor_pid,),
+            name="evaluation-job-supervisor-watch",
+            daemon=True,
+        ).start()
+        CpuGovernor.apply()
+
+        controller = cls()
+        evaluation_controller = EvaluationController()
+        logging.info(f"Evaluation job worker ready: {os.getpid()}")
+
+        while os.getppid() == supervisor_pid:
+            job = controller._evaluation_job_service.claim(os.getpid())
+            if job is None:
+                time.sleep(cls._configurations.poll_interval_seconds)
+                continue
+            controller._process(job, evaluation_controller)
+
+    @classmethod
+    def start_worker_pool(cls):
+        """Starts this host's evaluation job workers, unless another process has."""
+        return EvaluationJobWorkerPool(
+            evaluation_job_service=EvaluationJobService(
+                evaluation_job_repository=EvaluationJobRepository()
+            ),
+            worker_target=cls.run_worker,
+        ).start()
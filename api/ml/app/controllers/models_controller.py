@@ -0,0 +1,9 @@
+from app.models.model_registry import ModelRegistry
+
+
+class ModelsController:
+    def __init__(self):
+        self._model_registry = ModelRegistry()
+
+    def index(self):
+        return self._model_registry.status()
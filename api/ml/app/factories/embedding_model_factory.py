@@ -1,8 +1,11 @@
+from app.configurations.configurations import Configurations
 from app.models.embedding_models.glove_embedding_model import GloveEmbeddingModel
 from app.models.embedding_models.sbert_embedding_model import SBERTEmbeddingModel
 
 
 class EmbeddingModelFactory:
+    _configurations = Configurations.EmbeddingModels
+
     @staticmethod
     def create_glove_model():
         return GloveEmbeddingModel()
@@ -10,3 +13,13 @@ class EmbeddingModelFactory:
     @staticmethod
     def create_sbert_model():
         return SBERTEmbeddingModel()
+
+    @classmethod
+    def create_configured_model(cls):
+        """Creates the embedding model selected by the configuration."""
+        embedding_model = cls._configurations.embedding_model
+        if embedding_model == "glove":
+            return cls.create_glove_model()
+        if embedding_model == "sbert":
+            return cls.create_sbert_model()
+        raise ValueError(f"Unknown embedding model: {embedding_model}")
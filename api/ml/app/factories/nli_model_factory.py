@@ -0,0 +1,27 @@
+from app.configurations.configurations import Configurations
+from app.models.nli_models.distilbart_nli_model import DistilBartNLIModel
+from app.models.nli_models.quantized_distilbart_nli_model import (
+    QuantizedDistilBartNLIModel,
+)
+
+
+class NLIModelFactory:
+    _configurations = Configurations.NLIModels
+
+    @staticmethod
+    def create_distilbart_model():
+        return DistilBartNLIModel()
+
+    @staticmethod
+    def create_quantized_distilbart_model():
+        return QuantizedDistilBartNLIModel()
+
+    @classmethod
+    def create_configured_model(cls):
+        """Creates the NLI model selected by the configured backend."""
+        backend = cls._configurations.backend
+        if backend == "fp32":
+            return cls.create_distilbart_model()
+        if backend == "int8":
+            return cls.create_quantized_distilbart_model()
+        raise ValueError(f"Unknown NLI model backend: {backend}")
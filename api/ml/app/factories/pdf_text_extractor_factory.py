@@ -0,0 +1,35 @@
+from app.configurations.configurations import Configurations
+from app.services.pdf_text_extractor_service.pdf_plumber_text_extractor import (
+    PdfPlumberPdfTextExtractorService,
+)
+from app.services.pdf_text_extractor_service.pdfium_text_extractor import (
+    PdfiumPdfTextExtractorService,
+)
+
+
+class PdfTextExtractorFactory:
+    _configurations = Configurations.PdfTextExtractors
+
+    @staticmethod
+    def create_pdf_plumber_extractor():
+        return PdfPlumberPdfTextExtractorService()
+
+    @staticmethod
+    def create_pdfium_extractor():
+        return PdfiumPdfTextExtractorService(detect_tables=False)
+
+    @staticmethod
+    def create_auto_extractor():
+        return PdfiumPdfTextExtractorService(detect_tables=True)
+
+    @classmethod
+    def create_configured_extractor(cls):
+        """Creates the extractor selected by the configured backend."""
+        backend = cls._configurations.backend
+        if backend == "pdfplumber":
+            return cls.create_pdf_plumber_extractor()
+        if backend == "pdfium":
+            return cls.create_pdfium_extractor()
+        if backend == "auto":
+            return cls.create_auto_extractor()
+        raise ValueError(f"Unknown PDF text extractor backend: {backend}")
@@ -1,19 +1,17 @@
 import joblib
 
 from .interfaces import FeatureSelectorABC
-from typing import Any
 
 
 class Chi2Selector(FeatureSelectorABC):
-    def __init__(self):
-        self._selector: Any = None
-        super().__init__()
+    def _load_selector(self):
+        return joblib.load(f"{self._configurations.bin_path}/chi_selector.pkl")
 
     def load(self):
-        if self._selector is None:
-            self._selector = joblib.load(
-                f"{self._configurations.bin_path}/chi_selector.pkl"
-            )
+        self._model_handle = self._model_registry.get(
+            "chi_selector", self._load_selector
+        )
+        self._selector = self._model_handle.model
 
     def transform(self, vector):
         return self._selector.transform(vector)
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import Any, Optional
+
 from app.configurations.configurations import Configurations
+from app.models.model_registry import ModelHandle, ModelRegistry
 
 
 class FeatureSelectorABC(ABC):
     _instance = None
     _configurations = Configurations.FeatureSelectors
+    _model_registry = ModelRegistry()
+    _selector: Any = None
+    _model_handle: Optional[ModelHandle] = None
 
     def __init__(self):
         self.load()
@@ -16,6 +22,7 @@ class FeatureSelectorABC(ABC):
 
     @abstractmethod
     def transform(self, vector):
+        """Select the features of a vectorized matrix, one or many rows at a time."""
         pass
 
     @abstractmethod
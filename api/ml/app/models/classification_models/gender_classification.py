@@ -1,7 +1,10 @@
-from typing import Any
+from typing import List
 
 import joblib
 
+from app.configurations.configurations import Configurations
+from app.utils.lru_cache import LRUCache
+
 from .feature_selectors.interfaces import FeatureSelectorABC
 from .interfaces import ClassificationModelABC
 from .text_vectorizers.interfaces import TextVectorizerABC
@@ -12,22 +15,65 @@ class GenderClassificationModel(ClassificationModelABC):
         0: "female",
         1: "male",
     }
+    # Shared across documents so common names are only classified once per process
+    _prediction_cache = LRUCache(
+        Configurations.MachineLearningModels.gender_prediction_cache_max_entries
+    )
 
     def __init__(self, vectorizer: TextVectorizerABC, selector: FeatureSelectorABC):
         self._vectorizer = vectorizer
         self._selector = selector
-        self._model: Any = None
         super().__init__()
 
+    def _load_model(self):
+        return joblib.load(
+            f"{self._configurations.bin_path}/gender_classification_model.pkl"
+        )
+
     def load(self):
-        if self._model is None:
-            self._model = joblib.load(
-                f"{self._configurations.bin_path}/gender_classification_model.pkl"
+        self._model_handle = self._model_registry.get(
+            "gender_classification_model", self._load_model
+        )
+        self._model = self._model_handle.model
+
+    @classmethod
+    def get_prediction_cache_stats(cls):
+        return cls._prediction_cache.stats()
+
+    def _classify(self, texts: List[str]):
+        """Classifies every text in one sparse batch."""
+        vectors = self._vectorizer.transform_many(texts)
+        vectors = self._selector.transform(vectors)
+        return [
+            self._gender_label_map[predicted_gender]
+            for predicted_gender in self._model.predict(vectors)
+        ]
+
+    def predict_many(self, texts: List[str]) -> List[str]:
+        # Keyed by model version so a reloaded model does not serve stale labels
+        model_identifier = self.model_identifier
+        predicted_gender_labels = {}
+        uncached_texts = []
+
+        for text in dict.fromkeys(texts):
+            predicted_gender_label = self._prediction_cache.get(
+                (model_identifier, text)
             )
+            if predicted_gender_label is None:
+                uncached_texts.append(text)
+            else:
+                predicted_gender_labels[text] = predicted_gender_label
+
+        if uncached_texts:
+            for text, predicted_gender_label in zip(
+                uncached_texts, self._classify(uncached_texts)
+            ):
+                self._prediction_cache.set(
+                    (model_identifier, text), predicted_gender_label
+                )
+                predicted_gender_labels[text] = predicted_gender_label
+
+        return [predicted_gender_labels[text] for text in texts]
 
     def predict(self, text):
-        vector = self._vectorizer.transform(text)
-        vector = self._selector.transform(vector)
-        predicted_gender = self._model.predict(vector)[0]
-        predicted_gender_label = self._gender_label_map[predicted_gender]
-        return predicted_gender_label
+        return self.predict_many([text])[0]
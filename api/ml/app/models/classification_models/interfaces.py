@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
 from app.configurations.configurations import Configurations
+from app.models.model_registry import ModelHandle, ModelRegistry
 
 
 class ClassificationModelABC(ABC):
     _instance = None
     _configurations = Configurations.MachineLearningModels
+    _model_registry = ModelRegistry()
+    _model: Any = None
+    _model_handle: Optional[ModelHandle] = None
 
     def __init__(self, *args, **kwargs):
         self.load()
@@ -21,3 +27,12 @@ class ClassificationModelABC(ABC):
     @abstractmethod
     def predict(self, text) -> str:
         pass
+
+    def predict_many(self, texts: List[str]) -> List[str]:
+        """Predict the label of every text, in order."""
+        return [self.predict(text) for text in texts]
+
+    @property
+    def model_identifier(self) -> str:
+        """Versioned identifier of the loaded model."""
+        return self._model_handle.identifier if self._model_handle else "unloaded"
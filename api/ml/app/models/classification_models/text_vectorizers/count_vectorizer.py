@@ -1,18 +1,21 @@
+from typing import List
+
 from .interfaces import TextVectorizerABC
 import joblib
-from typing import Any
 
 
 class CountVectorizer(TextVectorizerABC):
-    def __init__(self):
-        self._vectorizer: Any = None
-        super().__init__()
-
     def transform(self, text: str):
         return self._vectorizer.transform([text])
 
+    def transform_many(self, texts: List[str]):
+        return self._vectorizer.transform(texts)
+
+    def _load_vectorizer(self):
+        return joblib.load(f"{self._configurations.bin_path}/count_vectorizer.pkl")
+
     def load(self):
-        if self._vectorizer is None:
-            self._vectorizer = joblib.load(
-                f"{self._configurations.bin_path}/count_vectorizer.pkl"
-            )
+        self._model_handle = self._model_registry.get(
+            "count_vectorizer", self._load_vectorizer
+        )
+        self._vectorizer = self._model_handle.model
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
 from app.configurations.configurations import Configurations
+from app.models.model_registry import ModelHandle, ModelRegistry
 
 
 class TextVectorizerABC(ABC):
     _instance = None
     _configurations = Configurations.TextVectorizers
+    _model_registry = ModelRegistry()
+    _vectorizer: Any = None
+    _model_handle: Optional[ModelHandle] = None
 
     def __init__(self):
         self.load()
@@ -18,6 +24,11 @@ class TextVectorizerABC(ABC):
     def transform(self, text: str):
         pass
 
+    @abstractmethod
+    def transform_many(self, texts: List[str]):
+        """Vectorize several texts into a single (sparse) matrix, one row per text."""
+        pass
+
     @abstractmethod
     def load(self):
         pass
@@ -0,0 +1,121 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class CompactGloveVectors:
+    """Pruned GloVe vocabulary with float32, float16 or int8 (per-row scaled) vectors.
+
+    Exposes the key_to_index, vectors and vector_size attributes of gensim's
+    KeyedVectors that the embedding model uses, and get_vectors() to gather
+    dequantized float32 rows. The vectors are stored as .npy files so they can be
+    memory-mapped.
+    """
+
+    dtypes = ("float32", "float16", "int8")
+
+    _keys_filename = "keys.json"
+    _vectors_filename = "vectors.npy"
+    _scales_filename = "scales.npy"
+    _metadata_filename = "metadata.json"
+
+    def __init__(
+        self,
+        keys: List[str],
+        vectors: np.ndarray,
+        scales: Optional[np.ndarray],
+        metadata: dict,
+    ):
+        self.index_to_key = keys
+        self.key_to_index: Dict[str, int] = {
+            key: index for index, key in enumerate(keys)
+        }
+        self.vectors = vectors
+        self.scales = scales
+        self.vector_size = vectors.shape[1]
+        self.metadata = metadata
+
+    def __contains__(self, key: str):
+        return key in self.key_to_index
+
+    def __len__(self):
+        return len(self.index_to_key)
+
+    def get_vectors(self, indices: np.ndarray) -> np.ndarray:
+        """Gathers the float32 vectors of the given rows."""
+        vectors = self.vectors[indices].astype(np.float32)
+        if self.scales is not None:
+            vectors *= self.scales[indices, None]
+        return vectors
+
+    @staticmethod
+    def _quantize(vectors: np.ndarray, dtype: str):
+        if dtype == "int8":
+            # Symmetric per-row quantization: each row uses its own scale
+            scales = np.abs(vectors).max(axis=1) / 127
+            safe_scales = np.where(scales > 0, scales, 1)
+            quantized = np.rint(vectors / safe_scales[:, None]).astype(np.int8)
+            return quantized, scales.astype(np.float32)
+        if dtype in CompactGloveVectors.dtypes:
+            return vectors.astype(dtype), None
+        raise ValueError(f"Unknown compact GloVe dtype: {dtype}")
+
+    @classmethod
+    def metadata_path(cls, directory: str):
+        return os.path.join(directory, cls._metadata_filename)
+
+    @classmethod
+    def exists(cls, directory: str):
+        return os.path.exists(cls.metadata_path(directory))
+
+    @classmethod
+    def save(
+        cls,
+        directory: str,
+        keys: List[str],
+        vectors: np.ndarray,
+        dtype: str,
+        metadata: dict,
+    ):
+        """Writes the artifact. The metadata is written last and marks it complete."""
+        os.makedirs(directory, exist_ok=True)
+        if cls.exists(directory):
+            os.remove(cls.metadata_path(directory))
+
+        quantized, scales = cls._quantize(vectors, dtype)
+        np.save(os.path.join(directory, cls._vectors_filename), quantized)
+        scales_path = os.path.join(directory, cls._scales_filename)
+        if scales is not None:
+            np.save(scales_path, scales)
+        elif os.path.exists(scales_path):
+            os.remove(scales_path)
+
+        with open(os.path.join(directory, cls._keys_filename), "w") as keys_file:
+            json.dump(keys, keys_file)
+
+        metadata = {
+            **metadata,
+            "dtype": dtype,
+            "vocabulary_size": len(keys),
+            "vector_size": int(vectors.shape[1]),
+        }
+        with open(cls.metadata_path(directory), "w") as metadata_file:
+            json.dump(metadata, metadata_file, indent=2)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Optional[str] = "r"):
+        with open(cls.metadata_path(directory), "r") as metadata_file:
+            metadata = json.load(metadata_file)
+        with open(os.path.join(directory, cls._keys_filename), "r") as keys_file:
+            keys = json.load(keys_file)
+
+        vectors = np.load(
+            os.path.join(directory, cls._vectors_filename), mmap_mode=mmap_mode
+        )
+        scales = None
+        if metadata["dtype"] == "int8":
+            scales = np.load(os.path.join(directory, cls._scales_filename))
+
+        return cls(keys, vectors, scales, metadata)
@@ -1,61 +1,261 @@
+import re
+from typing import Iterable, List, Optional
+
 from gensim.models import KeyedVectors
+from .compact_glove_vectors import CompactGloveVectors
 from .interfaces import EmbeddingModelABC
 import os
 import numpy as np
 import gensim.downloader as api
 import logging
-from typing import Any
 
 
 class GloveEmbeddingModel(EmbeddingModelABC):
     def __init__(self):
-        self._model: Any = None
         self._model_name = "glove-twitter-50"
         self._model_bin_file = os.path.join(
             self._model_bin_path,
             f"{self._model_name}.bin",
         )
+        # Written by KeyedVectors.save(separately=["vectors"]) next to the .bin file
+        self._model_vectors_file = f"{self._model_bin_file}.vectors.npy"
+        self._compact_model_name = f"{self._model_name}-compact"
+        self._compact_model_directory = os.path.join(
+            self._model_bin_path, self._compact_model_name
+        )
 
         super().__init__()
 
-    def load(self):
-        """Load the GloVe model, downloading and saving if necessary."""
+    def _save_model(self, model: KeyedVectors):
+        """Save the model with its vectors in a separate, memory-mappable .npy file."""
+        temp_model_bin_file = f"{self._model_bin_file}.{os.getpid()}.tmp"
+        model.save(temp_model_bin_file, separately=["vectors"])
+
+        # The vectors go first so the .bin file never points at missing vectors
+        os.replace(f"{temp_model_bin_file}.vectors.npy", self._model_vectors_file)
+        os.replace(temp_model_bin_file, self._model_bin_file)
+
+    def _load_model(self):
+        """Load the full GloVe model, downloading and saving if necessary."""
         if not os.path.exists(self._model_bin_path):
             os.makedirs(self._model_bin_path, exist_ok=True)
 
+        mmap_mode = self._configurations.glove_mmap_mode
+
         if not os.path.exists(self._model_bin_file):
             logging.info(
                 f"Downloading, saving, and loading GloVe model: {self._model_name}..."
             )
-            self._model = api.load(self._model_name)
-            self._model.save(self._model_bin_file)
+            self._save_model(api.load(self._model_name))
+
+        elif mmap_mode and not os.path.exists(self._model_vectors_file):
+            # Models saved before the vectors were stored separately are re-saved once
+            try:
+                logging.info("Re-saving GloVe model for memory mapping...")
+                self._save_model(KeyedVectors.load(self._model_bin_file))
+            except OSError as e:
+                logging.warning(f"Failed to re-save GloVe model: {str(e)}")
+                mmap_mode = None
+
+        logging.info(
+            f"Loading GloVe model from file: {self._model_bin_file} "
+            f"(mmap: {mmap_mode})..."
+        )
+        return KeyedVectors.load(self._model_bin_file, mmap=mmap_mode)
+
+    def _load_compact_model(self):
+        """Load the pruned and quantized GloVe artifact built by initialize.py."""
+        logging.info(
+            f"Loading compact GloVe model from: {self._compact_model_directory}..."
+        )
+        return CompactGloveVectors.load(
+            self._compact_model_directory,
+            mmap_mode=self._configurations.glove_mmap_mode,
+        )
+
+    def _uses_compact_model(self):
+        if self._configurations.glove_artifact != "compact":
+            return False
+        if CompactGloveVectors.exists(self._compact_model_directory):
+            return True
+
+        if not self._model_registry.is_loaded(self._model_name):
+            logging.warning(
+                "Compact GloVe model not built (run initialize.py), "
+                "loading the full model instead"
+            )
+        return False
+
+    def load(self):
+        """Get the GloVe model from the model registry, loading it once per process."""
+        if self._uses_compact_model():
+            self._model_handle = self._model_registry.get(
+                self._compact_model_name, self._load_compact_model
+            )
         else:
-            if self._model is None:
-                logging.info(
-                    f"Loading GloVe model from file: {self._model_bin_file}..."
-                )
-                self._model = KeyedVectors.load(self._model_bin_file)
+            self._model_handle = self._model_registry.get(
+                self._model_name, self._load_model
+            )
+        self._model = self._model_handle.model
 
-    def transform(self, sentence: str):
-        """Transform a given sentence to GloVe embeddings."""
-        tokens = sentence.lower().split()
+    def _is_compact_model_loaded(self):
+        return (
+            self._model_handle is not None
+            and self._model_handle.name == self._compact_model_name
+        )
+
+    @staticmethod
+    def _read_corpus_tokens(corpus_paths: Iterable[str]):
+        """Collects the lowercase alphabetic tokens of plain text corpus files."""
+        tokens = set()
+        for corpus_path in corpus_paths:
+            with open(corpus_path, "r", errors="ignore") as corpus_file:
+                for line in corpus_file:
+                    tokens.update(re.findall(r"[^\W\d_]+", line.lower()))
+        return tokens
+
+    def build_compact_model(
+        self,
+        required_tokens: Iterable[str],
+        corpus_paths: Optional[Iterable[str]] = None,
+    ):
+        """Build the compact GloVe artifact from the full model.
+
+        Keeps the most frequent words (GloVe keys are ordered by frequency rank), every
+        word of the corpus files and every required token, such as the criterion
+        question tokens, and stores the vectors with the configured dtype.
+        """
+        full_model = self._model_registry.get(self._model_name, self._load_model).model
+        max_vocabulary = self._configurations.glove_compact_max_vocabulary
+        corpus_paths = (
+            self._configurations.glove_compact_corpus_paths
+            if corpus_paths is None
+            else corpus_paths
+        )
 
-        # If the sentence is empty, return a zero vector of the same dimension as the GloVe embeddings.
-        if not tokens:
-            return np.zeros(self._model.vector_size)
+        selected_indices = set(range(min(max_vocabulary, len(full_model.index_to_key))))
+        tokens = {token.lower() for token in required_tokens}
+        tokens |= self._read_corpus_tokens(corpus_paths)
 
-        embeddings = []
+        out_of_vocabulary_tokens = 0
         for token in tokens:
-            # If the token is not found in the GloVe vocabulary (e.g., a rare or misspelled word), a zero vector is appended.
-            if token not in self._model:
-                embeddings.append(np.zeros(self._model.vector_size))
+            index = full_model.key_to_index.get(token)
+            if index is None:
+                out_of_vocabulary_tokens += 1
             else:
-                embeddings.append(self._model[token])
+                selected_indices.add(index)
+
+        indices = np.array(sorted(selected_indices), dtype=np.int64)
+        CompactGloveVectors.save(
+            self._compact_model_directory,
+            keys=[full_model.index_to_key[index] for index in indices],
+            vectors=np.asarray(full_model.vectors[indices]),
+            dtype=self._configurations.glove_compact_dtype,
+            metadata={
+                "source_model": self._model_name,
+                "max_vocabulary": max_vocabulary,
+                "required_tokens": len(tokens),
+                "required_tokens_out_of_vocabulary": out_of_vocabulary_tokens,
+            },
+        )
+        logging.info(
+            f"Built compact GloVe model: {len(indices)} of "
+            f"{len(full_model.index_to_key)} words "
+            f"({self._configurations.glove_compact_dtype})"
+        )
+
+        if self._model_registry.is_loaded(self._compact_model_name):
+            self._model_registry.reload(self._compact_model_name)
+
+    @property
+    def compact_model_directory(self):
+        return self._compact_model_directory
+
+    @property
+    def model_vectors_file(self):
+        """Path of the (memory-mapped) vectors .npy file."""
+        if self._is_compact_model_loaded():
+            return os.path.join(self._compact_model_directory, "vectors.npy")
+        return self._model_vectors_file
+
+    @property
+    def model_fingerprint(self):
+        """Model name plus the size and modification time of the saved model file."""
+        if self._is_compact_model_loaded():
+            model_name = self._compact_model_name
+            model_file = CompactGloveVectors.metadata_path(
+                self._compact_model_directory
+            )
+        else:
+            model_name, model_file = self._model_name, self._model_bin_file
+
+        if not os.path.exists(model_file):
+            return model_name
+
+        stat = os.stat(model_file)
+        return f"{model_name}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _get_token_vectors(keyed_vectors, token_indices: np.ndarray):
+        if isinstance(keyed_vectors, CompactGloveVectors):
+            return keyed_vectors.get_vectors(token_indices)
+        return keyed_vectors.vectors[token_indices]
+
+    def transform(self, sentence: str):
+        """Transform a given sentence to GloVe embeddings."""
+        return self.transform_many([sentence])[0]
+
+    def transform_many(self, sentences: List[str]):
+        """Transform sentences to a float32 matrix of averaged GloVe embeddings."""
+        return self.average_embeddings(self._model, sentences)
+
+    @classmethod
+    def average_embeddings(cls, keyed_vectors, sentences: List[str]) -> np.ndarray:
+        """Averages the word vectors of each sentence (full or compact GloVe vectors).
+
+        Tokens are mapped to vocabulary indices in bulk, their vectors are gathered with
+        a single fancy index and summed per sentence with np.add.reduceat.
+        """
+        tokenized_sentences = [sentence.lower().split() for sentence in sentences]
+        token_counts = np.fromiter(
+            map(len, tokenized_sentences), dtype=np.int64, count=len(sentences)
+        )
+
+        # Out-of-vocabulary tokens (e.g., rare or misspelled words) map to -1
+        key_to_index = keyed_vectors.key_to_index
+        token_indices = np.fromiter(
+            (
+                key_to_index.get(token, -1)
+                for tokens in tokenized_sentences
+                for token in tokens
+            ),
+            dtype=np.int64,
+            count=int(token_counts.sum()),
+        )
+        token_rows = np.repeat(np.arange(len(sentences)), token_counts)
+
+        known_tokens = token_indices >= 0
+        known_token_counts = np.bincount(
+            token_rows[known_tokens], minlength=len(sentences)
+        )
+
+        # Empty or fully out-of-vocabulary sentences keep a zero vector
+        embeddings = np.zeros((len(sentences), keyed_vectors.vector_size))
+        rows_with_known_tokens = known_token_counts > 0
+        if rows_with_known_tokens.any():
+            token_vectors = cls._get_token_vectors(
+                keyed_vectors, token_indices[known_tokens]
+            )
+            segment_starts = np.cumsum(known_token_counts) - known_token_counts
+            embeddings[rows_with_known_tokens] = np.add.reduceat(
+                token_vectors.astype(np.float64),
+                segment_starts[rows_with_known_tokens],
+                axis=0,
+            )
 
-        # If no valid embeddings were found for the tokens (e.g., all words were out-of-vocabulary), a zero vector is returned.
-        if not embeddings:
-            return np.zeros(self._model.vector_size)
+        # The embeddings of the tokens are averaged to produce a single vector that
+        # represents the entire sentence. Unknown tokens count as zero vectors.
+        rows_with_tokens = token_counts > 0
+        embeddings[rows_with_tokens] /= token_counts[rows_with_tokens, None]
 
-        # The embeddings for individual tokens are averaged produce a single vector that represents the entire sentence.
-        # This averaging aggregates the semantic meaning of the tokens into a unified vector while preserving its fixed dimensionality
-        return np.mean(embeddings, axis=0)
+        return embeddings.astype(np.float32)
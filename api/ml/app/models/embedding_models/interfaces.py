@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
 import numpy as np
 from app.configurations.configurations import Configurations
+from app.models.model_registry import ModelHandle, ModelRegistry
 
 
 class EmbeddingModelABC(ABC):
     _instance = None
     _configurations = Configurations.EmbeddingModels
     _model_bin_path = _configurations.models_bin_path
+    _model_registry = ModelRegistry()
+    _model: Any = None
+    _model_handle: Optional[ModelHandle] = None
 
     def __init__(self, *args, **kwargs):
         self.load()
@@ -21,7 +27,23 @@ class EmbeddingModelABC(ABC):
         """Transform a given sentence to an embedding in the form of a numpy array."""
         pass
 
+    def transform_many(self, sentences: List[str]) -> np.ndarray:
+        """Transform sentences to a float32 matrix with one embedding row each."""
+        return np.array(
+            [self.transform(sentence) for sentence in sentences], dtype=np.float32
+        )
+
     @abstractmethod
     def load(self):
         """Load the model (from disk or online source)."""
         pass
+
+    @property
+    def model_fingerprint(self) -> str:
+        """Fingerprint that changes whenever the underlying model artifact changes."""
+        return self._model_handle.name if self._model_handle else "unloaded"
+
+    @property
+    def model_identifier(self) -> str:
+        """Versioned identifier of the loaded model."""
+        return self._model_handle.identifier if self._model_handle else "unloaded"
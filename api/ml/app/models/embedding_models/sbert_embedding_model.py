@@ -1,21 +1,107 @@
+import hashlib
+import threading
+from typing import Dict, List
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
+
+from app.configurations.configurations import Configurations
+from app.utils.lru_cache import LRUCache
+
 from .interfaces import EmbeddingModelABC
 import logging
-from typing import Any
 
 
 class SBERTEmbeddingModel(EmbeddingModelABC):
+    # Shared across documents and requests, so repeated sentences are encoded once
+    _embedding_cache = LRUCache(
+        Configurations.EmbeddingModels.sbert_cache_max_entries
+    )
+    # Weights checksum of every loaded model version, computed once per load
+    _weights_checksums: Dict[str, str] = {}
+    _weights_checksums_lock = threading.Lock()
+
     def __init__(self):
-        self._model: Any = None
         self._model_name = "all-MiniLM-L6-v2"
         super().__init__()
 
-    def load(self):
+    def _load_model(self):
         """Load the SBERT model."""
-        if self._model is None:
-            logging.info(f"Loading SBERT model: {self._model_name}...")
-            self._model = SentenceTransformer(self._model_name)
+        logging.info(f"Loading SBERT model: {self._model_name}...")
+        return SentenceTransformer(self._model_name)
+
+    def load(self):
+        """Get the SBERT model from the model registry, loading it once per process."""
+        self._model_handle = self._model_registry.get(
+            self._model_name, self._load_model
+        )
+        self._model = self._model_handle.model
+
+    def _compute_weights_checksum(self):
+        checksum = hashlib.sha256()
+        for name, tensor in self._model.state_dict().items():
+            checksum.update(name.encode("utf-8"))
+            checksum.update(tensor.detach().cpu().numpy().tobytes())
+        return checksum.hexdigest()[:16]
+
+    @property
+    def model_fingerprint(self):
+        """Model name plus a checksum of the loaded weights."""
+        if self._model_handle is None:
+            return "unloaded"
+
+        identifier = self.model_identifier
+        with self._weights_checksums_lock:
+            checksum = self._weights_checksums.get(identifier)
+            if checksum is None:
+                checksum = self._compute_weights_checksum()
+                self._weights_checksums[identifier] = checksum
+
+        return f"{self._model_handle.name}:{checksum}"
+
+    @classmethod
+    def get_embedding_cache_stats(cls):
+        return cls._embedding_cache.stats()
+
+    def _get_cache_key(self, sentence: str):
+        sentence_hash = hashlib.sha1(sentence.encode("utf-8")).digest()
+        # Keyed by model version so a reloaded model does not serve stale embeddings
+        return (self.model_identifier, sentence_hash)
+
+    def _encode(self, sentences: List[str]) -> np.ndarray:
+        """Encode sentences in batches (SentenceTransformer batches them by length)."""
+        return self._model.encode(
+            sentences,
+            batch_size=self._configurations.sbert_batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype(np.float32)
 
     def transform(self, sentence: str):
         """Transform a given sentence to SBERT embeddings."""
-        return self._model.encode(sentence)
+        return self.transform_many([sentence])[0]
+
+    def transform_many(self, sentences: List[str]):
+        """Transform sentences to a matrix of normalized float32 SBERT embeddings.
+
+        Cached sentences are not encoded again and repeated sentences once.
+        """
+        embeddings = {}
+        uncached_sentences = []
+        for sentence in dict.fromkeys(sentences):
+            embedding = self._embedding_cache.get(self._get_cache_key(sentence))
+            if embedding is None:
+                uncached_sentences.append(sentence)
+            else:
+                embeddings[sentence] = embedding
+
+        if uncached_sentences:
+            encoded_embeddings = self._encode(uncached_sentences)
+            for sentence, embedding in zip(uncached_sentences, encoded_embeddings):
+                self._embedding_cache.set(self._get_cache_key(sentence), embedding)
+                embeddings[sentence] = embedding
+
+        if not sentences:
+            dimensions = self._model.get_sentence_embedding_dimension()
+            return np.zeros((0, dimensions), dtype=np.float32)
+        return np.stack([embeddings[sentence] for sentence in sentences])
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Compared by identity, so the wrapped models are never compared or hashed
+@dataclass(frozen=True, eq=False)
+class ModelHandle:
+    """An immutable, versioned reference to a model loaded by the ModelRegistry."""
+
+    name: str
+    version: int
+    model: Any
+    load_seconds: float
+    loaded_at: float = field(default_factory=time.time)
+
+    @property
+    def identifier(self) -> str:
+        """Identifier that changes whenever the model is (re)loaded."""
+        return f"{self.name}@{self.version}"
+
+
+class _ModelEntry:
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.state = "unloaded"
+        self.handle: Optional[ModelHandle] = None
+        self.error: Optional[str] = None
+
+
+class ModelRegistry:
+    """Process-wide registry that loads every model exactly once and hands out versioned handles."""
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(ModelRegistry, cls).__new__(cls)
+            cls._instance._entries = {}
+            cls._instance._entries_lock = threading.Lock()
+        return cls._instance
+
+    def _get_entry(self, name: str, loader: Optional[Callable[[], Any]] = None):
+        with self._entries_lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                if loader is None:
+                    raise KeyError(f"Model not registered: {name}")
+                entry = self._entries[name] = _ModelEntry(name, loader)
+            return entry
+
+    def _load(self, entry: _ModelEntry) -> ModelHandle:
+        version = entry.handle.version + 1 if entry.handle else 1
+        entry.state = "loading"
+        logging.info(f"Loading model: {entry.name} (version {version})...")
+
+        started_at = time.perf_counter()
+        try:
+            model = entry.loader()
+        except Exception as e:
+            entry.state = "failed"
+            entry.error = str(e)
+            logging.error(f"Failed to load model {entry.name}: {str(e)}")
+            raise
+
+        load_seconds = time.perf_counter() - started_at
+        entry.handle = ModelHandle(entry.name, version, model, load_seconds)
+        entry.state = "loaded"
+        entry.error = None
+        logging.info(f"Model loaded: {entry.handle.identifier} in {load_seconds:.2f}s")
+        return entry.handle
+
+    def get(self, name: str, loader: Optional[Callable[[], Any]] = None) -> ModelHandle:
+        """Return the handle for a model, loading it with the given loader on first use."""
+        entry = self._get_entry(name, loader)
+
+        # Fast path: the model has already been loaded by this process
+        if entry.handle is not None:
+            return entry.handle
+
+        with entry.lock:
+            if entry.handle is None:
+                self._load(entry)
+            return entry.handle
+
+    def reload(self, name: str) -> ModelHandle:
+        """Reload a registered model and bump its version."""
+        entry = self._get_entry(name)
+        with entry.lock:
+            return self._load(entry)
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and entry.handle is not None
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Load state and load times of every registered model."""
+        with self._entries_lock:
+            entries = list(self._entries.values())
+
+        return [
+            {
+                "name": entry.name,
+                "state": entry.state,
+                "version": entry.handle.version if entry.handle else None,
+                "identifier": entry.handle.identifier if entry.handle else None,
+                "loaded_at": entry.handle.loaded_at if entry.handle else None,
+                "load_seconds": entry.handle.load_seconds if entry.handle else None,
+                "error": entry.error,
+            }
+            for entry in entries
+        ]
@@ -1,5 +1,7 @@
 import logging
+from typing import List, Optional, Tuple
 
+from app.configurations.configurations import Configurations
 from app.models.nli_models.interfaces import NLIModelABC
 from transformers import pipeline
 
@@ -7,23 +9,127 @@ from transformers import pipeline
 class DistilBartNLIModel(NLIModelABC):
     """A class for performing Natural Language Inference (NLI) using the DistilBART model."""
 
+    _configurations = Configurations.NLIModels
+
     def __init__(self):
-        self._model = None
         self._model_name = "valhalla/distilbart-mnli-12-3"
         super().__init__()
 
-    def load(self):
+    def _load_model(self):
         """Loads the DistilBART MNLI model."""
-        if self._model is None:
-            logging.info(f"Loading DistilBART model: {self._model_name}...")
-            self._model = pipeline("text-classification", model=self._model_name)
+        logging.info(f"Loading DistilBART model: {self._model_name}...")
+        return pipeline("text-classification", model=self._model_name)
+
+    def load(self):
+        """Gets the DistilBART MNLI model from the model registry, loading it once per process."""
+        self._model_handle = self._model_registry.get(
+            self._model_name, self._load_model
+        )
+        self._model = self._model_handle.model
+
+    @property
+    def input_truncation(self):
+        return f"premise-first:{self._configurations.max_length}"
+
+    def _infer_batch(
+        self, pairs: List[Tuple[str, str]], batch_size: Optional[int] = None
+    ):
+        """Runs the model on (premise, hypothesis) pairs in length-bucketed batches.
+
+        Pairs are sorted by token length and grouped into batches whose padded size
+        stays under the configured token budget (batch_size caps the pairs per batch),
+        so short pairs are not padded to the length of long table rows. The results
+        are returned in the order of the pairs.
+        """
+        if not pairs:
+            return []
+
+        nli_inputs, token_lengths = self._prepare_inputs(pairs)
+        max_length = self._configurations.max_length
+
+        results = [None] * len(pairs)
+        for bucket in self._create_length_buckets(
+            token_lengths, self._configurations.batch_token_budget, batch_size
+        ):
+            bucket_results = self._model(
+                [nli_inputs[index] for index in bucket],
+                batch_size=len(bucket),
+                truncation=True,
+                max_length=max_length,
+            )
+            for index, result in zip(bucket, bucket_results):
+                # One top label per input, wrapped in a list on some versions
+                results[index] = result[0] if isinstance(result, list) else result
+
+        return results
+
+    def _prepare_inputs(self, pairs: List[Tuple[str, str]]):
+        """Formats the pairs and counts their tokens, truncating premises to max_length.
+
+        The premise is truncated rather than the formatted input, which would cut the
+        hypothesis off the end of a long premise.
+        """
+        tokenizer = self._model.tokenizer
+        max_length = self._configurations.max_length
+        special_tokens = tokenizer.num_special_tokens_to_add()
+
+        premises = [premise for premise, _ in pairs]
+        suffixes = [self._format_input("", hypothesis) for _, hypothesis in pairs]
+        premise_encodings = tokenizer(
+            premises,
+            add_special_tokens=False,
+            return_offsets_mapping=tokenizer.is_fast,
+        )
+        suffix_encodings = tokenizer(suffixes, add_special_tokens=False)
+
+        nli_inputs, token_lengths = [], []
+        for index, (premise, hypothesis) in enumerate(pairs):
+            premise_length = len(premise_encodings["input_ids"][index])
+            suffix_length = len(suffix_encodings["input_ids"][index])
+            kept_premise_tokens = max(max_length - suffix_length - special_tokens, 0)
+
+            # Slow tokenizers have no offsets, the pipeline truncation applies instead
+            if premise_length > kept_premise_tokens and tokenizer.is_fast:
+                offsets = premise_encodings["offset_mapping"][index]
+                premise = (
+                    premise[: offsets[kept_premise_tokens - 1][1]]
+                    if kept_premise_tokens
+                    else ""
+                )
+                premise_length = kept_premise_tokens
+
+            nli_inputs.append(self._format_input(premise, hypothesis))
+            token_lengths.append(
+                min(premise_length + suffix_length + special_tokens, max_length)
+            )
+
+        return nli_inputs, token_lengths
+
+    @staticmethod
+    def _create_length_buckets(
+        token_lengths: List[int], token_budget: int, max_batch_size: Optional[int]
+    ):
+        """Groups the indices, sorted by token length, into batches under the budget.
 
-    def infer(self, premise: str, hypothesis: str):
-        """Performs Natural Language Inference (NLI) on a premise and hypothesis."""
+        A batch costs its size times its longest input once padded. An input over the
+        budget on its own forms a single-input batch.
+        """
+        buckets, bucket = [], []
+        for index in sorted(range(len(token_lengths)), key=token_lengths.__getitem__):
+            # Sorted ascending, the current input is the longest of the bucket
+            padded_tokens = (len(bucket) + 1) * token_lengths[index]
+            if bucket and (
+                padded_tokens > token_budget
+                or (max_batch_size and len(bucket) >= max_batch_size)
+            ):
+                buckets.append(bucket)
+                bucket = []
+            bucket.append(index)
 
-        # Format the input for NLI
-        nli_input = f"{premise} [SEP] {hypothesis}"
+        if bucket:
+            buckets.append(bucket)
+        return buckets
 
-        # Run inference and return the result
-        result = self._model(nli_input)[0]
-        return result
+    @staticmethod
+    def _format_input(premise: str, hypothesis: str):
+        return f"{premise} [SEP] {hypothesis}"
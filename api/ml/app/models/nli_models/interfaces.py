@@ -1,12 +1,25 @@
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional, Tuple
+
+from app.models.model_registry import ModelHandle, ModelRegistry
+from app.repositories.nli_result_cache_repository.interfaces import (
+    NLIResultCacheRepositoryABC,
+)
+from app.repositories.nli_result_cache_repository.nli_result_cache_repository import (
+    NLIResultCacheRepository,
+)
 
 
 class NLIModelABC(ABC):
     _instance = None
+    _model_registry = ModelRegistry()
+    _model: Any = None
+    _model_handle: Optional[ModelHandle] = None
+    _result_cache: NLIResultCacheRepositoryABC = NLIResultCacheRepository()
 
     def __init__(self, *args, **kwargs):
-        self._model: Any = None
         self.load()
 
     def __new__(cls, *args, **kwargs):
@@ -14,12 +27,87 @@ class NLIModelABC(ABC):
             cls._instance = super(NLIModelABC, cls).__new__(cls)
         return cls._instance
 
-    @abstractmethod
     def infer(self, premise: str, hypothesis: str):
         """Performs Natural Language Inference (NLI) on a premise and hypothesis."""
+        return self.infer_batch([(premise, hypothesis)])[0]
+
+    def infer_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> List[Any]:
+        """Performs NLI on (premise, hypothesis) pairs, preserving their order.
+
+        The pairs are whitespace-normalized and looked up in the result cache by model
+        name and input truncation first, so only unique uncached pairs reach the model.
+        """
+        if not pairs:
+            return []
+
+        normalized_pairs = [
+            (self.normalize_text(premise), self.normalize_text(hypothesis))
+            for premise, hypothesis in pairs
+        ]
+        if not use_cache:
+            return self._infer_batch(normalized_pairs, batch_size)
+
+        keys = [self._create_result_cache_key(*pair) for pair in normalized_pairs]
+        nli_results = self._result_cache.get_many(list(dict.fromkeys(keys)))
+
+        missing_pairs = {
+            key: pair
+            for key, pair in zip(keys, normalized_pairs)
+            if key not in nli_results
+        }
+        if missing_pairs:
+            inferred_results = dict(
+                zip(
+                    missing_pairs,
+                    self._infer_batch(list(missing_pairs.values()), batch_size),
+                )
+            )
+            self._result_cache.set_many(inferred_results)
+            nli_results.update(inferred_results)
+
+        return [dict(nli_results[key]) for key in keys]
+
+    @abstractmethod
+    def _infer_batch(
+        self, pairs: List[Tuple[str, str]], batch_size: Optional[int] = None
+    ) -> List[Any]:
+        """Runs the model on (premise, hypothesis) pairs, preserving their order."""
         pass
 
     @abstractmethod
     def load(self):
         """Load the model (from disk or online source)."""
         pass
+
+    @staticmethod
+    def normalize_text(text: str):
+        return " ".join(text.split())
+
+    def _create_result_cache_key(self, premise: str, hypothesis: str):
+        # Scores depend on the truncated model input, not only on the pair
+        key_components = [self.model_name, self.input_truncation, premise, hypothesis]
+        return hashlib.sha256(json.dumps(key_components).encode()).hexdigest()
+
+    @classmethod
+    def get_result_cache_stats(cls):
+        return cls._result_cache.get_stats()
+
+    @property
+    def model_name(self) -> str:
+        """Registry name of the loaded model, stable across reloads and processes."""
+        return self._model_handle.name if self._model_handle else "unloaded"
+
+    @property
+    def input_truncation(self) -> str:
+        """Truncation applied to the pairs before inference, part of the cache key."""
+        return "none"
+
+    @property
+    def model_identifier(self) -> str:
+        """Versioned identifier of the loaded model."""
+        return self._model_handle.identifier if self._model_handle else "unloaded"
@@ -1,5 +1,7 @@
+import hashlib
 import os
 import json
+import threading
 
 from app.configurations.configurations import Configurations
 from .interfaces import EvaluationCriteriaRepositoryABC
@@ -8,6 +10,9 @@ import logging
 
 class EvaluationCriteriaRepository(EvaluationCriteriaRepositoryABC):
     _configurations = Configurations.SectorEvaluationCriterias
+    # Checksums by file path, reused while the file's size and mtime are unchanged
+    _checksums = {}
+    _checksums_lock = threading.Lock()
 
     def _get_filename(self, sector: str) -> str:
         return self._configurations.sector_evaluation_criteria_map[sector]
@@ -30,3 +35,24 @@ class EvaluationCriteriaRepository(EvaluationCriteriaRepositoryABC):
             logging.info("Sector evaluation criteria file loaded successfully")
 
         return evaluation_criteria
+
+    def get_checksum(self, sector: str):
+        filepath = self._get_filepath(self._get_filename(sector))
+
+        if not os.path.exists(filepath):
+            logging.error(f"File not found: {filepath}")
+            raise FileNotFoundError(f"File not found: {filepath}")
+
+        stat = os.stat(filepath)
+        file_version = (stat.st_size, stat.st_mtime_ns)
+        with self._checksums_lock:
+            cached = self._checksums.get(filepath)
+            if cached is not None and cached[0] == file_version:
+                return cached[1]
+
+        with open(filepath, "rb") as json_file:
+            checksum = hashlib.sha256(json_file.read()).hexdigest()
+
+        with self._checksums_lock:
+            self._checksums[filepath] = (file_version, checksum)
+        return checksum
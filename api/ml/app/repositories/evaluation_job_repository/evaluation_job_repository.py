@@ -0,0 +1,199 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+from app.configurations.configurations import Configurations
+
+from .interfaces import EvaluationJobRepositoryABC
+
+_JOB_COLUMNS = (
+    "job_id, status, stage, sector, filename, document_path, result, error, "
+    "attempts, worker_pid, created_at, started_at, finished_at, updated_at"
+)
+
+
+class EvaluationJobRepository(EvaluationJobRepositoryABC):
+    """SQLite store of evaluation jobs, shared by the API and the worker processes.
+
+    The jobs table is also the queue: workers claim the oldest queued job with a
+    single UPDATE statement, which SQLite serializes across processes.
+    """
+
+    _configurations = Configurations.EvaluationJobs
+    _connection_lock = threading.Lock()
+    _connection: Optional[sqlite3.Connection] = None
+    _connection_pid: Optional[int] = None
+
+    @classmethod
+    def _get_connection(cls):
+        # Connections must not cross a fork, each process opens its own
+        if cls._connection is None or cls._connection_pid != os.getpid():
+            database_path = cls._configurations.database_path
+            os.makedirs(os.path.dirname(database_path) or ".", exist_ok=True)
+
+            connection = sqlite3.connect(
+                database_path,
+                timeout=30,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluation_jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, stage TEXT, "
+                "sector TEXT NOT NULL, filename TEXT, document_path TEXT NOT NULL, "
+                "result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+                "worker_pid INTEGER, created_at REAL NOT NULL, started_at REAL, "
+                "finished_at REAL, updated_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS evaluation_jobs_status "
+                "ON evaluation_jobs (status, created_at)"
+            )
+            cls._connection = connection
+            cls._connection_pid = os.getpid()
+
+        return cls._connection
+
+    def _execute(self, statement: str, parameters=()):
+        with self._connection_lock:
+            cursor = self._get_connection().execute(statement, parameters)
+            return cursor.fetchall(), cursor.rowcount
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row):
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def create(
+        self,
+        job_id: str,
+        sector: str,
+        filename: str,
+        document_path: str,
+        max_queued_jobs: int,
+    ):
+        """Queues a job unless max_queued_jobs jobs are already queued."""
+        now = time.time()
+        _, rowcount = self._execute(
+            "INSERT INTO evaluation_jobs "
+            "(job_id, status, stage, sector, filename, document_path, created_at, "
+            "updated_at) "
+            "SELECT ?, 'queued', 'queued', ?, ?, ?, ?, ? "
+            "WHERE (SELECT COUNT(*) FROM evaluation_jobs "
+            "WHERE status = 'queued') < ?",
+            (job_id, sector, filename, document_path, now, now, max_queued_jobs),
+        )
+        return rowcount == 1
+
+    def get(self, job_id: str):
+        rows, _ = self._execute(
+            f"SELECT {_JOB_COLUMNS}, "
+            "(SELECT COUNT(*) FROM evaluation_jobs AS queued "
+            "WHERE queued.status = 'queued' "
+            "AND queued.created_at <= evaluation_jobs.created_at) AS queue_position "
+            "FROM evaluation_jobs WHERE job_id = ?",
+            (job_id,),
+        )
+        if not rows:
+            return None
+
+        job = self._to_job(rows[0])
+        if job["status"] != "queued":
+            job["queue_position"] = None
+        return job
+
+    def claim(self, worker_pid: int):
+        """Marks the oldest queued job as running by the given worker and returns it."""
+        now = time.time()
+        rows, _ = self._execute(
+            "UPDATE evaluation_jobs SET status = 'running', stage = 'started', "
+            "worker_pid = ?, attempts = attempts + 1, started_at = ?, updated_at = ? "
+            "WHERE job_id = (SELECT job_id FROM evaluation_jobs "
+            "WHERE status = 'queued' ORDER BY created_at LIMIT 1) "
+            f"RETURNING {_JOB_COLUMNS}",
+            (worker_pid, now, now),
+        )
+        return self._to_job(rows[0]) if rows else None
+
+    def update_stage(self, job_id: str, stage: str):
+        self._execute(
+            "UPDATE evaluation_jobs SET stage = ?, updated_at = ? WHERE job_id = ?",
+            (stage, time.time(), job_id),
+        )
+
+    def _finish(self, job_id: str, status: str, result=None, error=None):
+        now = time.time()
+        self._execute(
+            "UPDATE evaluation_jobs SET status = ?, stage = ?, result = ?, error = ?, "
+            "finished_at = ?, updated_at = ? WHERE job_id = ?",
+            (status, status, result, error, now, now, job_id),
+        )
+
+    def complete(self, job_id: str, evaluation_result):
+        self._finish(job_id, "succeeded", result=json.dumps(evaluation_result))
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, "failed", error=error)
+
+    def get_running_worker_pids(self):
+        rows, _ = self._execute(
+            "SELECT DISTINCT worker_pid FROM evaluation_jobs "
+            "WHERE status = 'running' AND worker_pid IS NOT NULL"
+        )
+        return [row["worker_pid"] for row in rows]
+
+    def requeue_orphaned(self, alive_worker_pids: Iterable[int], max_attempts: int):
+        """Queues the running jobs of dead workers again, failing those out of attempts.
+
+        Returns the jobs that failed.
+        """
+        alive_worker_pids = list(alive_worker_pids)
+        placeholders = ",".join("?" * len(alive_worker_pids))
+        orphaned_condition = (
+            f"status = 'running' AND worker_pid NOT IN ({placeholders})"
+            if alive_worker_pids
+            else "status = 'running'"
+        )
+        now = time.time()
+
+        failed_rows, _ = self._execute(
+            "UPDATE evaluation_jobs SET status = 'failed', stage = 'failed', "
+            "error = 'Evaluation worker stopped while evaluating the job', "
+            "finished_at = ?, updated_at = ? "
+            f"WHERE {orphaned_condition} AND attempts >= ? "
+            f"RETURNING {_JOB_COLUMNS}",
+            (now, now, *alive_worker_pids, max_attempts),
+        )
+        self._execute(
+            "UPDATE evaluation_jobs SET status = 'queued', stage = 'queued', "
+            f"worker_pid = NULL, updated_at = ? WHERE {orphaned_condition}",
+            (now, *alive_worker_pids),
+        )
+        return [self._to_job(row) for row in failed_rows]
+
+    def delete_finished(self, finished_before: float):
+        _, rowcount = self._execute(
+            "DELETE FROM evaluation_jobs "
+            "WHERE status IN ('succeeded', 'failed') AND finished_at < ?",
+            (finished_before,),
+        )
+        return rowcount
+
+    def get_stats(self):
+        rows, _ = self._execute(
+            "SELECT status, COUNT(*) AS jobs FROM evaluation_jobs GROUP BY status"
+        )
+        return {
+            "jobs": {
+                status: 0 for status in ("queued", "running", "succeeded", "failed")
+            }
+            | {row["status"]: row["jobs"] for row in rows},
+            "max_queued_jobs": self._configurations.max_queued_jobs,
+            "worker_processes": self._configurations.worker_processes,
+        }
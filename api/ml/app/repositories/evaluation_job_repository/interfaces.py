@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class EvaluationJobRepositoryABC(ABC):
+    @abstractmethod
+    def create(
+        self,
+        job_id: str,
+        sector: str,
+        filename: str,
+        document_path: str,
+        max_queued_jobs: int,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def claim(self, worker_pid: int) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def update_stage(self, job_id: str, stage: str):
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, evaluation_result: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str):
+        pass
+
+    @abstractmethod
+    def get_running_worker_pids(self) -> List[int]:
+        pass
+
+    @abstractmethod
+    def requeue_orphaned(
+        self, alive_worker_pids: Iterable[int], max_attempts: int
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def delete_finished(self, finished_before: float) -> int:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
@@ -0,0 +1,126 @@
+import json
+import logging
+import os
+import threading
+
+from app.configurations.configurations import Configurations
+from app.utils.lru_cache import LRUCache
+
+from .interfaces import EvaluationResultCacheRepositoryABC
+
+
+class EvaluationResultCacheRepository(EvaluationResultCacheRepositoryABC):
+    """Two-tier evaluation result cache: an in-memory LRU backed by an optional on-disk store.
+
+    Both tiers are shared by every instance in the process. Results are stored as JSON so
+    each hit hands out a fresh copy that callers are free to mutate.
+    """
+
+    _configurations = Configurations.EvaluationResultCache
+    _memory_cache = LRUCache(_configurations.memory_max_entries)
+    _disk_lock = threading.Lock()
+    _disk_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _get_filepath(self, key: str):
+        return os.path.join(self._configurations.disk_directory_path, f"{key}.json")
+
+    def _read_disk(self, key: str):
+        filepath = self._get_filepath(key)
+
+        try:
+            with open(filepath, "r") as cache_file:
+                serialized_result = cache_file.read()
+            # Refresh the modification time so eviction drops the least recently used entries
+            os.utime(filepath)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logging.warning(f"Failed to read cached evaluation result: {str(e)}")
+            return None
+
+        return serialized_result
+
+    def _write_disk(self, key: str, serialized_result: str):
+        directory_path = self._configurations.disk_directory_path
+        filepath = self._get_filepath(key)
+        temp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            os.makedirs(directory_path, exist_ok=True)
+            with open(temp_filepath, "w") as cache_file:
+                cache_file.write(serialized_result)
+            os.replace(temp_filepath, filepath)
+        except OSError as e:
+            logging.warning(f"Failed to write cached evaluation result: {str(e)}")
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+            return
+
+        self._evict_disk()
+
+    def _get_disk_entries(self):
+        directory_path = self._configurations.disk_directory_path
+        if not os.path.exists(directory_path):
+            return []
+
+        entries = []
+        for entry in os.scandir(directory_path):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict_disk(self):
+        """Removes the least recently used files until the store fits in disk_max_bytes."""
+        with self._disk_lock:
+            entries = sorted(self._get_disk_entries())
+            total_bytes = sum(size for _, size, _ in entries)
+
+            for _, size, filepath in entries:
+                if total_bytes <= self._configurations.disk_max_bytes:
+                    break
+                try:
+                    os.remove(filepath)
+                    total_bytes -= size
+                    self._disk_stats["evictions"] += 1
+                except FileNotFoundError:
+                    pass
+
+    def get(self, key: str):
+        serialized_result = self._memory_cache.get(key)
+
+        if serialized_result is None and self._configurations.disk_enabled:
+            serialized_result = self._read_disk(key)
+            self._disk_stats["hits" if serialized_result else "misses"] += 1
+            if serialized_result is not None:
+                self._memory_cache.set(key, serialized_result)
+
+        if serialized_result is None:
+            return None
+        return json.loads(serialized_result)
+
+    def set(self, key: str, evaluation_result):
+        try:
+            serialized_result = json.dumps(evaluation_result)
+        except (TypeError, ValueError) as e:
+            logging.warning(f"Evaluation result is not cacheable: {str(e)}")
+            return
+
+        self._memory_cache.set(key, serialized_result)
+        if self._configurations.disk_enabled:
+            self._write_disk(key, serialized_result)
+
+    def get_stats(self):
+        disk_entries = (
+            self._get_disk_entries() if self._configurations.disk_enabled else []
+        )
+        return {
+            "memory": self._memory_cache.stats(),
+            "disk": {
+                "enabled": self._configurations.disk_enabled,
+                "entries": len(disk_entries),
+                "bytes": sum(size for _, size, _ in disk_entries),
+                "max_bytes": self._configurations.disk_max_bytes,
+                **self._disk_stats,
+            },
+        }
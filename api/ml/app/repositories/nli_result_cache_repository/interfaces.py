@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class NLIResultCacheRepositoryABC(ABC):
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def set_many(self, nli_results: Dict[str, Dict[str, Any]]):
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
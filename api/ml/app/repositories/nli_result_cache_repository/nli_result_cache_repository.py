@@ -0,0 +1,203 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.configurations.configurations import Configurations
+from app.utils.lru_cache import LRUCache
+
+from .interfaces import NLIResultCacheRepositoryABC
+
+# Stays under SQLite's default limit of host parameters per statement
+_MAX_QUERY_KEYS = 500
+
+
+class NLIResultCacheRepository(NLIResultCacheRepositoryABC):
+    """Two-tier NLI result cache: an in-memory LRU backed by an optional SQLite store.
+
+    Both tiers are shared by every instance in the process, the SQLite store by every
+    process using the same database file. Rows record their size and last access, and
+    the least recently used rows are evicted once the store exceeds disk_max_bytes.
+    """
+
+    _configurations = Configurations.NLIResultCache
+    _memory_cache = LRUCache(_configurations.memory_max_entries)
+    _disk_lock = threading.Lock()
+    _disk_connection: Optional[sqlite3.Connection] = None
+    _disk_connection_pid: Optional[int] = None
+    _disk_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @classmethod
+    def _get_connection(cls):
+        # Connections must not cross a fork, each worker process opens its own
+        if cls._disk_connection is None or cls._disk_connection_pid != os.getpid():
+            database_path = cls._configurations.disk_database_path
+            os.makedirs(os.path.dirname(database_path) or ".", exist_ok=True)
+
+            connection = sqlite3.connect(
+                database_path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS nli_results ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS nli_results_accessed_at "
+                "ON nli_results (accessed_at)"
+            )
+            connection.commit()
+            cls._disk_connection = connection
+            cls._disk_connection_pid = os.getpid()
+
+        return cls._disk_connection
+
+    @staticmethod
+    def _chunk(keys: List[str]):
+        for start in range(0, len(keys), _MAX_QUERY_KEYS):
+            yield keys[start : start + _MAX_QUERY_KEYS]
+
+    def _read_disk(self, keys: List[str]):
+        serialized_results = {}
+
+        with self._disk_lock:
+            try:
+                connection = self._get_connection()
+                with connection:
+                    for chunk in self._chunk(keys):
+                        placeholders = ",".join("?" * len(chunk))
+                        serialized_results.update(
+                            connection.execute(
+                                "SELECT key, result FROM nli_results "
+                                f"WHERE key IN ({placeholders})",
+                                chunk,
+                            ).fetchall()
+                        )
+
+                    # Refresh the access time used by the least recently used eviction
+                    hit_keys = list(serialized_results)
+                    for chunk in self._chunk(hit_keys):
+                        placeholders = ",".join("?" * len(chunk))
+                        connection.execute(
+                            "UPDATE nli_results SET accessed_at = ? "
+                            f"WHERE key IN ({placeholders})",
+                            [time.time(), *chunk],
+                        )
+            except (sqlite3.Error, OSError) as e:
+                logging.warning(f"Failed to read cached NLI results: {str(e)}")
+                return {}
+
+            self._disk_stats["hits"] += len(serialized_results)
+            self._disk_stats["misses"] += len(keys) - len(serialized_results)
+
+        return serialized_results
+
+    def _write_disk(self, serialized_results: Dict[str, str]):
+        accessed_at = time.time()
+        rows = [
+            (key, serialized_result, len(key) + len(serialized_result), accessed_at)
+            for key, serialized_result in serialized_results.items()
+        ]
+
+        with self._disk_lock:
+            try:
+                connection = self._get_connection()
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO nli_results "
+                        "(key, result, size, accessed_at) VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._evict_disk(connection)
+            except (sqlite3.Error, OSError) as e:
+                logging.warning(f"Failed to write cached NLI results: {str(e)}")
+
+    def _evict_disk(self, connection: sqlite3.Connection):
+        """Deletes the least recently used rows until the store fits in disk_max_bytes."""
+        (total_bytes,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM nli_results"
+        ).fetchone()
+        if total_bytes <= self._configurations.disk_max_bytes:
+            return
+
+        evicted_keys = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM nli_results ORDER BY accessed_at"
+        ):
+            if total_bytes <= self._configurations.disk_max_bytes:
+                break
+            evicted_keys.append(key)
+            total_bytes -= size
+
+        for chunk in self._chunk(evicted_keys):
+            placeholders = ",".join("?" * len(chunk))
+            connection.execute(
+                f"DELETE FROM nli_results WHERE key IN ({placeholders})", chunk
+            )
+        self._disk_stats["evictions"] += len(evicted_keys)
+
+    def get_many(self, keys: List[str]):
+        """Returns the cached results of the given keys, leaving out the misses."""
+        nli_results, missing_keys = {}, []
+        for key in keys:
+            nli_result = self._memory_cache.get(key)
+            if nli_result is None:
+                missing_keys.append(key)
+            else:
+                nli_results[key] = dict(nli_result)
+
+        if missing_keys and self._configurations.disk_enabled:
+            for key, serialized_result in self._read_disk(missing_keys).items():
+                nli_result = json.loads(serialized_result)
+                self._memory_cache.set(key, nli_result)
+                nli_results[key] = dict(nli_result)
+
+        return nli_results
+
+    def set_many(self, nli_results):
+        serialized_results = {}
+        for key, nli_result in nli_results.items():
+            try:
+                serialized_results[key] = json.dumps(nli_result)
+            except (TypeError, ValueError) as e:
+                logging.warning(f"NLI result is not cacheable: {str(e)}")
+                continue
+            self._memory_cache.set(key, dict(nli_result))
+
+        if serialized_results and self._configurations.disk_enabled:
+            self._write_disk(serialized_results)
+
+    def _get_disk_usage(self):
+        with self._disk_lock:
+            try:
+                return (
+                    self._get_connection()
+                    .execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM nli_results"
+                    )
+                    .fetchone()
+                )
+            except (sqlite3.Error, OSError) as e:
+                logging.warning(f"Failed to read NLI result cache usage: {str(e)}")
+                return 0, 0
+
+    def get_stats(self):
+        entries, total_bytes = (
+            self._get_disk_usage() if self._configurations.disk_enabled else (0, 0)
+        )
+        requests = self._disk_stats["hits"] + self._disk_stats["misses"]
+        return {
+            "memory": self._memory_cache.stats(),
+            "disk": {
+                "enabled": self._configurations.disk_enabled,
+                "entries": entries,
+                "bytes": total_bytes,
+                "max_bytes": self._configurations.disk_max_bytes,
+                **self._disk_stats,
+                "hit_rate": self._disk_stats["hits"] / requests if requests else 0.0,
+            },
+        }
@@ -10,3 +10,6 @@ class EvaluationCriteriaService(EvaluationCriteriaServiceABC):
 
     def get_json(self, sector: str):
         return self._evaluation_criteria_repository.get_json(sector)
+
+    def get_checksum(self, sector: str):
+        return self._evaluation_criteria_repository.get_checksum(sector)
@@ -5,3 +5,7 @@ class EvaluationCriteriaServiceABC(ABC):
     @abstractmethod
     def get_json(self, sector: str):
         pass
+
+    @abstractmethod
+    def get_checksum(self, sector: str) -> str:
+        pass
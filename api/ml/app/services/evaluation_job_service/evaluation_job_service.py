@@ -0,0 +1,141 @@
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import Any, Iterable
+
+from app.configurations.configurations import Configurations
+from app.repositories.evaluation_job_repository.interfaces import (
+    EvaluationJobRepositoryABC,
+)
+
+from .interfaces import EvaluationJobServiceABC
+
+# Job fields returned by the API (the document path and worker pid stay internal)
+_PUBLIC_JOB_FIELDS = (
+    "job_id",
+    "status",
+    "stage",
+    "sector",
+    "filename",
+    "queue_position",
+    "attempts",
+    "created_at",
+    "started_at",
+    "finished_at",
+    "error",
+    "result",
+)
+
+
+class EvaluationJobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue holds max_queued_jobs jobs."""
+
+
+class EvaluationJobService(EvaluationJobServiceABC):
+    _configurations = Configurations.EvaluationJobs
+
+    def __init__(self, evaluation_job_repository: EvaluationJobRepositoryABC):
+        self._evaluation_job_repository = evaluation_job_repository
+
+    def _save_document(self, pdf_file: Any, job_id: str):
+        """Copies the upload where the worker processes can read it."""
+        directory_path = self._configurations.documents_directory_path
+        os.makedirs(directory_path, exist_ok=True)
+
+        document_path = os.path.join(directory_path, f"{job_id}.pdf")
+        temp_document_path = f"{document_path}.tmp"
+        pdf_file.stream.seek(0)
+        with open(temp_document_path, "wb") as document_file:
+            shutil.copyfileobj(pdf_file.stream, document_file)
+        os.replace(temp_document_path, document_path)
+        return document_path
+
+    @staticmethod
+    def _delete_document(job):
+        try:
+            os.remove(job["document_path"])
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Failed to delete evaluation job document: {str(e)}")
+
+    def submit(self, pdf_file: Any, sector: str):
+        job_id = uuid.uuid4().hex
+        document_path = self._save_document(pdf_file, job_id)
+
+        if not self._evaluation_job_repository.create(
+            job_id=job_id,
+            sector=sector,
+            filename=pdf_file.filename,
+            document_path=document_path,
+            max_queued_jobs=self._configurations.max_queued_jobs,
+        ):
+            self._delete_document({"document_path": document_path})
+            raise EvaluationJobQueueFullError(
+                f"{self._configurations.max_queued_jobs} evaluation jobs already queued"
+            )
+
+        logging.info(f"Evaluation job queued: {job_id} ({pdf_file.filename})")
+        return self.get(job_id)
+
+    def get(self, job_id: str):
+        job = self._evaluation_job_repository.get(job_id)
+        if job is None:
+            return None
+        return {field: job[field] for field in _PUBLIC_JOB_FIELDS}
+
+    def claim(self, worker_pid: int):
+        return self._evaluation_job_repository.claim(worker_pid)
+
+    def update_stage(self, job_id: str, stage: str):
+        self._evaluation_job_repository.update_stage(job_id, stage)
+
+    def complete(self, job, evaluation_result):
+        self._evaluation_job_repository.complete(job["job_id"], evaluation_result)
+        self._delete_document(job)
+        logging.info(f"Evaluation job succeeded: {job['job_id']}")
+
+    def fail(self, job, error: str):
+        self._evaluation_job_repository.fail(job["job_id"], error)
+        self._delete_document(job)
+        logging.error(f"Evaluation job failed: {job['job_id']} ({error})")
+
+    @staticmethod
+    def _is_process_alive(pid: int):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # The process exists but belongs to another user
+            pass
+        return True
+
+    def recover(self, alive_worker_pids: Iterable[int]):
+        """Queues the jobs of stopped workers again, or fails them out of attempts."""
+        alive_worker_pids = set(alive_worker_pids)
+        # Workers of a killed supervisor may still be finishing their job
+        alive_worker_pids.update(
+            pid
+            for pid in self._evaluation_job_repository.get_running_worker_pids()
+            if pid not in alive_worker_pids and self._is_process_alive(pid)
+        )
+
+        for job in self._evaluation_job_repository.requeue_orphaned(
+            alive_worker_pids, self._configurations.max_attempts
+        ):
+            self._delete_document(job)
+            logging.error(f"Evaluation job failed: {job['job_id']} ({job['error']})")
+
+    def purge_finished(self):
+        """Deletes the finished jobs older than result_ttl_seconds."""
+        deleted_jobs = self._evaluation_job_repository.delete_finished(
+            time.time() - self._configurations.result_ttl_seconds
+        )
+        if deleted_jobs:
+            logging.info(f"Deleted {deleted_jobs} finished evaluation jobs")
+
+    def get_stats(self):
+        return self._evaluation_job_repository.get_stats()
@@ -0,0 +1,141 @@
+import atexit
+import fcntl
+import logging
+import multiprocessing
+import os
+import threading
+from typing import Callable, List, Optional
+
+from app.configurations.configurations import Configurations
+
+from .interfaces import EvaluationJobServiceABC
+
+
+class EvaluationJobWorkerPool:
+    """Runs and supervises the evaluation worker processes of this host.
+
+    Every API worker process may start the pool, but only the first one to lock the
+    job database's lock file supervises it, so the host runs worker_processes workers
+    in total. The supervisor restarts workers that exit, queues the jobs they were
+    running again and deletes expired jobs. Workers receive the supervisor's pid and
+    are expected to stop once it is no longer their parent.
+    """
+
+    _configurations = Configurations.EvaluationJobs
+    # Cleared when this process cannot take part in supervising the workers
+    _started = True
+
+    def __init__(
+        self,
+        evaluation_job_service: EvaluationJobServiceABC,
+        worker_target: Callable[[int], None],
+    ):
+        self._evaluation_job_service = evaluation_job_service
+        self._worker_target = worker_target
+        # Spawned workers do not inherit the parent's threads, locks and models
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: List[multiprocessing.Process] = []
+        self._lock_file = None
+        self._stopped = threading.Event()
+
+    def _acquire_supervisor_lock(self):
+        lock_path = f"{self._configurations.database_path}.lock"
+        os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+
+        lock_file = open(lock_path, "w")
+        try:
+            # Released by the operating system when the supervising process exits
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        return True
+
+    def start(self):
+        """Starts the workers unless another process on this host supervises them."""
+        if self._configurations.worker_processes <= 0:
+            EvaluationJobWorkerPool._started = False
+            return False
+
+        try:
+            acquired = self._acquire_supervisor_lock()
+        except OSError as e:
+            # The API keeps serving synchronous evaluations without job workers
+            logging.error(f"Failed to start evaluation job workers: {str(e)}")
+            EvaluationJobWorkerPool._started = False
+            return False
+
+        if not acquired:
+            logging.info("Evaluation job workers are supervised by another process")
+            return False
+
+        atexit.register(self.stop)
+        threading.Thread(
+            target=self._supervise, name="evaluation-job-supervisor", daemon=True
+        ).start()
+        logging.info(
+            f"Started evaluation job supervisor with "
+            f"{self._configurations.worker_processes} workers"
+        )
+        return True
+
+    @classmethod
+    def is_available(cls):
+        """Whether jobs submitted through this process will be picked up by a worker.
+
+        False when the workers are disabled or failed to start in this process.
+        Otherwise this process or another one on the host supervises them.
+        """
+        return cls._configurations.worker_processes > 0 and cls._started
+
+    def _start_worker(self):
+        # Not a daemon, workers start process pools of their own (PDF extraction)
+        process = self._context.Process(
+            target=self._worker_target,
+            args=(os.getpid(),),
+            name="evaluation-job-worker",
+        )
+        process.start()
+        logging.info(f"Started evaluation job worker: {process.pid}")
+        return process
+
+    def _restart_stopped_workers(self):
+        processes = []
+        for process in self._processes:
+            if process.is_alive():
+                processes.append(process)
+            else:
+                logging.warning(
+                    f"Evaluation job worker {process.pid} exited "
+                    f"(exit code: {process.exitcode}), restarting"
+                )
+
+        while (
+            len(processes) < self._configurations.worker_processes
+            and not self._stopped.is_set()
+        ):
+            processes.append(self._start_worker())
+        self._processes = processes
+
+    def _supervise(self):
+        while not self._stopped.is_set():
+            try:
+                self._restart_stopped_workers()
+                self._evaluation_job_service.recover(
+                    process.pid for process in self._processes if process.is_alive()
+                )
+                self._evaluation_job_service.purge_finished()
+            except Exception as e:
+                logging.error(f"Evaluation job supervisor failed: {str(e)}")
+
+            self._stopped.wait(self._configurations.supervisor_interval_seconds)
+
+    def stop(self, timeout: Optional[float] = 10):
+        self._stopped.set()
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join(timeout)
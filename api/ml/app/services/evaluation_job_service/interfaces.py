@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional
+
+
+class EvaluationJobServiceABC(ABC):
+    @abstractmethod
+    def submit(self, pdf_file: Any, sector: str) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def claim(self, worker_pid: int) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def update_stage(self, job_id: str, stage: str):
+        pass
+
+    @abstractmethod
+    def complete(self, job: Dict[str, Any], evaluation_result: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def fail(self, job: Dict[str, Any], error: str):
+        pass
+
+    @abstractmethod
+    def recover(self, alive_worker_pids: Iterable[int]):
+        pass
+
+    @abstractmethod
+    def purge_finished(self):
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
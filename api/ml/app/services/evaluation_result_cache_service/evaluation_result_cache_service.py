@@ -0,0 +1,59 @@
+import hashlib
+import json
+import logging
+from typing import BinaryIO, List
+
+from app.repositories.evaluation_result_cache_repository.interfaces import (
+    EvaluationResultCacheRepositoryABC,
+)
+
+from .interfaces import EvaluationResultCacheServiceABC
+
+_DOCUMENT_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class EvaluationResultCacheService(EvaluationResultCacheServiceABC):
+    def __init__(
+        self, evaluation_result_cache_repository: EvaluationResultCacheRepositoryABC
+    ):
+        self._evaluation_result_cache_repository = evaluation_result_cache_repository
+
+    @staticmethod
+    def _hash_document(document_stream: BinaryIO):
+        """Hashes the document in fixed-size chunks and rewinds the stream."""
+        document_hash = hashlib.sha256()
+        document_stream.seek(0)
+        while chunk := document_stream.read(_DOCUMENT_HASH_CHUNK_BYTES):
+            document_hash.update(chunk)
+        document_stream.seek(0)
+        return document_hash.hexdigest()
+
+    def create_key(
+        self,
+        document_stream: BinaryIO,
+        sector: str,
+        criteria_checksum: str,
+        model_identifiers: List[str],
+    ):
+        """Content-addressed key of an evaluation: document, sector, criteria and models."""
+        key_components = {
+            "document": self._hash_document(document_stream),
+            "sector": sector,
+            "criteria": criteria_checksum,
+            "models": sorted(model_identifiers),
+        }
+        return hashlib.sha256(
+            json.dumps(key_components, sort_keys=True).encode()
+        ).hexdigest()
+
+    def get(self, key: str):
+        evaluation_result = self._evaluation_result_cache_repository.get(key)
+        if evaluation_result is not None:
+            logging.info(f"Evaluation result cache hit: {key}")
+        return evaluation_result
+
+    def set(self, key: str, evaluation_result):
+        self._evaluation_result_cache_repository.set(key, evaluation_result)
+
+    def get_stats(self):
+        return self._evaluation_result_cache_repository.get_stats()
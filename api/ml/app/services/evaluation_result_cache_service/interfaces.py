@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, List, Optional
+
+
+class EvaluationResultCacheServiceABC(ABC):
+    @abstractmethod
+    def create_key(
+        self,
+        document_stream: BinaryIO,
+        sector: str,
+        criteria_checksum: str,
+        model_identifiers: List[str],
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, evaluation_result: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
@@ -0,0 +1,140 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.utils.cpu_governor import CpuGovernor
+
+
+class _CriteriaNode:
+    """A section or criterion of the dependency graph, finished once its children are."""
+
+    def __init__(self, criterion: Optional[dict], parent: Optional["_CriteriaNode"]):
+        self.criterion = criterion
+        self.parent = parent
+        self.pending_children = 0
+        self.score_sum = 0
+
+
+class _CriteriaJob:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.evaluation_score = 0
+        self.error: Optional[BaseException] = None
+
+
+class CriteriaScheduler:
+    """Process-wide scheduler that evaluates criteria trees on one bounded worker pool.
+
+    Each request's sections are flattened into a dependency graph: the end-level
+    criteria are the tasks and every mid-level criterion and section is summed once
+    its last child finishes. Only the end-level criteria occupy pool workers, so
+    nested criteria never block a worker waiting on their children, and the sections
+    of every request share the same workers.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(CriteriaScheduler, cls).__new__(cls)
+            cls._instance._executor = None
+            cls._instance._executor_lock = threading.Lock()
+        return cls._instance
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                max_workers = CpuGovernor.get_budget()["evaluation_workers"]
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="criteria-scheduler"
+                )
+                logging.info(f"Started criteria scheduler with {max_workers} workers")
+            return self._executor
+
+    def _build_graph(self, sections: List[dict]):
+        """Flattens the sections into nodes, returning the root and the end-level nodes."""
+        root = _CriteriaNode(None, None)
+        leaves, empty_nodes = [], []
+
+        def add_node(criterion: dict, parent: _CriteriaNode, children: List[dict]):
+            node = _CriteriaNode(criterion, parent)
+            parent.pending_children += 1
+            for child in children:
+                add_node(child, node, child.get("sub_criteria") or [])
+
+            if node.pending_children == 0:
+                # Sections without criteria score 0, end-level criteria are the tasks
+                (empty_nodes if parent is root else leaves).append(node)
+
+        for section in sections:
+            add_node(section, root, section["criteria"])
+        return root, leaves, empty_nodes
+
+    def _complete(self, job: _CriteriaJob, node: _CriteriaNode, score):
+        """Records a node's score and sums every ancestor whose children are all done."""
+        while node.parent is not None:
+            node.criterion["evaluation_score"] = score
+            parent = node.parent
+            with job.lock:
+                parent.score_sum += score
+                parent.pending_children -= 1
+                if parent.pending_children:
+                    return
+            node, score = parent, parent.score_sum
+
+        job.evaluation_score = score
+        job.done.set()
+
+    def _fail(self, job: _CriteriaJob, error: BaseException):
+        with job.lock:
+            if job.error is None:
+                job.error = error
+        job.done.set()
+
+    def _run_task(
+        self,
+        job: _CriteriaJob,
+        node: _CriteriaNode,
+        evaluate_criterion: Callable[[dict], Tuple[Any, Any]],
+    ):
+        # Tasks still queued after a failure of their request are skipped
+        if job.error is not None:
+            return
+
+        try:
+            evaluation_result, evaluation_score = evaluate_criterion(node.criterion)
+            node.criterion["evaluation_result"] = evaluation_result
+            self._complete(job, node, evaluation_score)
+        except Exception as e:
+            self._fail(job, e)
+
+    def run(
+        self,
+        sections: List[dict],
+        evaluate_criterion: Callable[[dict], Tuple[Any, Any]],
+    ):
+        """Evaluates every end-level criterion of the sections and sums the scores upwards.
+
+        evaluate_criterion returns the evaluation result and score of an end-level
+        criterion. Mid-level criteria and sections get the raw sum of their children's
+        scores, and the total of the sections is returned. The first error of a task
+        is raised in the calling thread.
+        """
+        job = _CriteriaJob()
+        root, leaves, empty_nodes = self._build_graph(sections)
+        if root.pending_children == 0:
+            return 0
+
+        for node in empty_nodes:
+            self._complete(job, node, 0)
+
+        executor = self._get_executor()
+        for node in leaves:
+            executor.submit(self._run_task, job, node, evaluate_criterion)
+
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.evaluation_score
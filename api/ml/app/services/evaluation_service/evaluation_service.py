@@ -1,26 +1,72 @@
-from concurrent.futures import ThreadPoolExecutor
+import logging
+from typing import List, Optional
+
 import numpy as np
 from spacy.tokens import Doc
+from app.configurations.configurations import Configurations
+from app.factories.nli_model_factory import NLIModelFactory
 from app.models.embedding_models.interfaces import EmbeddingModelABC
-from app.models.nli_models.distilbart_nli_model import DistilBartNLIModel
 from app.utils.cosine_similarity_strategy.pytorch_cosine_similarity_strategy import (
     PytorchCosineSimilarityStrategy,
 )
+from .criteria_scheduler import CriteriaScheduler
 from .evaluator import Evaluator
+from .question_embedding_index import QuestionEmbeddingIndex, SectorQuestionEmbeddings
 
 
 class EvaluationService:
-    def __init__(self, document: Doc, embedding_model: EmbeddingModelABC):
+    _configurations = Configurations.Evaluation
+
+    def __init__(
+        self,
+        document: Optional[Doc],
+        embedding_model: EmbeddingModelABC,
+        sentences: Optional[List[str]] = None,
+        embedded_sentences: Optional[np.ndarray] = None,
+    ):
         self._evaluator = Evaluator(
             document=document,
             embedding_model=embedding_model,
-            nli_model=DistilBartNLIModel(),
+            nli_model=NLIModelFactory.create_configured_model(),
             cosine_similarity_strategy=PytorchCosineSimilarityStrategy(),
+            sentences=sentences,
+            embedded_sentences=embedded_sentences,
         )
-
-    def _evaluate_criterion(self, criterion):
+        self._question_embedding_index = QuestionEmbeddingIndex(embedding_model)
+
+    def _get_sector_question_embeddings(self, sector: Optional[str]):
+        """Gets the precomputed question embeddings of a sector, if available."""
+        if sector is None:
+            return None
+
+        try:
+            return self._question_embedding_index.get_sector(sector)
+        except Exception as e:
+            logging.warning(
+                f"Question embeddings unavailable for sector {sector}: {str(e)}"
+            )
+            return None
+
+    @staticmethod
+    def _get_question_embedding(
+        criterion, sector_question_embeddings: Optional[SectorQuestionEmbeddings]
+    ):
+        if sector_question_embeddings is None:
+            return None
+        return sector_question_embeddings.get(criterion["index"], criterion["question"])
+
+    def _evaluate_criterion(
+        self,
+        criterion,
+        sector_question_embeddings: Optional[SectorQuestionEmbeddings] = None,
+    ):
         """Evaluates a single criterion by computing its evaluation result and score."""
-        evaluation_result = self._evaluator.evaluate(question=criterion["question"])
+        evaluation_result = self._evaluator.evaluate(
+            question=criterion["question"],
+            question_embedding=self._get_question_embedding(
+                criterion, sector_question_embeddings
+            ),
+        )
         evaluation_score = self._compute_standardized_evaluation_score(
             evaluation_result, criterion["possible_scores"]
         )
@@ -57,47 +103,80 @@ class EvaluationService:
         ].item()
         return standardized_evaluation_score
 
-    def _evaluate_nested_criteria(self, criteria, executor):
-        """Evaluates nested criteria and handles mid-level and end-level criteria."""
-        total_score = 0
-
-        def evaluate_criterion_and_update(criterion):
-            # If the criterion has sub_criteria, process them recursively
+    def _collect_end_level_criteria(self, criteria):
+        """Collects every end-level criterion of a (nested) criteria list in tree order."""
+        end_level_criteria = []
+        for criterion in criteria:
             if sub_criteria := criterion.get("sub_criteria"):
-                sub_criteria_score_sum = self._evaluate_nested_criteria(
-                    sub_criteria, executor
-                )
-                # Assign the raw sum to mid-level criteria (no standardization)
-                criterion["evaluation_score"] = sub_criteria_score_sum
-                return criterion["evaluation_score"]
+                end_level_criteria.extend(self._collect_end_level_criteria(sub_criteria))
+            else:
+                end_level_criteria.append(criterion)
+        return end_level_criteria
 
-            # Otherwise, evaluate and standardize only for end-level criteria
-            evaluation_result, evaluation_score = self._evaluate_criterion(criterion)
-            criterion["evaluation_result"] = evaluation_result
-            criterion["evaluation_score"] = evaluation_score
-            return evaluation_score
-
-        # Evaluate criteria in parallel
-        scores = list(executor.map(evaluate_criterion_and_update, criteria))
-        total_score += sum(scores)
+    def _sum_nested_criteria(self, criteria):
+        """Assigns the raw sum of their sub-criteria scores to mid-level criteria."""
+        total_score = 0
+        for criterion in criteria:
+            if sub_criteria := criterion.get("sub_criteria"):
+                criterion["evaluation_score"] = self._sum_nested_criteria(sub_criteria)
+            total_score += criterion["evaluation_score"]
         return total_score
 
-    def batch_evaluate(self, evaluation_criteria):
-        """Evaluates a set of criteria (and sub-criteria) across multiple sections using threads."""
-        evaluation_score_total = 0
-
-        for section in evaluation_criteria:
-            section_evaluation_score = 0
+    def _batch_evaluate_end_level_criteria(
+        self,
+        evaluation_criteria,
+        sector_question_embeddings: Optional[SectorQuestionEmbeddings] = None,
+    ):
+        """Evaluates the end-level criteria of every section with batched NLI inference."""
+        end_level_criteria = [
+            criterion
+            for section in evaluation_criteria
+            for criterion in self._collect_end_level_criteria(section["criteria"])
+        ]
+
+        evaluation_results = self._evaluator.evaluate_many(
+            questions=[criterion["question"] for criterion in end_level_criteria],
+            question_embeddings=[
+                self._get_question_embedding(criterion, sector_question_embeddings)
+                for criterion in end_level_criteria
+            ],
+            batch_size=self._configurations.nli_batch_size,
+        )
 
-            with ThreadPoolExecutor() as executor:
-                # Process all criteria in the section (including sub-criteria) in parallel
-                section_evaluation_score = self._evaluate_nested_criteria(
-                    section["criteria"], executor
+        for criterion, evaluation_result in zip(end_level_criteria, evaluation_results):
+            criterion["evaluation_result"] = evaluation_result
+            criterion["evaluation_score"] = self._compute_standardized_evaluation_score(
+                evaluation_result, criterion["possible_scores"]
+            )
+
+    def batch_evaluate(self, evaluation_criteria, sector: Optional[str] = None):
+        """Evaluates a set of criteria (and sub-criteria) across multiple sections."""
+        sector_question_embeddings = self._get_sector_question_embeddings(sector)
+
+        if self._configurations.mode == "batched":
+            self._batch_evaluate_end_level_criteria(
+                evaluation_criteria, sector_question_embeddings
+            )
+
+            evaluation_score_total = 0
+            for section in evaluation_criteria:
+                section["evaluation_score"] = self._sum_nested_criteria(
+                    section["criteria"]
                 )
-
-            # Assign the total score to the section
-            section["evaluation_score"] = section_evaluation_score
-            evaluation_score_total += section_evaluation_score
+                evaluation_score_total += section["evaluation_score"]
+
+            return {
+                "evaluation": evaluation_criteria,
+                "evaluation_score": evaluation_score_total,
+            }
+
+        # Every section is evaluated concurrently on the shared scheduler pool
+        evaluation_score_total = CriteriaScheduler().run(
+            evaluation_criteria,
+            lambda criterion: self._evaluate_criterion(
+                criterion, sector_question_embeddings
+            ),
+        )
 
         # Construct the response
         response = {
@@ -1,95 +1,190 @@
+from typing import List, Optional
+
 import numpy as np
-import spacy
+from app.configurations.configurations import Configurations
 from app.models.embedding_models.interfaces import (
     EmbeddingModelABC,
 )
 from app.models.nli_models.interfaces import NLIModelABC
 from app.utils.cosine_similarity_strategy.interfaces import CosineSimilarityStrategyABC
+from app.utils.cpu_governor import CpuGovernor
 from app.utils.document_processor.denoise_processor import DenoiseProcessor
 from app.utils.document_processor.strip_new_lines_processor import (
     StripNewLinesProcessor,
 )
 from app.utils.document_processor.to_lower_case_processor import ToLowerCaseProcessor
+from app.utils.spacy_pipeline_registry import SpacyPipelineRegistry
 from spacy.tokens import Doc
 
-spacy_nlp = spacy.load("en_core_web_sm")
-
 
 class Evaluator:
+    _configurations = Configurations.Evaluation
+    _spacy_pipelines = SpacyPipelineRegistry()
+
     def __init__(
         self,
-        document: Doc,
+        document: Optional[Doc],
         embedding_model: EmbeddingModelABC,
         nli_model: NLIModelABC,
         cosine_similarity_strategy: CosineSimilarityStrategyABC,
+        sentences: Optional[List[str]] = None,
+        embedded_sentences: Optional[np.ndarray] = None,
     ):
+        """Either a document or its already segmented (and optionally embedded) sentences are required."""
         self._embedding_model = embedding_model
         self._nli_model = nli_model
         self._cosine_similarity_strategy = cosine_similarity_strategy
 
-        # Refactored
-        sentence_processor = StripNewLinesProcessor().set_next_processor(
-            DenoiseProcessor()
+        if sentences is None:
+            sentences = [sentence.text for sentence in document.sents]
+        self._sentences = sentences
+
+        if embedded_sentences is None:
+            embedded_sentences = self.embed_sentences(
+                self._sentences, self._embedding_model
+            )
+        self._embedded_sentences = embedded_sentences
+
+        # Normalized once so every question lookup is a single matrix multiplication
+        self._normalized_sentences = self._cosine_similarity_strategy.normalize(
+            np.ascontiguousarray(self._embedded_sentences, dtype=np.float32)
         )
-        self._sentences = [sentence.text for sentence in document.sents]
-        sentences_processed = [
-            sentence_processor.process(spacy_nlp(sentence)).text
-            for sentence in self._sentences
-        ]
-        self._embedded_sentences = np.array(
-            [
-                self._embedding_model.transform(sentence)
-                for sentence in sentences_processed
-            ]
+
+    @classmethod
+    def preprocess_sentences(cls, sentences: List[str]) -> List[str]:
+        """Strips new lines and denoises every sentence in a single batched spaCy pass.
+
+        Produces the same text as StripNewLinesProcessor -> DenoiseProcessor, which only
+        need the tokenizer, so the tokenizer-only pipeline is used.
+        """
+        spacy_tokenizer = cls._spacy_pipelines.get("tokenizer")
+        documents = spacy_tokenizer.pipe(
+            (sentence.replace("\n", " ") for sentence in sentences),
+            batch_size=cls._configurations.sentence_preprocessing_batch_size,
+            n_process=CpuGovernor.get_budget()["spacy_n_process"],
         )
 
-    def _compute_cosine_similarity(
-        self, sentences_embeddings: np.ndarray, question_embeddings: np.ndarray
-    ):
-        """Computes cosine similarity between a question and a sentence."""
-        cosine_scores = self._cosine_similarity_strategy.compute(
-            sentences_embeddings, question_embeddings
+        return [
+            " ".join(token.text for token in document if token.is_alpha).strip()
+            for document in documents
+        ]
+
+    @classmethod
+    def embed_sentences(
+        cls, sentences: List[str], embedding_model: EmbeddingModelABC
+    ) -> np.ndarray:
+        """Preprocesses and embeds document sentences."""
+        return embedding_model.transform_many(cls.preprocess_sentences(sentences))
+
+    def _compute_cosine_similarity(self, questions_embeddings: np.ndarray):
+        """Computes the most similar sentence of each question with a single matrix multiplication."""
+        highest_scores, highest_score_indices = (
+            self._cosine_similarity_strategy.compute_many(
+                self._normalized_sentences,
+                questions_embeddings,
+                top_k=1,
+                normalized=True,
+            )
         )
-        return cosine_scores
+        return highest_scores[:, 0], highest_score_indices[:, 0]
 
     def _compute_nli(self, premise: str, hypothesis: str):
         """Performs Natural Language Inference (NLI) on a premise and hypothesis."""
         nli = self._nli_model.infer(premise, hypothesis)
         return nli
 
-    def evaluate(self, question: str):
+    @staticmethod
+    def process_question(question: str) -> str:
+        """Processes a criterion question into the text that gets embedded."""
         question_processor = (
             StripNewLinesProcessor()
             .set_next_processor(ToLowerCaseProcessor())
             .set_next_processor(DenoiseProcessor())
         )
 
-        question_processed = question_processor.process(spacy_nlp(question)).text
+        return question_processor.process_text(question)
 
-        embeddings = {
-            "sentences": self._embedded_sentences,
-            "question": self._embedding_model.transform(question_processed),
-        }
-
-        cosine_scores = self._compute_cosine_similarity(
-            embeddings["sentences"],
-            embeddings["question"],
+    def _retrieve_most_similar_sentences(
+        self,
+        questions: List[str],
+        question_embeddings: List[Optional[np.ndarray]],
+    ):
+        """Finds the document sentence most similar to each question."""
+        questions_embeddings = np.array(
+            [
+                (
+                    self._embedding_model.transform(self.process_question(question))
+                    if question_embedding is None
+                    else question_embedding
+                )
+                for question, question_embedding in zip(questions, question_embeddings)
+            ],
+            dtype=np.float32,
         )
 
-        highest_score_idx = cosine_scores.argmax()
-        highest_similarity_score = cosine_scores[highest_score_idx].item()
-        highest_similarity_sentence = self._sentences[highest_score_idx]
-
-        nli_results = self._compute_nli(
-            premise=highest_similarity_sentence,
-            hypothesis=question,
+        highest_scores, highest_score_indices = self._compute_cosine_similarity(
+            questions_embeddings
         )
 
-        evaluation = {
+        return [
+            (highest_score.item(), self._sentences[highest_score_idx])
+            for highest_score, highest_score_idx in zip(
+                highest_scores, highest_score_indices
+            )
+        ]
+
+    @staticmethod
+    def _build_evaluation(
+        question: str,
+        highest_similarity_score: float,
+        highest_similarity_sentence: str,
+        nli_results,
+    ):
+        return {
             "evaluation_question": question,
             "highest_cosine_similarity_score": highest_similarity_score,
             "highest_cosine_similarity_sentence": highest_similarity_sentence,
             "nli_evaluation": nli_results,
         }
 
-        return evaluation
+    def evaluate(self, question: str, question_embedding: Optional[np.ndarray] = None):
+        highest_similarity_score, highest_similarity_sentence = (
+            self._retrieve_most_similar_sentences([question], [question_embedding])[0]
+        )
+
+        nli_results = self._compute_nli(
+            premise=highest_similarity_sentence,
+            hypothesis=question,
+        )
+
+        return self._build_evaluation(
+            question, highest_similarity_score, highest_similarity_sentence, nli_results
+        )
+
+    def evaluate_many(
+        self,
+        questions: List[str],
+        question_embeddings: Optional[List[Optional[np.ndarray]]] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """Evaluates several questions, running their NLI pairs through the model in batches."""
+        if question_embeddings is None:
+            question_embeddings = [None] * len(questions)
+
+        retrievals = self._retrieve_most_similar_sentences(
+            questions, question_embeddings
+        )
+
+        nli_pairs = [
+            (highest_similarity_sentence, question)
+            for (_, highest_similarity_sentence), question in zip(retrievals, questions)
+        ]
+        # The NLI model sorts the pairs by length and batches them (at most batch_size)
+        nli_results = self._nli_model.infer_batch(nli_pairs, batch_size=batch_size)
+
+        return [
+            self._build_evaluation(question, *retrieval, nli_result)
+            for question, retrieval, nli_result in zip(
+                questions, retrievals, nli_results
+            )
+        ]
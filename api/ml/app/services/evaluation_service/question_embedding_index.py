@@ -0,0 +1,212 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+from app.configurations.configurations import Configurations
+from app.models.embedding_models.interfaces import EmbeddingModelABC
+from app.repositories.evaluation_criteria_repository.evaluation_criteria_repository import (
+    EvaluationCriteriaRepository,
+)
+from app.services.evaluation_criteria_service.evaluation_criteria_service import (
+    EvaluationCriteriaService,
+)
+from app.services.evaluation_criteria_service.interfaces import (
+    EvaluationCriteriaServiceABC,
+)
+
+from .evaluator import Evaluator
+
+
+class SectorQuestionEmbeddings:
+    """Processed text and embedding matrix of every criterion question of a sector."""
+
+    def __init__(self, fingerprint: str, indices, questions, processed, embeddings):
+        self.fingerprint = fingerprint
+        self.indices = indices
+        self.questions = questions
+        self.processed = processed
+        self.embeddings = embeddings
+        self._rows = {index: row for row, index in enumerate(indices)}
+
+    def get(self, criterion_index: Any, question: str) -> Optional[np.ndarray]:
+        """Returns the embedding of a criterion question, or None if it is not indexed."""
+        row = self._rows.get(str(criterion_index))
+
+        # Guard against criteria that changed without their index changing
+        if row is None or self.questions[row] != question:
+            return None
+        return self.embeddings[row]
+
+
+class QuestionEmbeddingIndex:
+    """Per embedding model index of the criterion question embeddings of every sector catalog.
+
+    Entries are built once per process (or loaded from next to the model binaries) and
+    are keyed by sector and criterion index. They are rebuilt whenever the checksum of
+    the sector criteria JSON or the embedding model fingerprint changes.
+    """
+
+    _configurations = Configurations
+    _sector_evaluation_criteria_configurations = (
+        Configurations.SectorEvaluationCriterias
+    )
+    _indexes: Dict[str, Dict[str, SectorQuestionEmbeddings]] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelABC,
+        evaluation_criteria_service: Optional[EvaluationCriteriaServiceABC] = None,
+    ):
+        self._embedding_model = embedding_model
+        self._evaluation_criteria_service = (
+            evaluation_criteria_service
+            or EvaluationCriteriaService(
+                evaluation_criteria_repository=EvaluationCriteriaRepository()
+            )
+        )
+
+        model_fingerprint = self._embedding_model.model_fingerprint
+        self._model_key = re.sub(r"[^\w.-]", "_", model_fingerprint.split(":")[0])
+        self._directory = os.path.join(
+            self._configurations.EmbeddingModels.models_bin_path,
+            "question-embeddings",
+            self._model_key,
+        )
+
+    def _get_model_index(self):
+        return QuestionEmbeddingIndex._indexes.setdefault(self._model_key, {})
+
+    def _compute_fingerprint(self, sector: str):
+        criteria_checksum = self._evaluation_criteria_service.get_checksum(sector)
+        fingerprint = f"{criteria_checksum}:{self._embedding_model.model_fingerprint}"
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    def _get_filepath(self, sector: str):
+        return os.path.join(self._directory, f"{sector}.npz")
+
+    @staticmethod
+    def _collect_questions(criteria, indices, questions):
+        for criterion in criteria:
+            indices.append(str(criterion["index"]))
+            questions.append(criterion["question"])
+            if sub_criteria := criterion.get("sub_criteria"):
+                QuestionEmbeddingIndex._collect_questions(
+                    sub_criteria, indices, questions
+                )
+
+    def _get_sector_questions(self, sector: str):
+        indices, questions = [], []
+        for section in self._evaluation_criteria_service.get_json(sector):
+            self._collect_questions(section["criteria"], indices, questions)
+        return indices, questions
+
+    def collect_question_tokens(self):
+        """Returns the embedding tokens of every processed criterion question."""
+        sectors = self._sector_evaluation_criteria_configurations.sector_evaluation_criteria_map
+        tokens = set()
+
+        for sector in sectors:
+            try:
+                _, questions = self._get_sector_questions(sector)
+            except Exception as e:
+                logging.error(f"Failed to read questions of sector {sector}: {str(e)}")
+                continue
+            for question in questions:
+                tokens.update(Evaluator.process_question(question).lower().split())
+
+        return tokens
+
+    def _build_sector(self, sector: str, fingerprint: str):
+        indices, questions = self._get_sector_questions(sector)
+        processed = [Evaluator.process_question(question) for question in questions]
+        embeddings = self._embedding_model.transform_many(processed)
+
+        return SectorQuestionEmbeddings(
+            fingerprint, indices, questions, processed, embeddings
+        )
+
+    def _load_sector(self, sector: str, fingerprint: str):
+        filepath = self._get_filepath(sector)
+        if not os.path.exists(filepath):
+            return None
+
+        try:
+            with np.load(filepath) as data:
+                if str(data["fingerprint"]) != fingerprint:
+                    return None
+                return SectorQuestionEmbeddings(
+                    fingerprint,
+                    data["indices"].tolist(),
+                    data["questions"].tolist(),
+                    data["processed"].tolist(),
+                    data["embeddings"],
+                )
+        except Exception as e:
+            logging.warning(f"Failed to load question embeddings {filepath}: {str(e)}")
+            return None
+
+    def _save_sector(self, sector: str, sector_index: SectorQuestionEmbeddings):
+        filepath = self._get_filepath(sector)
+        temp_filepath = f"{filepath}.{os.getpid()}.tmp"
+
+        # The index is still used from memory when the models directory is read-only
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(temp_filepath, "wb") as file:
+                np.savez(
+                    file,
+                    fingerprint=np.array(sector_index.fingerprint),
+                    indices=np.array(sector_index.indices),
+                    questions=np.array(sector_index.questions),
+                    processed=np.array(sector_index.processed),
+                    embeddings=sector_index.embeddings,
+                )
+            os.replace(temp_filepath, filepath)
+        except OSError as e:
+            logging.warning(f"Failed to save question embeddings {filepath}: {str(e)}")
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+
+    def get_sector(self, sector: str) -> SectorQuestionEmbeddings:
+        """Returns the question embeddings of a sector, building them if stale or missing."""
+        fingerprint = self._compute_fingerprint(sector)
+        model_index = self._get_model_index()
+
+        sector_index = model_index.get(sector)
+        if sector_index is not None and sector_index.fingerprint == fingerprint:
+            return sector_index
+
+        with QuestionEmbeddingIndex._lock:
+            sector_index = model_index.get(sector)
+            if sector_index is not None and sector_index.fingerprint == fingerprint:
+                return sector_index
+
+            sector_index = self._load_sector(sector, fingerprint)
+            if sector_index is None:
+                logging.info(
+                    f"Building question embeddings: {self._model_key}/{sector}"
+                )
+                sector_index = self._build_sector(sector, fingerprint)
+                self._save_sector(sector, sector_index)
+
+            model_index[sector] = sector_index
+            return sector_index
+
+    def build(self):
+        """Builds (or loads) the question embeddings of every sector catalog."""
+        sectors = self._sector_evaluation_criteria_configurations.sector_evaluation_criteria_map
+
+        for sector in sectors:
+            try:
+                self.get_sector(sector)
+            except Exception as e:
+                logging.error(
+                    f"Failed to build question embeddings for sector {sector}: {str(e)}"
+                )
+
+        logging.info(f"Question embeddings ready: {self._model_key}")
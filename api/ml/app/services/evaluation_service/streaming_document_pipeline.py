@@ -0,0 +1,229 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from app.configurations.configurations import Configurations
+from app.models.embedding_models.interfaces import EmbeddingModelABC
+from app.services.gender_mapper_service.gender_mapper import GenderMapper
+
+from .evaluator import Evaluator
+
+
+class StreamingPipelineStageError(Exception):
+    """Raised in the calling thread when a pipeline stage fails."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"Streaming pipeline stage '{stage}' failed: {str(error)}")
+        self.stage = stage
+        self.error = error
+
+
+class _StageFailure:
+    def __init__(self, error: StreamingPipelineStageError):
+        self.error = error
+
+
+class StreamingDocumentPipeline:
+    """Streams extracted document text through segmentation, gender mapping and embedding.
+
+    The stages run concurrently and hand work over through bounded queues:
+
+    - extraction (worker thread): text chunks as the PDF text extractor yields them
+    - segmentation (worker thread): normalizes each chunk and parses it once for its
+      sentences and PERSON entities. The trailing sentence is held back and joined
+      with the next chunk, so sentences spanning pages stay whole.
+    - mapping and embedding (calling thread): predicts the gender of new names, then
+      gender maps and embeds each batch of sentences
+
+    A name is only known once it is reached, so at the end every sentence is mapped
+    again with all the names and only the sentences that changed are re-embedded.
+    """
+
+    _configurations = Configurations.Evaluation
+    _end_of_stream = object()
+    _poll_interval_seconds = 0.1
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelABC,
+        gender_mapper: Optional[GenderMapper] = None,
+    ):
+        self._embedding_model = embedding_model
+        self._gender_mapper = gender_mapper or GenderMapper()
+
+    def _put(self, output_queue: queue.Queue, item, cancelled: threading.Event):
+        """Puts an item unless the pipeline is cancelled while the queue is full."""
+        while not cancelled.is_set():
+            try:
+                output_queue.put(item, timeout=self._poll_interval_seconds)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _iter_queue(self, input_queue: queue.Queue, cancelled: threading.Event):
+        """Yields the items of an upstream stage until its end of stream."""
+        while not cancelled.is_set():
+            try:
+                item = input_queue.get(timeout=self._poll_interval_seconds)
+            except queue.Empty:
+                continue
+
+            if item is self._end_of_stream:
+                return
+            if isinstance(item, _StageFailure):
+                raise item.error
+            yield item
+
+    def _run_stage(
+        self,
+        stage: str,
+        produce: Callable[[], Iterator],
+        output_queue: queue.Queue,
+        cancelled: threading.Event,
+    ):
+        """Forwards the items of a stage, then its end of stream or its failure."""
+        items = produce()
+        try:
+            for item in items:
+                if not self._put(output_queue, item, cancelled):
+                    return
+            self._put(output_queue, self._end_of_stream, cancelled)
+        except StreamingPipelineStageError as e:
+            self._put(output_queue, _StageFailure(e), cancelled)
+        except Exception as e:
+            logging.error(f"Streaming pipeline stage '{stage}' failed: {str(e)}")
+            self._put(
+                output_queue,
+                _StageFailure(StreamingPipelineStageError(stage, e)),
+                cancelled,
+            )
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    def _start_stage(
+        self,
+        stage: str,
+        produce: Callable[[], Iterator],
+        cancelled: threading.Event,
+    ):
+        output_queue = queue.Queue(maxsize=self._configurations.pipeline_queue_size)
+        thread = threading.Thread(
+            target=self._run_stage,
+            args=(stage, produce, output_queue, cancelled),
+            name=f"document-pipeline-{stage}",
+            daemon=True,
+        )
+        thread.start()
+        return output_queue, thread
+
+    def _segment(self, chunks: Iterable[str]):
+        """Yields the complete sentences and the PERSON entities of each chunk."""
+        carried_text = ""
+        # Whitespace between chunks (table rows end in a newline) is dropped by the
+        # normalization of each chunk, but separates words in the whole document text
+        whitespace_before = False
+
+        for chunk in chunks:
+            normalized_chunk = GenderMapper.normalize_text(chunk)
+            if not normalized_chunk:
+                whitespace_before = whitespace_before or bool(chunk)
+                continue
+
+            separator = (
+                " " if carried_text and (whitespace_before or chunk[0].isspace()) else ""
+            )
+            whitespace_before = chunk[-1].isspace()
+            text = f"{carried_text}{separator}{normalized_chunk}"
+            # A single parse gives both the sentences and the entities of the chunk
+            document = self._gender_mapper.parse(text)
+            sentences = list(document.sents)
+            if not sentences:
+                carried_text = text
+                continue
+
+            # The last sentence may continue in the next chunk
+            *complete_sentences, last_sentence = sentences
+            carried_text = text[last_sentence.start_char :]
+            if complete_sentences:
+                persons = GenderMapper.get_person_entities(
+                    document, end_char=last_sentence.start_char
+                )
+                yield [sentence.text for sentence in complete_sentences], persons
+
+        if carried_text.strip():
+            document = self._gender_mapper.parse(carried_text)
+            yield [sentence.text for sentence in document.sents], (
+                GenderMapper.get_person_entities(document)
+            )
+
+    def _embed(self, sentences: List[str]) -> np.ndarray:
+        return Evaluator.embed_sentences(sentences, self._embedding_model)
+
+    def _remap(self, source_sentences, mapped_sentences, embedded_sentences):
+        """Maps the sentences again with every name and re-embeds those that changed."""
+        changed_rows = []
+        for row, source_sentence in enumerate(source_sentences):
+            mapped_sentence = self._gender_mapper.apply_gender_mapping(source_sentence)
+            if mapped_sentence != mapped_sentences[row]:
+                mapped_sentences[row] = mapped_sentence
+                changed_rows.append(row)
+
+        if changed_rows:
+            embedded_sentences[changed_rows] = self._embed(
+                [mapped_sentences[row] for row in changed_rows]
+            )
+        return len(changed_rows)
+
+    def run(self, chunks: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+        """Returns the gender mapped sentences of the text chunks and their embeddings."""
+        started_at = time.perf_counter()
+        cancelled = threading.Event()
+
+        chunk_queue, extraction_thread = self._start_stage(
+            "extraction", lambda: iter(chunks), cancelled
+        )
+        segment_queue, segmentation_thread = self._start_stage(
+            "segmentation",
+            lambda: self._segment(self._iter_queue(chunk_queue, cancelled)),
+            cancelled,
+        )
+
+        source_sentences, mapped_sentences, embeddings = [], [], []
+        try:
+            for sentences, persons in self._iter_queue(segment_queue, cancelled):
+                self._gender_mapper.add_person_entities(persons)
+                mapped = [
+                    self._gender_mapper.apply_gender_mapping(sentence)
+                    for sentence in sentences
+                ]
+                source_sentences.extend(sentences)
+                mapped_sentences.extend(mapped)
+                embeddings.append(self._embed(mapped))
+        except StreamingPipelineStageError:
+            raise
+        except Exception as e:
+            raise StreamingPipelineStageError("embedding", e) from e
+        finally:
+            cancelled.set()
+            extraction_thread.join()
+            segmentation_thread.join()
+
+        embedded_sentences = (
+            np.concatenate(embeddings) if embeddings else np.empty((0, 0))
+        )
+        remapped_count = self._remap(
+            source_sentences, mapped_sentences, embedded_sentences
+        )
+
+        logging.info(
+            f"Streamed {len(mapped_sentences)} sentences in "
+            f"{time.perf_counter() - started_at:.2f}s "
+            f"({remapped_count} re-embedded after the final gender mapping)"
+        )
+        return mapped_sentences, embedded_sentences
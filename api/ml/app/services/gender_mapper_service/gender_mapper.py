@@ -1,6 +1,5 @@
-import re
+from typing import Iterable, List, Optional
 
-import spacy
 from app.models.classification_models.feature_selectors.chi_squared import Chi2Selector
 from app.models.classification_models.gender_classification import (
     GenderClassificationModel,
@@ -14,82 +13,123 @@ from app.utils.document_processor.strip_line_spaces_processor import (
 from app.utils.document_processor.to_lower_case_processor import (
     ToLowerCaseProcessor,
 )
+from app.utils.entity_replacer import EntityReplacer
+from app.utils.spacy_pipeline_registry import SpacyPipelineRegistry
 from nameparser import HumanName
 from spacy.tokens import Doc
 
-spacy_nlp = spacy.load("en_core_web_sm")
-
 
 class GenderMapper:
-    def __init__(self, document: Doc):
+    _spacy_pipelines = SpacyPipelineRegistry()
+
+    def __init__(self, document: Optional[Doc] = None, text: Optional[str] = None):
+        """The document (or its text) is only needed by map().
+
+        Streaming callers feed parsed pieces of the text instead.
+        """
         self._gender_classification_model = GenderClassificationModel(
             vectorizer=CountVectorizer(), selector=Chi2Selector()
         )
-        self._original_document = document
         self._document = document
+        self._document_text = (
+            text if text is not None else getattr(document, "text", None)
+        )
         self._person_entity_list = []
+        self._mapped_person_entities = set()
         self._gender_recognized_entity_map = {"male": set(), "female": set()}
+        self._entity_replacer = None
 
-    def _process_document(self):
-        """Process document to remove spaces and convert to lowercase."""
+    @staticmethod
+    def normalize_text(text: str):
+        """Remove spaces and convert to lowercase, as done before entity recognition."""
         document_processor = StripLineSpacesProcessor().set_next_processor(
             ToLowerCaseProcessor()
         )
-        self._document = document_processor.process(self._document)
+        return document_processor.process_text(text)
+
+    def parse(self, normalized_text: str) -> Doc:
+        """Parse normalized text once for both its entities and its sentences."""
+        return self._spacy_pipelines.get("ner_senter")(normalized_text)
+
+    @staticmethod
+    def get_person_entities(document: Doc, end_char: Optional[int] = None) -> List[str]:
+        """Return the 'PERSON' entities of a parse, or only those ending by end_char."""
+        return [
+            entity.text
+            for entity in document.ents
+            if entity.label_ == "PERSON"
+            and (end_char is None or entity.end_char <= end_char)
+        ]
+
+    def _process_document(self):
+        """Process document to remove spaces and convert to lowercase."""
+        # The processors run on plain text, leaving a single parse of the result
+        self._document = self.parse(self.normalize_text(self._document_text))
 
     def _process_person_entity_recognition(self):
         """Recognize 'PERSON' entities and stCreating a static class for theore them."""
-        self._person_entity_list = [
-            entity.text for entity in self._document.ents if entity.label_ == "PERSON"
-        ]
+        self._person_entity_list = self.get_person_entities(self._document)
 
     def _process_gender_prediction(self):
         """Predict the gender for each person entity and map it."""
-        for person in self._person_entity_list:
-            self._map_gender_to_entity(person)
-
-    def _map_gender_to_entity(self, person: str):
-        """Map the predicted gender to the person entity."""
-        human = HumanName(person)
-        predicted_gender = self._gender_classification_model.predict(human.first)
-        if predicted_gender in self._gender_recognized_entity_map:
-            self._gender_recognized_entity_map[predicted_gender].add(person)
-
-    @staticmethod
-    def _generate_word_boundary_pattern(words):
-        """Generate regex pattern for matching exact words with word boundaries."""
-        return r"|".join([rf"\b{word}\b" for word in words])
-
-    def _apply_gender_mapping(self, text: str):
+        self._map_gender_to_entities(self._person_entity_list)
+
+    def add_person_entities(self, persons: Iterable[str]):
+        """Predict and map the gender of person entities not seen before."""
+        new_persons = [
+            person
+            for person in dict.fromkeys(persons)
+            if person not in self._mapped_person_entities
+        ]
+        self._mapped_person_entities.update(new_persons)
+        self._map_gender_to_entities(new_persons)
+
+    def _map_gender_to_entities(self, persons: Iterable[str]):
+        """Map the predicted gender to each person entity.
+
+        The first names of all unique entities are classified in a single batch.
+        """
+        persons = list(dict.fromkeys(persons))
+        if not persons:
+            return
+
+        first_names = [HumanName(person).first for person in persons]
+        predicted_genders = self._gender_classification_model.predict_many(first_names)
+
+        for person, predicted_gender in zip(persons, predicted_genders):
+            if predicted_gender in self._gender_recognized_entity_map:
+                self._gender_recognized_entity_map[predicted_gender].add(person)
+                self._entity_replacer = None
+
+    def _get_entity_replacer(self):
+        """Build the replacement engine once per change of the entity map."""
+        if self._entity_replacer is None:
+            replacements = {}
+            # Male entities are added last, as the male mapping used to be applied first
+            for gender, replacement in (("female", "woman"), ("male", "man")):
+                for person in self._gender_recognized_entity_map[gender]:
+                    replacements[person] = replacement
+            self._entity_replacer = EntityReplacer(replacements)
+        return self._entity_replacer
+
+    def apply_gender_mapping(self, text: str):
         """Apply gender mapping based on identified gender clusters."""
-        male_words_pattern = self._generate_word_boundary_pattern(
-            self._gender_recognized_entity_map["male"]
-        )
-        female_words_pattern = self._generate_word_boundary_pattern(
-            self._gender_recognized_entity_map["female"]
-        )
-
-        male_gender_cluster_matcher = re.compile(male_words_pattern, re.IGNORECASE)
-        female_gender_cluster_matcher = re.compile(female_words_pattern, re.IGNORECASE)
-
-        if male_words_pattern:
-            text = " ".join(male_gender_cluster_matcher.sub("man", text).split())
-        if female_words_pattern:
-            text = " ".join(female_gender_cluster_matcher.sub("woman", text).split())
+        entity_replacer = self._get_entity_replacer()
+        if not entity_replacer:
+            return text
 
-        return text
+        # Every person entity is replaced in a single pass over the text
+        return " ".join(entity_replacer.replace(text).split())
 
-    def map(self):
-        """Perform gender mapping on the document."""
+    def map(self) -> List[str]:
+        """Perform gender mapping on the document and return its sentences."""
         self._process_document()
         self._process_person_entity_recognition()
         self._process_gender_prediction()
 
-        # Apply gender mapping after processing
-        gender_mapped_text = self._apply_gender_mapping(self._document.text)
-
-        # Process the mapped document and return it
-        gender_mapped_doc = StripLineSpacesProcessor().process(
-            spacy_nlp(gender_mapped_text)
-        )
-        return gender_mapped_doc
+        # Sentences come straight from the parse and are mapped one by one, so the
+        # mapped text never needs to be parsed again
+        return [
+            self.apply_gender_mapping(sentence.text)
+            for sentence in self._document.sents
+        ]
@@ -1,7 +1,41 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
 
 
 class PdfTextExtractorServiceABC(ABC):
     @abstractmethod
-    def extract_text(self, document_filepath: str) -> str:
+    def extract_text(self, document: Union[str, BinaryIO]) -> str:
+        """Extract text from a PDF given its file path or a seekable binary stream."""
         pass
+
+    def iter_text(self, document: Union[str, BinaryIO]) -> Iterator[str]:
+        """Yield the extracted text in chunks (one per page, then the table rows).
+
+        Joining the chunks gives the extract_text output. Extractors that cannot stream
+        yield the whole text at once.
+        """
+        yield self.extract_text(document)
+
+    @staticmethod
+    def _iter_assembled_text(
+        page_results: Iterable[Tuple[Optional[str], list]]
+    ) -> Iterator[str]:
+        """Yields the page texts as they come, followed by the flattened table rows."""
+        tables = []
+        for page_text, page_tables in page_results:
+            if page_text:
+                yield page_text
+            tables.extend(page_tables)
+
+        for table in tables:
+            rows = table[1:]
+            if not rows:
+                continue
+            flattened_row_data = [col for row in rows for col in row if col is not None]
+            row_data_parsed_sentences = ".".join(flattened_row_data).replace("\n", " ")
+            yield f"{row_data_parsed_sentences}\n"
+
+    @staticmethod
+    def _assemble_text(page_results: Iterable[Tuple[Optional[str], list]]):
+        """Assembles the page texts followed by the flattened table rows."""
+        return "".join(PdfTextExtractorServiceABC._iter_assembled_text(page_results))
@@ -1,34 +1,160 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, Union
+
 import pdfplumber
+
+from app.configurations.configurations import Configurations
+
 from .interfaces import PdfTextExtractorServiceABC
-import logging
+
+
+def _iter_pages(pdf, page_numbers):
+    """Yields the text and tables of each page, extracting every page once."""
+    for page_number in page_numbers:
+        page = pdf.pages[page_number]
+        yield page.extract_text(), page.extract_tables()
+        # Release the page's parsed layout objects once they are no longer needed
+        page.close()
+
+
+def _extract_pages(pdf, page_numbers):
+    return list(_iter_pages(pdf, page_numbers))
+
+
+def _extract_page_range(document_path: str, page_numbers: List[int]):
+    """Process pool entry point: extracts a range of pages of the PDF file."""
+    with pdfplumber.open(document_path) as pdf:
+        return _extract_pages(pdf, page_numbers)
 
 
 class PdfPlumberPdfTextExtractorService(PdfTextExtractorServiceABC):
-    def extract_text(self, document_filepath: str):
-        text = ""
-        table_groups = []
-
-        with pdfplumber.open(document_filepath) as pdf:
-            for page in pdf.pages:
-                if page.extract_text():
-                    text += page.extract_text()
-
-                if page.extract_tables():
-                    table_groups.append(page.extract_tables())
-
-            for tables in table_groups:
-                for table in tables:
-                    rows = table[1:]
-                    if not rows:
-                        continue
-                    flattened_row_data = [
-                        col for row in rows for col in row if col is not None
-                    ]
-                    row_data_parsed_sentences = ".".join(flattened_row_data).replace(
-                        "\n", " "
-                    )
-                    text += f"{row_data_parsed_sentences}\n"
-
-        logging.info(f"Extracted PDF plain text content: {document_filepath}")
+    _configurations = Configurations.PdfTextExtractors
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_pool_lock = threading.Lock()
+
+    @classmethod
+    def _get_process_pool(cls):
+        with cls._process_pool_lock:
+            if cls._process_pool is None:
+                # Spawned workers do not inherit the parent's torch and BLAS threads
+                cls._process_pool = ProcessPoolExecutor(
+                    max_workers=cls._configurations.parallel_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                atexit.register(cls._process_pool.shutdown, wait=False)
+            return cls._process_pool
+
+    @classmethod
+    def _reset_process_pool(cls):
+        with cls._process_pool_lock:
+            if cls._process_pool is not None:
+                cls._process_pool.shutdown(wait=False)
+            cls._process_pool = None
+
+    def _should_extract_in_parallel(self, page_count: int):
+        return (
+            self._configurations.parallel_workers > 1
+            and page_count >= self._configurations.parallel_min_pages
+        )
+
+    def _split_page_ranges(self, page_count: int):
+        """Splits the pages into one contiguous range per worker."""
+        workers = min(self._configurations.parallel_workers, page_count)
+        range_size, remainder = divmod(page_count, workers)
+
+        page_ranges, start = [], 0
+        for worker in range(workers):
+            end = start + range_size + (1 if worker < remainder else 0)
+            page_ranges.append(list(range(start, end)))
+            start = end
+        return page_ranges
+
+    @contextmanager
+    def _get_document_path(self, document: Union[str, BinaryIO]):
+        """Yields a path the workers can open, spooling streams without one to a file.
+
+        Workers receive the path instead of the document bytes, so the document is
+        not copied into every task.
+        """
+        document_path = (
+            document if isinstance(document, str) else getattr(document, "name", None)
+        )
+        if isinstance(document_path, str) and os.path.isfile(document_path):
+            yield document_path
+            return
+
+        uploads_directory_path = Configurations.uploads_directory_path
+        os.makedirs(uploads_directory_path, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=uploads_directory_path, prefix="extract-", suffix=".pdf"
+        ) as temp_file:
+            document.seek(0)
+            shutil.copyfileobj(document, temp_file)
+            temp_file.flush()
+            yield temp_file.name
+
+    def _submit_page_ranges(self, document_path: str, page_count: int):
+        process_pool = self._get_process_pool()
+        return [
+            process_pool.submit(_extract_page_range, document_path, page_range)
+            for page_range in self._split_page_ranges(page_count)
+        ]
+
+    def _iter_page_results(self, document: Union[str, BinaryIO]):
+        """Yields the text and tables of every page in page order."""
+        with pdfplumber.open(document) as pdf:
+            page_count = len(pdf.pages)
+            if not self._should_extract_in_parallel(page_count):
+                yield from _iter_pages(pdf, range(page_count))
+                return
+
+        extracted_pages = 0
+        try:
+            with self._get_document_path(document) as document_path:
+                # Collect in submission order so the output keeps the page order
+                for future in self._submit_page_ranges(document_path, page_count):
+                    for page_result in future.result():
+                        yield page_result
+                        extracted_pages += 1
+        except BrokenProcessPool:
+            logging.warning("PDF extraction process pool broke, extracting serially")
+            self._reset_process_pool()
+            if not isinstance(document, str):
+                document.seek(0)
+            with pdfplumber.open(document) as pdf:
+                yield from _iter_pages(pdf, range(extracted_pages, page_count))
+
+    def extract_tables(self, document: Union[str, BinaryIO], page_numbers: List[int]):
+        """Extracts the tables of the given pages only."""
+        with pdfplumber.open(document) as pdf:
+            page_tables = {}
+            for page_number in page_numbers:
+                page = pdf.pages[page_number]
+                page_tables[page_number] = page.extract_tables()
+                page.close()
+            return page_tables
+
+    def extract_text(self, document: Union[str, BinaryIO]):
+        text = self._assemble_text(self._iter_page_results(document))
+
+        logging.info(
+            f"Extracted PDF plain text content: {getattr(document, 'name', document)}"
+        )
 
         return text
+
+    def iter_text(self, document: Union[str, BinaryIO]) -> Iterator[str]:
+        yield from self._iter_assembled_text(self._iter_page_results(document))
+
+        logging.info(
+            f"Streamed PDF plain text content: {getattr(document, 'name', document)}"
+        )
@@ -0,0 +1,127 @@
+import logging
+import threading
+from typing import BinaryIO, Iterator, Union
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+from app.configurations.configurations import Configurations
+
+from .interfaces import PdfTextExtractorServiceABC
+from .pdf_plumber_text_extractor import PdfPlumberPdfTextExtractorService
+
+
+class PdfiumPdfTextExtractorService(PdfTextExtractorServiceABC):
+    """Extracts text with pypdfium2, falling back to pdfplumber only for table pages.
+
+    pdfium has no layout analysis, which makes it much faster than pdfplumber on
+    text-heavy documents. When detect_tables is enabled, pages with enough vector path
+    objects to hold a ruled table are handed to pdfplumber for table extraction.
+    """
+
+    _configurations = Configurations.PdfTextExtractors
+    # PDFium is not thread-safe, so calls into it are serialized across request threads
+    _pdfium_lock = threading.Lock()
+
+    def __init__(self, detect_tables: bool = True):
+        self._detect_tables = detect_tables
+        self._table_extractor = PdfPlumberPdfTextExtractorService()
+
+    def _is_table_candidate(self, page):
+        path_objects = page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_PATH,))
+        min_path_objects = self._configurations.table_detection_min_path_objects
+
+        for count, _ in enumerate(path_objects, start=1):
+            if count >= min_path_objects:
+                return True
+        return False
+
+    def _extract_page(self, pdf, page_number: int):
+        page = pdf[page_number]
+        text_page = page.get_textpage()
+
+        # Match pdfplumber's line endings
+        page_text = text_page.get_text_range().replace("\r\n", "\n").strip("\n")
+        is_table_candidate = self._detect_tables and self._is_table_candidate(page)
+
+        text_page.close()
+        page.close()
+        return page_text, is_table_candidate
+
+    def _iter_pages(self, document: Union[str, BinaryIO]):
+        """Yields the text of every page and whether it may hold a table.
+
+        The PDFium lock is only held while a page is read, so a slow consumer does not
+        block extraction on other request threads.
+        """
+        with self._pdfium_lock:
+            pdf = pdfium.PdfDocument(document)
+            page_count = len(pdf)
+
+        try:
+            for page_number in range(page_count):
+                with self._pdfium_lock:
+                    page_text, is_table_candidate = self._extract_page(pdf, page_number)
+                yield page_number, page_text, is_table_candidate
+        finally:
+            with self._pdfium_lock:
+                pdf.close()
+
+    def _extract_pages(self, document: Union[str, BinaryIO]):
+        page_texts, table_candidate_pages = [], []
+
+        for page_number, page_text, is_table_candidate in self._iter_pages(document):
+            page_texts.append(page_text)
+            if is_table_candidate:
+                table_candidate_pages.append(page_number)
+
+        return page_texts, table_candidate_pages
+
+    def _extract_tables(self, document: Union[str, BinaryIO], table_candidate_pages):
+        if not table_candidate_pages:
+            return {}
+
+        if not isinstance(document, str):
+            document.seek(0)
+        return self._table_extractor.extract_tables(document, table_candidate_pages)
+
+    def extract_text(self, document: Union[str, BinaryIO]):
+        page_texts, table_candidate_pages = self._extract_pages(document)
+        page_tables = self._extract_tables(document, table_candidate_pages)
+
+        text = self._assemble_text(
+            [
+                (page_text, page_tables.get(page_number, []))
+                for page_number, page_text in enumerate(page_texts)
+            ]
+        )
+
+        logging.info(
+            f"Extracted PDF plain text content with pdfium "
+            f"({len(table_candidate_pages)}/{len(page_texts)} table pages): "
+            f"{getattr(document, 'name', document)}"
+        )
+
+        return text
+
+    def iter_text(self, document: Union[str, BinaryIO]) -> Iterator[str]:
+        page_count, table_candidate_pages = 0, []
+
+        for page_number, page_text, is_table_candidate in self._iter_pages(document):
+            page_count += 1
+            if page_text:
+                yield page_text
+            if is_table_candidate:
+                table_candidate_pages.append(page_number)
+
+        # Tables follow the page texts, as in extract_text
+        page_tables = self._extract_tables(document, table_candidate_pages)
+        yield from self._iter_assembled_text(
+            (None, page_tables[page_number]) for page_number in table_candidate_pages
+        )
+
+        logging.info(
+            f"Streamed PDF plain text content with pdfium "
+            f"({len(table_candidate_pages)}/{page_count} table pages): "
+            f"{getattr(document, 'name', document)}"
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Union, Any
+from typing import Union, Any, Tuple
 
 import numpy as np
 import torch
@@ -14,3 +14,22 @@ class CosineSimilarityStrategyABC(ABC):
     ) -> Any:
         """Compute cosine similarity between a question and sentences from a document."""
         pass
+
+    @abstractmethod
+    def normalize(self, embeddings: Union[np.ndarray, torch.Tensor]) -> Any:
+        """L2-normalize the rows of an embedding matrix into a contiguous float32 matrix."""
+        pass
+
+    @abstractmethod
+    def compute_many(
+        self,
+        sentences_embeddings: Union[np.ndarray, torch.Tensor],
+        questions_embeddings: Union[np.ndarray, torch.Tensor],
+        top_k: int = 1,
+        normalized: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score a questions x sentences matrix at once and return the top-k (scores, indices) per question.
+
+        Pass normalized=True when the sentences embeddings were already prepared with normalize().
+        """
+        pass
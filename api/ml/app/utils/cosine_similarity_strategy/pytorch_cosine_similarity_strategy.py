@@ -6,6 +6,13 @@ from typing import Union
 
 
 class PytorchCosineSimilarityStrategy(CosineSimilarityStrategyABC):
+    @staticmethod
+    def _to_float_tensor(embeddings: Union[np.ndarray, torch.Tensor]):
+        # Check if the embeddings are already tensors and if not convert them with the same data type (float32)
+        if not isinstance(embeddings, torch.Tensor):
+            return torch.as_tensor(np.asarray(embeddings), dtype=torch.float32)
+        return embeddings.float()
+
     def compute(
         self,
         sentences_embeddings: Union[np.ndarray, torch.Tensor],
@@ -31,3 +38,36 @@ class PytorchCosineSimilarityStrategy(CosineSimilarityStrategyABC):
             0
         ]
         return cosine_scores
+
+    def normalize(self, embeddings: Union[np.ndarray, torch.Tensor]):
+        """L2-normalize the rows of an embedding matrix into a contiguous float32 tensor."""
+        embeddings = self._to_float_tensor(embeddings)
+        if embeddings.dim() == 1:
+            embeddings = embeddings.unsqueeze(0)
+        return torch.nn.functional.normalize(embeddings, p=2, dim=1).contiguous()
+
+    def compute_many(
+        self,
+        sentences_embeddings: Union[np.ndarray, torch.Tensor],
+        questions_embeddings: Union[np.ndarray, torch.Tensor],
+        top_k: int = 1,
+        normalized: bool = False,
+    ):
+        """Score all questions against all sentences in a single matrix multiplication using PyTorch."""
+        if not normalized:
+            sentences_embeddings = self.normalize(sentences_embeddings)
+        questions_embeddings = self.normalize(questions_embeddings)
+
+        with torch.inference_mode():
+            cosine_scores = torch.mm(questions_embeddings, sentences_embeddings.T)
+
+            if top_k == 1:
+                # argmax returns the first maximal index, matching the single question path
+                top_indices = cosine_scores.argmax(dim=1, keepdim=True)
+                top_scores = cosine_scores.gather(1, top_indices)
+            else:
+                top_scores, top_indices = torch.topk(
+                    cosine_scores, k=min(top_k, cosine_scores.shape[1]), dim=1
+                )
+
+        return top_scores.numpy(), top_indices.numpy()
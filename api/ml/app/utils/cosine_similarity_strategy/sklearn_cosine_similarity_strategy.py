@@ -3,6 +3,7 @@ from typing import Union
 import numpy as np
 import torch
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 
 from .interfaces import CosineSimilarityStrategyABC
 
@@ -20,3 +21,30 @@ class SklearnCosineSimilarity(CosineSimilarityStrategyABC):
         )
 
         return cosine_scores
+
+    def normalize(self, embeddings: Union[np.ndarray, torch.Tensor]):
+        """L2-normalize the rows of an embedding matrix into a contiguous float32 array."""
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        return np.ascontiguousarray(normalize(embeddings, norm="l2"))
+
+    def compute_many(
+        self,
+        sentences_embeddings: Union[np.ndarray, torch.Tensor],
+        questions_embeddings: Union[np.ndarray, torch.Tensor],
+        top_k: int = 1,
+        normalized: bool = False,
+    ):
+        """Score all questions against all sentences in a single matrix multiplication using NumPy."""
+        if not normalized:
+            sentences_embeddings = self.normalize(sentences_embeddings)
+        questions_embeddings = self.normalize(questions_embeddings)
+
+        cosine_scores = questions_embeddings @ sentences_embeddings.T
+
+        if top_k == 1:
+            top_indices = cosine_scores.argmax(axis=1)[:, None]
+        else:
+            top_indices = np.argsort(-cosine_scores, axis=1, kind="stable")[:, :top_k]
+
+        top_scores = np.take_along_axis(cosine_scores, top_indices, axis=1)
+        return top_scores, top_indices
@@ -0,0 +1,164 @@
+import logging
+import math
+import os
+import threading
+from typing import Optional
+
+import torch
+from threadpoolctl import threadpool_info, threadpool_limits
+
+from app.configurations.configurations import Configurations
+
+# Read by OpenMP and the BLAS libraries of processes started after the budget applies
+_BLAS_THREAD_ENVIRONMENT_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+)
+
+
+class CpuGovernor:
+    """Splits the CPU cores between worker processes, request threads and thread pools.
+
+    Every worker process (API and evaluation job workers alike) gets an equal share of
+    the cores, and every concurrent request an equal share of its worker's cores. The
+    torch intra-op and BLAS thread pools are sized to a request's share, so concurrent
+    requests do not oversubscribe the cores. The criteria scheduler gets enough
+    workers to fill the worker's share with such requests.
+    """
+
+    _configurations = Configurations.CpuBudget
+    _evaluation_job_configurations = Configurations.EvaluationJobs
+    _budget: Optional[dict] = None
+    _budget_lock = threading.Lock()
+    _blas_limits = None
+
+    _cgroup_v2_cpu_max_path = "/sys/fs/cgroup/cpu.max"
+    _cgroup_v1_quota_path = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+    _cgroup_v1_period_path = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+    @classmethod
+    def _read_cgroup_quota(cls) -> Optional[float]:
+        """Returns the cgroup CPU quota in cores, or None when unlimited."""
+        try:
+            with open(cls._cgroup_v2_cpu_max_path, "r") as cpu_max:
+                quota, period = cpu_max.read().split()
+            return None if quota == "max" else int(quota) / int(period)
+        except (OSError, ValueError):
+            pass
+
+        try:
+            with open(cls._cgroup_v1_quota_path, "r") as quota_file:
+                quota = int(quota_file.read())
+            with open(cls._cgroup_v1_period_path, "r") as period_file:
+                period = int(period_file.read())
+            return None if quota <= 0 else quota / period
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def detect_cores(cls) -> int:
+        """Cores this process may run on, limited by the container's CPU quota."""
+        try:
+            cores = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cores = os.cpu_count() or 1
+
+        quota = cls._read_cgroup_quota()
+        if quota is not None:
+            cores = min(cores, max(1, math.floor(quota)))
+        return cores
+
+    @classmethod
+    def _compute_budget(cls):
+        configurations = cls._configurations
+        available_cores = configurations.available_cores or cls.detect_cores()
+        worker_processes = max(1, configurations.worker_processes)
+        # Evaluation job workers run next to the API workers with the same share
+        evaluation_job_processes = max(
+            0, cls._evaluation_job_configurations.worker_processes
+        )
+        request_threads = max(1, configurations.request_threads)
+
+        cores_per_worker = max(
+            1, available_cores // (worker_processes + evaluation_job_processes)
+        )
+        cores_per_request = max(1, cores_per_worker // request_threads)
+
+        budget = {
+            "available_cores": available_cores,
+            "worker_processes": worker_processes,
+            "evaluation_job_processes": evaluation_job_processes,
+            "request_threads": request_threads,
+            "cores_per_worker": cores_per_worker,
+            "cores_per_request": cores_per_request,
+            "torch_intra_op_threads": cores_per_request,
+            # Inference never runs independent operators in parallel
+            "torch_inter_op_threads": 1,
+            "blas_threads": cores_per_request,
+            "evaluation_workers": max(1, cores_per_worker // cores_per_request),
+            "spacy_n_process": (
+                cores_per_request
+                if cores_per_request >= configurations.spacy_min_cores_per_request
+                else 1
+            ),
+        }
+
+        for name in (
+            "torch_intra_op_threads",
+            "torch_inter_op_threads",
+            "blas_threads",
+            "evaluation_workers",
+            "spacy_n_process",
+        ):
+            if (value := getattr(configurations, name)) is not None:
+                budget[name] = value
+        return budget
+
+    @classmethod
+    def get_budget(cls) -> dict:
+        with cls._budget_lock:
+            if cls._budget is None:
+                cls._budget = cls._compute_budget()
+            return dict(cls._budget)
+
+    @classmethod
+    def apply(cls):
+        """Sizes the torch and BLAS thread pools of this process and logs the budget."""
+        budget = cls.get_budget()
+
+        for variable in _BLAS_THREAD_ENVIRONMENT_VARIABLES:
+            os.environ.setdefault(variable, str(budget["blas_threads"]))
+        cls._blas_limits = threadpool_limits(limits=budget["blas_threads"])
+
+        torch.set_num_threads(budget["torch_intra_op_threads"])
+        try:
+            torch.set_num_interop_threads(budget["torch_inter_op_threads"])
+        except RuntimeError as e:
+            # Only possible before torch runs its first inter-op parallel work
+            logging.warning(f"Failed to set torch inter-op threads: {str(e)}")
+
+        logging.info(
+            "CPU budget: "
+            + ", ".join(f"{name}: {value}" for name, value in budget.items())
+        )
+        return budget
+
+    @classmethod
+    def get_report(cls):
+        """The CPU budget along with the thread counts currently in effect."""
+        return {
+            "budget": cls.get_budget(),
+            "effective": {
+                "torch_intra_op_threads": torch.get_num_threads(),
+                "torch_inter_op_threads": torch.get_num_interop_threads(),
+                "threadpools": [
+                    {
+                        "user_api": threadpool["user_api"],
+                        "internal_api": threadpool["internal_api"],
+                        "num_threads": threadpool["num_threads"],
+                    }
+                    for threadpool in threadpool_info()
+                ],
+            },
+        }
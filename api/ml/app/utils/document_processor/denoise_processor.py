@@ -4,8 +4,16 @@ from .interfaces import DocumentProcessorABC
 
 
 class DenoiseProcessor(DocumentProcessorABC):
-    def process(self, document: Doc):
+    @staticmethod
+    def _denoise(document: Doc):
         filtered_tokens = [token.text for token in document if token.is_alpha]
-        processed_text = " ".join(filtered_tokens).strip()
+        return " ".join(filtered_tokens).strip()
+
+    def process(self, document: Doc):
+        processed_text = self._denoise(document)
         document = self._spacy_nlp(processed_text)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        # is_alpha is a lexical attribute, so the tokenizer alone is enough
+        return self.process_next_text(self._denoise(self._spacy_tokenizer(text)))
@@ -2,11 +2,19 @@ from abc import ABC, abstractmethod
 
 from spacy.tokens import Doc
 
-import spacy
+from app.utils.spacy_pipeline_registry import SpacyPipelineRegistry
 
 
 class DocumentProcessorABC(ABC):
-    _spacy_nlp = spacy.load("en_core_web_sm")
+    _spacy_pipelines = SpacyPipelineRegistry()
+
+    @property
+    def _spacy_nlp(self):
+        return self._spacy_pipelines.get("full")
+
+    @property
+    def _spacy_tokenizer(self):
+        return self._spacy_pipelines.get("tokenizer")
 
     def __init__(self, next_processor=None):
         self.next_processor = next_processor
@@ -19,7 +27,17 @@ class DocumentProcessorABC(ABC):
     def process(self, document: Doc) -> Doc:
         pass
 
+    @abstractmethod
+    def process_text(self, text: str) -> str:
+        """Process plain text, only building a Doc when the processor needs token attributes."""
+        pass
+
     def process_next(self, document: Doc):
         if self.next_processor:
             return self.next_processor.process(document)
         return document
+
+    def process_next_text(self, text: str):
+        if self.next_processor:
+            return self.next_processor.process_text(text)
+        return text
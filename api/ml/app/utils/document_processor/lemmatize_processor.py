@@ -4,8 +4,16 @@ from .interfaces import DocumentProcessorABC
 
 
 class LemmatizeProcessor(DocumentProcessorABC):
-    def process(self, document: Doc):
+    @staticmethod
+    def _lemmatize(document: Doc):
         lemmatized_tokens = [token.lemma_ for token in document]
-        processed_text = " ".join(lemmatized_tokens).strip()
+        return " ".join(lemmatized_tokens).strip()
+
+    def process(self, document: Doc):
+        processed_text = self._lemmatize(document)
         document = self._spacy_nlp(processed_text)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        # Lemmas depend on the tagger, so this step needs the full pipeline
+        return self.process_next_text(self._lemmatize(self._spacy_nlp(text)))
@@ -4,8 +4,18 @@ from .interfaces import DocumentProcessorABC
 
 
 class RemoveStopWordsProcessor(DocumentProcessorABC):
-    def process(self, document: Doc):
+    @staticmethod
+    def _remove_stop_words(document: Doc):
         filtered_tokens = [token.text for token in document if not token.is_stop]
-        processed_text = " ".join(filtered_tokens).strip()
+        return " ".join(filtered_tokens).strip()
+
+    def process(self, document: Doc):
+        processed_text = self._remove_stop_words(document)
         document = self._spacy_nlp(processed_text)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        # is_stop is a lexical attribute, so the tokenizer alone is enough
+        return self.process_next_text(
+            self._remove_stop_words(self._spacy_tokenizer(text))
+        )
@@ -6,9 +6,17 @@ from .strip_new_lines_processor import StripNewLinesProcessor
 
 
 class StripLineSpacesProcessor(DocumentProcessorABC):
-    def process(self, document: Doc):
-        processor = StripNewLinesProcessor().set_next_processor(
+    @staticmethod
+    def _create_processor():
+        return StripNewLinesProcessor().set_next_processor(
             StripMultipleSpacesProcessor()
         )
+
+    def process(self, document: Doc):
+        processor = self._create_processor()
         document = processor.process(document)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        processor = self._create_processor()
+        return self.process_next_text(processor.process_text(text))
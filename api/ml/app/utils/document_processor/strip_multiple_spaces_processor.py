@@ -6,7 +6,14 @@ from .interfaces import DocumentProcessorABC
 
 
 class StripMultipleSpacesProcessor(DocumentProcessorABC):
+    @staticmethod
+    def _strip_multiple_spaces(text: str):
+        return re.sub(r"\s+", " ", text).strip()
+
     def process(self, document: Doc):
-        processed_text = re.sub(r"\s+", " ", document.text).strip()
+        processed_text = self._strip_multiple_spaces(document.text)
         document = self._spacy_nlp(processed_text)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        return self.process_next_text(self._strip_multiple_spaces(text))
@@ -4,7 +4,14 @@ from .interfaces import DocumentProcessorABC
 
 
 class StripNewLinesProcessor(DocumentProcessorABC):
+    @staticmethod
+    def _strip_new_lines(text: str):
+        return text.replace("\n", " ")
+
     def process(self, document: Doc):
-        processed_text = document.text.replace("\n", " ")
+        processed_text = self._strip_new_lines(document.text)
         document = self._spacy_nlp(processed_text)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        return self.process_next_text(self._strip_new_lines(text))
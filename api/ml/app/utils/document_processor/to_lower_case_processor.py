@@ -8,3 +8,6 @@ class ToLowerCaseProcessor(DocumentProcessorABC):
         processed_text = document.text.lower()
         document = self._spacy_nlp(processed_text)
         return self.process_next(document)
+
+    def process_text(self, text: str):
+        return self.process_next_text(text.lower())
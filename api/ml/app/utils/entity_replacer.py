@@ -0,0 +1,96 @@
+import re
+from typing import Dict, Optional
+
+_TERMINAL = ""
+
+
+def _is_word_character(character: str):
+    return character.isalnum() or character == "_"
+
+
+class EntityReplacer:
+    """Replaces whole-word occurrences of many phrases in a single left-to-right pass.
+
+    Phrases are stored in a case-insensitive character trie. A match may only start
+    and end on a word boundary (as with regex \\b), the longest phrase wins at a
+    given position and scanning resumes after the replaced text, so the cost is
+    linear in the text length for a bounded phrase length. Phrases are matched
+    literally. Unlike a regex alternation, a phrase nested in a longer one (such as
+    "jose santos" in "maria jose santos") never splits the longer match.
+    """
+
+    def __init__(self, replacements: Dict[str, str]):
+        self._trie: Dict[str, dict] = {}
+        for phrase, replacement in replacements.items():
+            if phrase:
+                self._add(phrase, replacement)
+
+        # Candidate starts are found in C: word boundaries before a phrase's first character
+        first_characters = "".join(re.escape(character) for character in self._trie)
+        self._start_pattern = (
+            re.compile(rf"\b(?=[{first_characters}])", re.IGNORECASE)
+            if first_characters
+            else None
+        )
+
+    def _add(self, phrase: str, replacement: str):
+        node = self._trie
+        for character in phrase:
+            node = node.setdefault(character.lower(), {})
+        node[_TERMINAL] = replacement
+
+    def __bool__(self):
+        return bool(self._trie)
+
+    @staticmethod
+    def _is_word_boundary(text: str, position: int):
+        before = position > 0 and _is_word_character(text[position - 1])
+        after = position < len(text) and _is_word_character(text[position])
+        return before != after
+
+    def _match(self, text: str, lowered_text: Optional[str], start: int):
+        """Returns the end and replacement of the longest phrase starting at start."""
+        node, match = self._trie, None
+        position = start
+
+        while position < len(text):
+            character = (
+                lowered_text[position]
+                if lowered_text is not None
+                else text[position].lower()
+            )
+            node = node.get(character)
+            if node is None:
+                break
+            position += 1
+            if _TERMINAL in node and self._is_word_boundary(text, position):
+                match = (position, node[_TERMINAL])
+
+        return match
+
+    def replace(self, text: str) -> str:
+        if not self._trie:
+            return text
+
+        lowered_text = text.lower()
+        # Lowercasing a few characters changes their length, then compare per character
+        if len(lowered_text) != len(text):
+            lowered_text = None
+
+        parts, copied_until = [], 0
+        for candidate in self._start_pattern.finditer(text):
+            start = candidate.start()
+            if start < copied_until:
+                continue
+
+            match = self._match(text, lowered_text, start)
+            if match is None:
+                continue
+
+            end, replacement = match
+            parts.append(text[copied_until:start])
+            parts.append(replacement)
+            copied_until = end
+
+        parts.append(text[copied_until:])
+        return "".join(parts)
@@ -1,5 +1,7 @@
 import logging
 import os
+import shutil
+import tempfile
 from typing import Any
 
 from app.configurations.configurations import Configurations
@@ -11,6 +13,7 @@ from app.services.pdf_text_extractor_service.interfaces import (
 class PDFHandler:
     _configurations = Configurations
     _uploads_directory_path = _configurations.uploads_directory_path
+    _uploads_spool_threshold_bytes = _configurations.uploads_spool_threshold_bytes
 
     def __init__(
         self, pdf_file: Any, pdf_text_extractor_service: PdfTextExtractorServiceABC
@@ -19,38 +22,63 @@ class PDFHandler:
         self.pdf_file = pdf_file
         logging.info(f"Loaded PDF file: {self.pdf_file.filename}")
 
-    def _save_pdf(self):
+    def _get_stream(self):
+        stream = self.pdf_file.stream
+        stream.seek(0)
+        return stream
+
+    def _get_size(self):
+        stream = self._get_stream()
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        return size
+
+    def _spool_pdf(self):
+        """Copies the upload to a uniquely named temporary file that is deleted on close."""
         if not os.path.exists(PDFHandler._uploads_directory_path):
-            os.makedirs(PDFHandler._uploads_directory_path)
+            os.makedirs(PDFHandler._uploads_directory_path, exist_ok=True)
             logging.info(f"Created directory: {PDFHandler._uploads_directory_path}")
 
-        filename = self.pdf_file.filename
-        temp_path = os.path.join(PDFHandler._uploads_directory_path, filename)
-        self.pdf_file.save(temp_path)
-        logging.info(f"PDF saved: {temp_path}")
+        temp_file = tempfile.NamedTemporaryFile(
+            dir=PDFHandler._uploads_directory_path, prefix="upload-", suffix=".pdf"
+        )
+        shutil.copyfileobj(self._get_stream(), temp_file)
+        temp_file.flush()
+        logging.info(f"PDF spooled: {temp_file.name}")
+        return temp_file
 
-    def _delete_pdf(self):
-        filename = self.pdf_file.filename
-        temp_path = os.path.join(PDFHandler._uploads_directory_path, filename)
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-            logging.info(f"PDF deleted: {temp_path}")
+    def extract_text(self):
+        try:
+            if self._get_size() <= PDFHandler._uploads_spool_threshold_bytes:
+                return self._pdf_text_extractor_service.extract_text(
+                    self._get_stream()
+                )
 
-    def _get_path(self):
-        filename = self.pdf_file.filename
-        return os.path.join(PDFHandler._uploads_directory_path, filename)
+            with self._spool_pdf() as temp_file:
+                return self._pdf_text_extractor_service.extract_text(temp_file.name)
 
-    def extract_text(self):
-        document_filepath = self._get_path()
+        except Exception:
+            logging.error(
+                f"Failed to extracted PDF plain text content: {self.pdf_file.filename}"
+            )
+            raise
 
+    def iter_text(self):
+        """Yields the extracted text chunk by chunk as the extractor produces it."""
         try:
-            self._save_pdf()
-            return self._pdf_text_extractor_service.extract_text(document_filepath)
+            if self._get_size() <= PDFHandler._uploads_spool_threshold_bytes:
+                yield from self._pdf_text_extractor_service.iter_text(
+                    self._get_stream()
+                )
+                return
+
+            # The spooled file lives as long as the generator is being consumed
+            with self._spool_pdf() as temp_file:
+                yield from self._pdf_text_extractor_service.iter_text(temp_file.name)
 
         except Exception:
             logging.error(
-                f"Failed to extracted PDF plain text content: {document_filepath}"
+                f"Failed to extracted PDF plain text content: {self.pdf_file.filename}"
             )
             raise
-        finally:
-            self._delete_pdf()
@@ -0,0 +1,99 @@
+import logging
+import os
+from typing import Dict, Optional
+
+_SMAPS_FIELDS = (
+    "Rss",
+    "Pss",
+    "Shared_Clean",
+    "Shared_Dirty",
+    "Private_Clean",
+    "Private_Dirty",
+)
+
+
+class ProcessMemory:
+    """Reads the resident and shared memory of the current process from /proc."""
+
+    _smaps_rollup_path = "/proc/self/smaps_rollup"
+    _smaps_path = "/proc/self/smaps"
+
+    @staticmethod
+    def _parse_field(line: str):
+        name, _, value = line.partition(":")
+        if name not in _SMAPS_FIELDS:
+            return None, 0
+        # Values are reported in kB
+        return name, int(value.split()[0]) * 1024
+
+    @classmethod
+    def _summarize(cls, fields: Dict[str, int]):
+        return {
+            "rss_bytes": fields["Rss"],
+            "pss_bytes": fields["Pss"],
+            "shared_bytes": fields["Shared_Clean"] + fields["Shared_Dirty"],
+            "private_bytes": fields["Private_Clean"] + fields["Private_Dirty"],
+        }
+
+    @classmethod
+    def get_usage(cls) -> Optional[dict]:
+        """Returns the resident, proportional, shared and private process memory."""
+        if not os.path.exists(cls._smaps_rollup_path):
+            return None
+
+        fields = dict.fromkeys(_SMAPS_FIELDS, 0)
+        with open(cls._smaps_rollup_path, "r") as smaps_rollup:
+            for line in smaps_rollup:
+                name, value = cls._parse_field(line)
+                if name:
+                    fields[name] += value
+        return cls._summarize(fields)
+
+    @classmethod
+    def get_mapping_usage(cls, filepath: str) -> Optional[dict]:
+        """Returns the same figures for the memory mappings of a single file."""
+        if not os.path.exists(cls._smaps_path):
+            return None
+
+        filepath = os.path.realpath(filepath)
+        fields = dict.fromkeys(_SMAPS_FIELDS, 0)
+        in_mapping = False
+
+        with open(cls._smaps_path, "r") as smaps:
+            for line in smaps:
+                name, value = cls._parse_field(line)
+                if name:
+                    if in_mapping:
+                        fields[name] += value
+                    continue
+
+                # Mapping header lines: address perms offset dev inode [path]
+                parts = line.split(maxsplit=5)
+                if len(parts) >= 5 and "-" in parts[0]:
+                    in_mapping = len(parts) == 6 and parts[5].strip() == filepath
+
+        return cls._summarize(fields)
+
+    @staticmethod
+    def _format(usage: dict):
+        return ", ".join(
+            f"{name.replace('_bytes', '')}: {value / 1024 / 1024:.1f} MiB"
+            for name, value in usage.items()
+        )
+
+    @classmethod
+    def log_report(cls, mapped_files: Optional[Dict[str, str]] = None):
+        """Logs the process memory and that of the given memory-mapped files."""
+        usage = cls.get_usage()
+        if usage is None:
+            logging.info("Process memory report unavailable on this platform")
+            return
+
+        logging.info(f"Process {os.getpid()} memory: {cls._format(usage)}")
+        for label, filepath in (mapped_files or {}).items():
+            mapping_usage = cls.get_mapping_usage(filepath)
+            if mapping_usage is not None:
+                logging.info(
+                    f"Process {os.getpid()} {label} mapping: "
+                    f"{cls._format(mapping_usage)}"
+                )
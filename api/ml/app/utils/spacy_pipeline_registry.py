@@ -0,0 +1,76 @@
+import spacy
+from spacy.language import Language
+
+from app.models.model_registry import ModelRegistry
+
+
+class SpacyPipelineRegistry:
+    """Hands out named en_core_web_sm pipeline variants, each loaded lazily once per process.
+
+    Variants are loaded through the ModelRegistry and share one vocabulary, so every
+    call site can take the cheapest pipeline it needs:
+
+    - full: the default pipeline (tagger, parser, lemmatizer, NER)
+    - ner: named entity recognition only (NER has its own tok2vec in en_core_web_sm)
+    - senter: sentence segmentation only (dependency parser boundaries, same as full)
+    - ner_senter: NER and sentence segmentation from a single parse
+    - tokenizer: tokenizer and lexical attributes only
+    """
+
+    _instance = None
+    _model_name = "en_core_web_sm"
+    _components = [
+        "tok2vec",
+        "tagger",
+        "parser",
+        "senter",
+        "attribute_ruler",
+        "lemmatizer",
+        "ner",
+    ]
+    _variant_components = {
+        "full": None,
+        "ner": ["ner"],
+        "senter": ["tok2vec", "parser"],
+        "ner_senter": ["tok2vec", "parser", "ner"],
+        "tokenizer": [],
+    }
+    _model_registry = ModelRegistry()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(SpacyPipelineRegistry, cls).__new__(cls)
+        return cls._instance
+
+    def _get_registry_name(self, variant: str):
+        return f"spacy:{self._model_name}:{variant}"
+
+    def _load_variant(self, variant: str):
+        components = self._variant_components[variant]
+
+        if variant == "tokenizer":
+            return spacy.load(self._model_name, exclude=self._components)
+
+        # Share the string store of the tokenizer variant across every variant
+        vocab = self.get("tokenizer").vocab
+        if components is None:
+            return spacy.load(self._model_name, vocab=vocab)
+
+        excluded_components = [
+            component for component in self._components if component not in components
+        ]
+        return spacy.load(self._model_name, vocab=vocab, exclude=excluded_components)
+
+    def get(self, variant: str = "full") -> Language:
+        """Returns a pipeline variant, loading it on first use."""
+        if variant not in self._variant_components:
+            raise KeyError(f"Unknown spaCy pipeline variant: {variant}")
+
+        return self._model_registry.get(
+            self._get_registry_name(variant), lambda: self._load_variant(variant)
+        ).model
+
+    def load(self, *variants: str):
+        """Eagerly loads the given pipeline variants (all of them if none are given)."""
+        for variant in variants or self._variant_components:
+            self.get(variant)
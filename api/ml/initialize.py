@@ -1,9 +1,12 @@
 import logging
 
+from app.configurations.configurations import Configurations
+from app.factories.nli_model_factory import NLIModelFactory
 from app.models.embedding_models.glove_embedding_model import GloveEmbeddingModel
-
-# from app.models.embedding_models.sbert_embedding_model import SBERTEmbeddingModel
-from app.models.nli_models.distilbart_nli_model import DistilBartNLIModel
+from app.models.embedding_models.sbert_embedding_model import SBERTEmbeddingModel
+from app.services.evaluation_service.question_embedding_index import (
+    QuestionEmbeddingIndex,
+)
 
 logging.basicConfig(
     level=logging.INFO, format="[%(asctime)s] - [%(levelname)s] - %(message)s"
@@ -15,11 +18,26 @@ glove_model = GloveEmbeddingModel()
 glove_model.load()
 
 # SBERT model
-# sbert_model = SBERTEmbeddingModel()
-# sbert_model.load()
+sbert_model = None
+if Configurations.EmbeddingModels.embedding_model == "sbert":
+    sbert_model = SBERTEmbeddingModel()
+    sbert_model.load()
 
-# DistilBartNLIModel
-distil_bart_nli_model = DistilBartNLIModel()
-distil_bart_nli_model.load()
+# DistilBART NLI model (quantized and cached on disk when the int8 backend is selected)
+nli_model = NLIModelFactory.create_configured_model()
+nli_model.load()
 
 logging.info("Models initialized.")
+
+# Compact GloVe model: pruned to the frequent, corpus and criterion question words
+if Configurations.EmbeddingModels.glove_artifact == "compact":
+    question_tokens = QuestionEmbeddingIndex(glove_model).collect_question_tokens()
+    glove_model.build_compact_model(question_tokens)
+    glove_model.load()
+    logging.info("Compact GloVe model initialized.")
+
+# Criterion question embeddings
+QuestionEmbeddingIndex(glove_model).build()
+if sbert_model is not None:
+    QuestionEmbeddingIndex(sbert_model).build()
+logging.info("Question embeddings initialized.")
@@ -3,5 +3,7 @@ from app import create_app
 
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-app = create_app()
-app.run(debug=True, host="0.0.0.0", port=8002)
+# Spawned worker processes import this module too, only the main process serves
+if __name__ == "__main__":
+    app = create_app()
+    app.run(debug=True, host="0.0.0.0", port=8002)
@@ -0,0 +1,99 @@
+"""Benchmark the document processor chains used by the Evaluator and the GenderMapper.
+
+Compares the Doc chain (a full spaCy parse after every processor) with the text chain
+(plain text between processors, a single parse at the end when a Doc is needed).
+
+Usage (from api/ml):
+    uv run python -m scripts.benchmark_document_processors [path/to/document.txt] [--repeat N]
+"""
+
+import argparse
+import time
+
+from app.utils.document_processor.denoise_processor import DenoiseProcessor
+from app.utils.document_processor.strip_line_spaces_processor import (
+    StripLineSpacesProcessor,
+)
+from app.utils.document_processor.strip_new_lines_processor import (
+    StripNewLinesProcessor,
+)
+from app.utils.document_processor.to_lower_case_processor import ToLowerCaseProcessor
+from app.utils.spacy_pipeline_registry import SpacyPipelineRegistry
+
+SAMPLE_TEXT = (
+    "The project will conduct consultations with women and men in the\n"
+    "beneficiary communities.  Maria Santos and Juan Dela Cruz will lead the\n"
+    "gender analysis, and sex-disaggregated data will be collected quarterly. "
+) * 200
+
+spacy_nlp = SpacyPipelineRegistry().get("full")
+
+
+def create_chains():
+    return {
+        "evaluator question": (
+            lambda: StripNewLinesProcessor()
+            .set_next_processor(ToLowerCaseProcessor())
+            .set_next_processor(DenoiseProcessor()),
+            False,
+        ),
+        "evaluator sentence": (
+            lambda: StripNewLinesProcessor().set_next_processor(DenoiseProcessor()),
+            False,
+        ),
+        "gender mapper document": (
+            lambda: StripLineSpacesProcessor().set_next_processor(
+                ToLowerCaseProcessor()
+            ),
+            True,
+        ),
+        "gender mapper mapped text": (
+            lambda: StripLineSpacesProcessor(),
+            True,
+        ),
+    }
+
+
+def time_call(function, repeat: int):
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - started_at) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("document", nargs="?", help="Plain text file to process")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = SAMPLE_TEXT
+    if args.document:
+        with open(args.document, "r") as document_file:
+            text = document_file.read()
+
+    print(f"Document length: {len(text)} characters, repeat: {args.repeat}")
+
+    for name, (create_chain, needs_doc) in create_chains().items():
+        doc_seconds, doc_result = time_call(
+            lambda: create_chain().process(spacy_nlp(text)).text, args.repeat
+        )
+
+        def run_text_chain():
+            processed_text = create_chain().process_text(text)
+            # Callers that need linguistic attributes parse the result once
+            return spacy_nlp(processed_text).text if needs_doc else processed_text
+
+        text_seconds, text_result = time_call(run_text_chain, args.repeat)
+
+        print(
+            f"{name}:\n"
+            f"  doc chain:  {doc_seconds * 1000:10.1f} ms\n"
+            f"  text chain: {text_seconds * 1000:10.1f} ms"
+            f"  ({doc_seconds / text_seconds:.1f}x)\n"
+            f"  identical output: {doc_result == text_result}"
+        )
+
+
+if __name__ == "__main__":
+    main()
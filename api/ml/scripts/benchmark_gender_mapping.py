@@ -0,0 +1,129 @@
+"""Benchmark the gender mapping replacement engines on name-heavy documents.
+
+Compares the previous approach (one unescaped \\bname\\b alternation regex per gender,
+each followed by a whitespace join) with the single-pass EntityReplacer, and checks
+that both produce the same text. Outputs only differ when a name is nested in a longer
+one: the regex passes may replace the inner name first, the replacer keeps the longest.
+
+Usage (from api/ml):
+    uv run python -m scripts.benchmark_gender_mapping [--names N] [--sentences N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from app.utils.entity_replacer import EntityReplacer
+
+FIRST_NAMES = [
+    "maria", "juan", "ana", "jose", "rosa", "pedro", "elena", "carlos", "liza", "mark",
+    "grace", "paolo", "joy", "miguel", "carmen", "ramon", "teresa", "andres", "luz", "tomas",
+]
+LAST_NAMES = [
+    "santos", "reyes", "cruz", "bautista", "ocampo", "garcia", "mendoza", "torres",
+    "castillo", "villanueva", "ramos", "aquino", "navarro", "salazar", "dela cruz",
+]
+FILLER_WORDS = (
+    "the project will conduct consultations with women and men in the beneficiary "
+    "communities and collect sex disaggregated data every quarter"
+).split()
+
+
+def create_names(count: int, seed: int):
+    generator = random.Random(seed)
+    names = [
+        f"{first_name} {last_name}"
+        for first_name in FIRST_NAMES
+        for last_name in LAST_NAMES
+    ]
+    names += [
+        f"{first_name} {middle_name} {last_name}"
+        for first_name in FIRST_NAMES
+        for middle_name in FIRST_NAMES
+        for last_name in LAST_NAMES
+        if middle_name != first_name
+    ]
+    names = generator.sample(names, min(count, len(names)))
+    return names[: len(names) // 2], names[len(names) // 2 :]
+
+
+def create_document(names, sentences: int, seed: int):
+    generator = random.Random(seed)
+    parts = []
+    for _ in range(sentences):
+        words = generator.sample(FILLER_WORDS, 8)
+        words.insert(generator.randrange(len(words)), generator.choice(names))
+        parts.append(" ".join(words) + ".")
+    return "  ".join(parts)
+
+
+def regex_mapping(text: str, male_names, female_names):
+    """The previous GenderMapper implementation."""
+    male_words_pattern = r"|".join([rf"\b{word}\b" for word in male_names])
+    female_words_pattern = r"|".join([rf"\b{word}\b" for word in female_names])
+
+    male_gender_cluster_matcher = re.compile(male_words_pattern, re.IGNORECASE)
+    female_gender_cluster_matcher = re.compile(female_words_pattern, re.IGNORECASE)
+
+    if male_words_pattern:
+        text = " ".join(male_gender_cluster_matcher.sub("man", text).split())
+    if female_words_pattern:
+        text = " ".join(female_gender_cluster_matcher.sub("woman", text).split())
+    return text
+
+
+def replacer_mapping(text: str, male_names, female_names):
+    replacements = {name: "woman" for name in female_names}
+    replacements.update({name: "man" for name in male_names})
+    return " ".join(EntityReplacer(replacements).replace(text).split())
+
+
+def count_nested_names(names):
+    padded_names = [f" {name} " for name in names]
+    return sum(
+        any(name != other and name in other for other in padded_names)
+        for name in padded_names
+    )
+
+
+def time_call(function, repeat: int):
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - started_at) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--names", type=int, default=200)
+    parser.add_argument("--sentences", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    male_names, female_names = create_names(args.names, args.seed)
+    text = create_document(male_names + female_names, args.sentences, args.seed)
+    print(
+        f"Document length: {len(text)} characters, names: {args.names}, "
+        f"repeat: {args.repeat}"
+    )
+
+    regex_seconds, regex_result = time_call(
+        lambda: regex_mapping(text, male_names, female_names), args.repeat
+    )
+    replacer_seconds, replacer_result = time_call(
+        lambda: replacer_mapping(text, male_names, female_names), args.repeat
+    )
+
+    print(
+        f"  regex alternation: {regex_seconds * 1000:10.1f} ms\n"
+        f"  entity replacer:   {replacer_seconds * 1000:10.1f} ms"
+        f"  ({regex_seconds / replacer_seconds:.1f}x)\n"
+        f"  identical output: {regex_result == replacer_result}"
+        f"  (nested names: {count_nested_names(male_names + female_names)})"
+    )
+
+
+if __name__ == "__main__":
+    main()
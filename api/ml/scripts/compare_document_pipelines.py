@@ -0,0 +1,78 @@
+"""Check that the streaming and sequential document pipelines give the same sentences.
+
+Every PDF is processed by both document pipelines of the EvaluationController: the
+sequential one (extract the whole text, then gender map it) and the streaming one
+(segment and embed the text chunks as the extractor yields them). Use PDFs with
+tables, whose flattened rows are streamed as separate chunks. The first differing
+sentence of each mismatching PDF is shown and the exit status is 1 on any mismatch.
+
+Usage (from api/ml):
+    uv run python -m scripts.compare_document_pipelines path/to/pdfs [more.pdf ...]
+"""
+
+import argparse
+import sys
+
+from app.factories.embedding_model_factory import EmbeddingModelFactory
+from app.factories.pdf_text_extractor_factory import PdfTextExtractorFactory
+from app.services.evaluation_service.streaming_document_pipeline import (
+    StreamingDocumentPipeline,
+)
+from app.services.gender_mapper_service.gender_mapper import GenderMapper
+from scripts.compare_pdf_text_extractors import collect_pdf_paths
+
+
+def get_sequential_sentences(extractor, pdf_path: str):
+    return GenderMapper(text=extractor.extract_text(pdf_path)).map()
+
+
+def get_streamed_sentences(extractor, embedding_model, pdf_path: str):
+    sentences, _ = StreamingDocumentPipeline(embedding_model=embedding_model).run(
+        extractor.iter_text(pdf_path)
+    )
+    return sentences
+
+
+def find_first_difference(sequential_sentences, streamed_sentences):
+    for index, (sequential_sentence, streamed_sentence) in enumerate(
+        zip(sequential_sentences, streamed_sentences)
+    ):
+        if sequential_sentence != streamed_sentence:
+            return index
+    return min(len(sequential_sentences), len(streamed_sentences))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="+", help="PDF files or directories of PDFs")
+    args = parser.parse_args()
+
+    extractor = PdfTextExtractorFactory.create_configured_extractor()
+    embedding_model = EmbeddingModelFactory.create_configured_model()
+    mismatches = 0
+
+    for pdf_path in collect_pdf_paths(args.paths):
+        sequential_sentences = get_sequential_sentences(extractor, pdf_path)
+        streamed_sentences = get_streamed_sentences(
+            extractor, embedding_model, pdf_path
+        )
+
+        if sequential_sentences == streamed_sentences:
+            print(f"  same  {pdf_path} ({len(sequential_sentences)} sentences)")
+            continue
+
+        mismatches += 1
+        index = find_first_difference(sequential_sentences, streamed_sentences)
+        print(
+            f"  DIFF  {pdf_path} ({len(sequential_sentences)} sequential, "
+            f"{len(streamed_sentences)} streamed sentences)"
+        )
+        print(f"        sequential: {sequential_sentences[index:index + 1]}")
+        print(f"        streamed:   {streamed_sentences[index:index + 1]}")
+
+    print(f"{mismatches} PDFs with different sentences")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Compare the fp32 and int8 dynamically quantized DistilBART NLI backends.
+
+Every criterion question of every sector is used as a hypothesis. Its premise is the
+most similar sentence (GloVe cosine) of the given plain text documents, or the most
+similar other criterion question when no documents are given. Both backends run the
+same pairs with infer_batch, bypassing the NLI result cache, after a warm-up. The
+report shows the latency, the speedup, the label agreement and the score differences
+on agreeing labels.
+
+Usage (from api/ml):
+    uv run python -m scripts.compare_nli_models [documents.txt ...] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.configurations.configurations import Configurations
+from app.factories.nli_model_factory import NLIModelFactory
+from app.models.embedding_models.glove_embedding_model import GloveEmbeddingModel
+from app.services.evaluation_service.evaluator import Evaluator
+from scripts.report_compact_glove_accuracy import (
+    load_document_sentences,
+    load_questions,
+    normalize,
+)
+
+
+def create_pairs(hypotheses, premises):
+    embedding_model = GloveEmbeddingModel()
+    similarities = normalize(embedding_model.transform_many(hypotheses)) @ normalize(
+        embedding_model.transform_many(premises)
+    ).T
+    if premises is hypotheses:
+        np.fill_diagonal(similarities, -np.inf)
+
+    best_premises = similarities.argmax(axis=1)
+    return [
+        (premises[premise_index], hypothesis)
+        for hypothesis, premise_index in zip(hypotheses, best_premises)
+    ]
+
+
+def time_inference(nli_model, pairs, batch_size: int, repeat: int):
+    nli_model.infer_batch(pairs[:batch_size], batch_size=batch_size, use_cache=False)
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        results = nli_model.infer_batch(pairs, batch_size=batch_size, use_cache=False)
+    return (time.perf_counter() - started_at) / repeat, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("documents", nargs="*", help="Plain text documents")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    hypotheses = [Evaluator.process_question(question) for question in load_questions()]
+    premises = (
+        load_document_sentences(args.documents) if args.documents else hypotheses
+    )
+    pairs = create_pairs(hypotheses, premises)
+    batch_size = Configurations.Evaluation.nli_batch_size
+
+    fp32_seconds, fp32_results = time_inference(
+        NLIModelFactory.create_distilbart_model(), pairs, batch_size, args.repeat
+    )
+    int8_seconds, int8_results = time_inference(
+        NLIModelFactory.create_quantized_distilbart_model(),
+        pairs,
+        batch_size,
+        args.repeat,
+    )
+
+    agreeing = [
+        (fp32_result, int8_result)
+        for fp32_result, int8_result in zip(fp32_results, int8_results)
+        if fp32_result["label"] == int8_result["label"]
+    ]
+    score_differences = np.array(
+        [abs(fp32["score"] - int8["score"]) for fp32, int8 in agreeing]
+    )
+    labels = sorted({result["label"] for result in fp32_results + int8_results})
+
+    print(
+        f"Pairs: {len(pairs)}, batch size: {batch_size}, repeat: {args.repeat}\n"
+        f"  fp32: {fp32_seconds * 1000:10.1f} ms\n"
+        f"  int8: {int8_seconds * 1000:10.1f} ms"
+        f"  ({fp32_seconds / int8_seconds:.2f}x)\n"
+        f"Label agreement: {len(agreeing) / len(pairs):.4f}"
+    )
+    for label in labels:
+        fp32_count = sum(result["label"] == label for result in fp32_results)
+        int8_count = sum(result["label"] == label for result in int8_results)
+        print(f"  {label}: fp32 {fp32_count}, int8 {int8_count}")
+    if len(score_differences):
+        print(
+            f"Score difference (agreeing labels): mean {score_differences.mean():.5f}, "
+            f"max {score_differences.max():.5f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
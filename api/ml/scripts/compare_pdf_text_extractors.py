@@ -0,0 +1,78 @@
+"""Compare the PDF text extractor backends on a sample corpus.
+
+Reports the extraction time of each backend and how much its text differs from the
+pdfplumber reference (similarity ratio and word counts).
+
+Usage (from api/ml):
+    uv run python -m scripts.compare_pdf_text_extractors path/to/pdfs [more.pdf ...]
+"""
+
+import argparse
+import difflib
+import os
+import time
+
+from app.factories.pdf_text_extractor_factory import PdfTextExtractorFactory
+
+BACKENDS = {
+    "pdfplumber": PdfTextExtractorFactory.create_pdf_plumber_extractor,
+    "pdfium": PdfTextExtractorFactory.create_pdfium_extractor,
+    "auto": PdfTextExtractorFactory.create_auto_extractor,
+}
+
+
+def collect_pdf_paths(paths):
+    pdf_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            pdf_paths.extend(
+                os.path.join(path, filename)
+                for filename in sorted(os.listdir(path))
+                if filename.lower().endswith(".pdf")
+            )
+        else:
+            pdf_paths.append(path)
+    return pdf_paths
+
+
+def compare_texts(reference_text: str, text: str):
+    reference_words, words = reference_text.split(), text.split()
+    similarity = difflib.SequenceMatcher(None, reference_words, words, autojunk=False)
+    return similarity.ratio(), len(reference_words), len(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="+", help="PDF files or directories of PDFs")
+    args = parser.parse_args()
+
+    totals = {backend: 0.0 for backend in BACKENDS}
+
+    for pdf_path in collect_pdf_paths(args.paths):
+        print(f"{pdf_path}")
+        texts = {}
+
+        for backend, create_extractor in BACKENDS.items():
+            extractor = create_extractor()
+            started_at = time.perf_counter()
+            texts[backend] = extractor.extract_text(pdf_path)
+            seconds = time.perf_counter() - started_at
+            totals[backend] += seconds
+
+            similarity, reference_words, words = compare_texts(
+                texts["pdfplumber"], texts[backend]
+            )
+            print(
+                f"  {backend:<10} {seconds * 1000:10.1f} ms"
+                f"  words: {words:>7} (reference {reference_words:>7})"
+                f"  similarity: {similarity:.3f}"
+            )
+
+    print("Total extraction time:")
+    for backend, seconds in totals.items():
+        speedup = totals["pdfplumber"] / seconds if seconds else 0.0
+        print(f"  {backend:<10} {seconds:8.2f} s  ({speedup:.1f}x vs pdfplumber)")
+
+
+if __name__ == "__main__":
+    main()
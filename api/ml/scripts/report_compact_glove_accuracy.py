@@ -0,0 +1,144 @@
+"""Report how closely the compact GloVe artifact ranks sentences compared to the full model.
+
+Every criterion question of every sector is used as a query. The candidates are the
+sentences of the given plain text documents, or every criterion question when no
+documents are given. Candidates are ranked by cosine similarity with the full and the
+compact model, and the report shows the top-1 agreement, the top-k overlap, the
+cosine differences, the vocabulary coverage and the artifact sizes.
+
+Build the artifact first (glove_artifact = "compact" and initialize.py).
+
+Usage (from api/ml):
+    uv run python -m scripts.report_compact_glove_accuracy [documents.txt ...] [--top-k 5]
+"""
+
+import argparse
+import os
+
+import numpy as np
+from gensim.models import KeyedVectors
+
+from app.configurations.configurations import Configurations
+from app.models.embedding_models.compact_glove_vectors import CompactGloveVectors
+from app.models.embedding_models.glove_embedding_model import GloveEmbeddingModel
+from app.repositories.evaluation_criteria_repository.evaluation_criteria_repository import (
+    EvaluationCriteriaRepository,
+)
+from app.services.evaluation_criteria_service.evaluation_criteria_service import (
+    EvaluationCriteriaService,
+)
+from app.services.evaluation_service.evaluator import Evaluator
+from app.utils.spacy_pipeline_registry import SpacyPipelineRegistry
+
+MODELS_BIN_PATH = Configurations.EmbeddingModels.models_bin_path
+FULL_MODEL_FILE = os.path.join(MODELS_BIN_PATH, "glove-twitter-50.bin")
+COMPACT_MODEL_DIRECTORY = os.path.join(MODELS_BIN_PATH, "glove-twitter-50-compact")
+
+
+def collect_questions(criteria, questions):
+    for criterion in criteria:
+        questions.append(criterion["question"])
+        if sub_criteria := criterion.get("sub_criteria"):
+            collect_questions(sub_criteria, questions)
+
+
+def load_questions():
+    evaluation_criteria_service = EvaluationCriteriaService(
+        evaluation_criteria_repository=EvaluationCriteriaRepository()
+    )
+    questions = []
+    for sector in Configurations.SectorEvaluationCriterias.sector_evaluation_criteria_map:
+        try:
+            for section in evaluation_criteria_service.get_json(sector):
+                collect_questions(section["criteria"], questions)
+        except Exception as e:
+            print(f"Skipping sector {sector}: {str(e)}")
+    return list(dict.fromkeys(questions))
+
+
+def load_document_sentences(paths):
+    senter = SpacyPipelineRegistry().get("senter")
+    sentences = []
+    for path in paths:
+        with open(path, "r", errors="ignore") as document_file:
+            document = senter(" ".join(document_file.read().split()).lower())
+        sentences.extend(sentence.text for sentence in document.sents)
+    return Evaluator.preprocess_sentences(sentences)
+
+
+def normalize(embeddings):
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.where(norms > 0, norms, 1)
+
+
+def coverage(keyed_vectors, sentences):
+    tokens = [token for sentence in sentences for token in sentence.lower().split()]
+    known = sum(token in keyed_vectors.key_to_index for token in tokens)
+    return known / len(tokens) if tokens else 0.0
+
+
+def total_size(paths):
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("documents", nargs="*", help="Plain text documents")
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    full_model = KeyedVectors.load(FULL_MODEL_FILE, mmap="r")
+    compact_model = CompactGloveVectors.load(COMPACT_MODEL_DIRECTORY)
+
+    queries = [Evaluator.process_question(question) for question in load_questions()]
+    candidates = (
+        load_document_sentences(args.documents) if args.documents else queries
+    )
+    top_k = min(args.top_k, len(candidates))
+
+    similarities = {}
+    for name, keyed_vectors in (("full", full_model), ("compact", compact_model)):
+        query_embeddings = normalize(
+            GloveEmbeddingModel.average_embeddings(keyed_vectors, queries)
+        )
+        candidate_embeddings = normalize(
+            GloveEmbeddingModel.average_embeddings(keyed_vectors, candidates)
+        )
+        similarities[name] = query_embeddings @ candidate_embeddings.T
+
+    full_ranks = np.argsort(-similarities["full"], axis=1, kind="stable")[:, :top_k]
+    compact_ranks = np.argsort(-similarities["compact"], axis=1, kind="stable")[
+        :, :top_k
+    ]
+    top_1_agreement = np.mean(full_ranks[:, 0] == compact_ranks[:, 0])
+    top_k_overlap = np.mean(
+        [
+            len(set(full_row) & set(compact_row)) / top_k
+            for full_row, compact_row in zip(full_ranks, compact_ranks)
+        ]
+    )
+    cosine_differences = np.abs(similarities["full"] - similarities["compact"])
+
+    full_files = [FULL_MODEL_FILE, f"{FULL_MODEL_FILE}.vectors.npy"]
+    compact_files = [
+        os.path.join(COMPACT_MODEL_DIRECTORY, filename)
+        for filename in os.listdir(COMPACT_MODEL_DIRECTORY)
+    ]
+
+    print(
+        f"Compact model: {compact_model.metadata['vocabulary_size']} of "
+        f"{len(full_model.index_to_key)} words ({compact_model.metadata['dtype']})\n"
+        f"Artifact size: {total_size(compact_files) / 1024 / 1024:.1f} MiB "
+        f"(full: {total_size(full_files) / 1024 / 1024:.1f} MiB)\n"
+        f"Queries: {len(queries)}, candidates: {len(candidates)}\n"
+        f"Token coverage: full {coverage(full_model, candidates):.4f}, "
+        f"compact {coverage(compact_model, candidates):.4f}\n"
+        f"Top-1 agreement: {top_1_agreement:.4f}\n"
+        f"Top-{top_k} overlap: {top_k_overlap:.4f}\n"
+        f"Cosine difference: mean {cosine_differences.mean():.5f}, "
+        f"max {cosine_differences.max():.5f}"
+    )
+
+
+if __name__ == "__main__":
+    main()